@@ -4,11 +4,15 @@ from .language.source import Source
 from .validation import validate
 
 
-def graphql(schema, request='', root=None, vars=None, operation_name=None):
+def graphql(schema, request='', root=None, vars=None, operation_name=None, document_cache=None,
+            validation_cache=None, plan_cache=None):
     try:
         source = Source(request, 'GraphQL request')
-        ast = parse(source)
-        validation_errors = validate(schema, ast)
+        if document_cache is not None:
+            ast = document_cache.parse(source)
+        else:
+            ast = parse(source)
+        validation_errors = validate(schema, ast, cache=validation_cache)
         if validation_errors:
             return ExecutionResult(
                 errors=validation_errors,
@@ -20,6 +24,7 @@ def graphql(schema, request='', root=None, vars=None, operation_name=None):
             ast,
             operation_name,
             vars or {},
+            plan_cache,
         )
     except Exception as e:
         return ExecutionResult(
@@ -0,0 +1,159 @@
+import sys
+from collections import OrderedDict
+from threading import Lock
+
+from .execution.plan import ExecutionPlan
+from .language.fingerprint import document_key
+from .language.parser import parse
+from .language.source import Source
+from .language.visitor import get_child_keys
+
+__all__ = ['LRUCache', 'DocumentCache', 'ValidationCache', 'PlanCache', 'estimate_document_size']
+
+
+class LRUCache(object):
+    """A bounded, thread-safe mapping that evicts the least recently used
+    entries first.
+
+    The cache holds at most `max_size` entries and, when `max_memory` is
+    given, at most `max_memory` bytes as estimated by `get_size(value)`.
+    Hits, misses and evictions are counted."""
+
+    def __init__(self, max_size=128, max_memory=None, get_size=None):
+        assert max_size is None or max_size > 0, 'max_size must be positive.'
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.get_size = get_size or (lambda value: 0)
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = self.get_size(value) if self.max_memory is not None else 0
+        if self.max_memory is not None and size > self.max_memory:
+            return
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.memory -= entry[1]
+
+            self._entries[key] = (value, size)
+            self.memory += size
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+
+    def _evict(self):
+        entries = self._entries
+        while ((self.max_size is not None and len(entries) > self.max_size) or
+               (self.max_memory is not None and self.memory > self.max_memory)):
+            _, (_, size) = entries.popitem(last=False)
+            self.memory -= size
+            self.evictions += 1
+
+
+class DocumentCache(LRUCache):
+    """Caches parsed documents by the name and body of their source, so a
+    repeated request skips lexing and parsing entirely.
+
+    Cached documents are shared between callers and must not be mutated."""
+
+    def __init__(self, max_size=128, max_memory=None):
+        super(DocumentCache, self).__init__(max_size, max_memory, estimate_document_size)
+
+    def parse(self, source):
+        if not isinstance(source, Source):
+            source = Source(source, 'GraphQL request')
+
+        key = (source.name, source.body)
+        document = self.get(key)
+        if document is None:
+            document = parse(source)
+            self.set(key, document)
+
+        return document
+
+
+class ValidationCache(LRUCache):
+    """Caches validation errors by document, schema and rule set, so a
+    repeated request skips validation entirely.
+
+    Documents are keyed by their fingerprint and the name and body of
+    their source, so cached errors always point into an identical source.
+    Keying by the schema object means a new schema never sees results from
+    an old one; those age out.
+
+    Cached documents must not be mutated."""
+
+    def __init__(self, max_size=128):
+        super(ValidationCache, self).__init__(max_size)
+
+
+class PlanCache(LRUCache):
+    """Caches execution plans by document, schema and operation name, so a
+    repeated request reuses the fields, field definitions and literal
+    arguments its plan has collected so far. Documents are keyed by their
+    fingerprint and source, like in a ValidationCache. The key is cached on
+    the document, so with a DocumentCache too, a repeated request finds its
+    errors and plan by hash lookups alone.
+
+    Cached documents must not be mutated."""
+
+    def __init__(self, max_size=128):
+        super(PlanCache, self).__init__(max_size)
+
+    def get_plan(self, schema, document, operation_name=None):
+        key = (document_key(document), schema, operation_name or None)
+        plan = self.get(key)
+        if plan is None:
+            plan = ExecutionPlan(schema, document, operation_name)
+            self.set(key, plan)
+
+        return plan
+
+
+def estimate_document_size(document):
+    """Estimates the memory held by a document, in bytes, by summing the
+    size of its nodes, lists and locations."""
+    size = 0
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        size += sys.getsizeof(node, 64)
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+
+        if node.loc is not None:
+            size += sys.getsizeof(node.loc, 64)
+
+        for key in get_child_keys(type(node)):
+            child = getattr(node, key, None)
+            if child is not None:
+                stack.append(child)
+
+    return size
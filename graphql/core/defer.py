@@ -61,6 +61,7 @@
 # THE SOFTWARE.
 import collections
 import sys
+from collections import deque
 from graphql.core.compat import PY3
 
 __all__ = ("Deferred", "AlreadyCalledDeferred", "DeferredException",
@@ -72,7 +73,15 @@ class AlreadyCalledDeferred(Exception):
 
 
 class DeferredException(object):
-    """Allows to defer exceptions."""
+    """Allows to defer exceptions.
+
+    Set DeferredException.capture_tracebacks to False to leave out the
+    traceback of exceptions retrieved from the last caught exception, which
+    keeps the frames of failed callbacks from being held alive."""
+
+    __slots__ = ('type', 'value', 'traceback')
+
+    capture_tracebacks = True
 
     def __init__(self, type=None, value=None, traceback=None):
         """Return a new DeferredException instance.
@@ -105,7 +114,8 @@ class DeferredException(object):
             self.type = type.__class__
             self.value = type
         elif not type or not value:
-            self.type, self.value, self.traceback = sys.exc_info()
+            self.type, self.value, traceback = sys.exc_info()
+            self.traceback = traceback if self.capture_tracebacks else None
 
     if PY3:
         def raise_exception(self):
@@ -195,10 +205,11 @@ class Deferred(object):
         CALLBACK3      ERRBACK3
       """
 
+    __slots__ = ('callbacks', 'called', 'paused', '_running', 'result')
+
     def __init__(self):
         """Return a new Deferred instance."""
-        self.callbacks = []
-        self.errbacks = []
+        self.callbacks = deque()
         self.called = False
         self.paused = False
         self._running = False
@@ -245,16 +256,14 @@ class Deferred(object):
         >>> deferred.result
         'Got: catched'
         """
-        assert isinstance(callback, collections.Callable)
-        assert errback is None or isinstance(errback, collections.Callable)
-        if errback is None:
-            errback = _passthrough
+        assert callable(callback)
+        assert errback is None or callable(errback)
         self.callbacks.append(((callback,
-                                callback_args or ([]),
-                                callback_kwargs or ({})),
-                               (errback or (_passthrough),
-                                errback_args or ([]),
-                                errback_kwargs or ({}))))
+                                callback_args or (),
+                                callback_kwargs or _no_kwargs),
+                               (errback or _passthrough,
+                                errback_args or (),
+                                errback_kwargs or _no_kwargs)))
         if self.called:
             self._next()
 
@@ -363,12 +372,21 @@ class Deferred(object):
         self.called = True
 
         if isinstance(result, Deferred):
-            self.paused = True
-            return result.add_callbacks(self._continue, self._continue)
+            self._wait_for(result)
+            if result.called:
+                result._next()
+            return result
 
         self.result = result
         self._next()
 
+    def _wait_for(self, deferred):
+        """Pause processing until the given Deferred has a result, which
+        then becomes the result of this one."""
+        self.paused = True
+        resume = (_resume, (self,), _no_kwargs)
+        deferred.callbacks.append((resume, resume))
+
     def _continue(self, result):
         """Continue processing the Deferred with the given result."""
         # If the result of the deferred is another deferred, we will need to wait for
@@ -384,39 +402,77 @@ class Deferred(object):
         return result
 
     def _next(self):
-        """Process the next callback."""
+        """Process the next callback.
+
+        When this gives a Deferred waiting on it its result, that Deferred
+        is processed next, and this one after it. Chained Deferreds are
+        processed in this one loop rather than by recursion, so chains of
+        any length are processed in constant stack depth."""
         if self._running or self.paused:
             return
 
-        while self.callbacks:
-            # Get the next callback pair
-            next_pair = self.callbacks.pop(0)
-            # Continue with the errback if the last result was an exception
-            callback, args, kwargs = next_pair[isinstance(self.result,
-                                                          DeferredException)]
-
-            if callback is not _passthrough:
-                self._running = True
+        # The Deferreds being processed; each one resumes once those above
+        # it are done.
+        chain = [self]
+        while chain:
+            current = chain[-1]
+            current._running = False
+            callbacks = current.callbacks
+            while callbacks and not current.paused:
+                # Continue with the errback if the last result was an exception
+                callback, args, kwargs = callbacks.popleft()[isinstance(current.result, DeferredException)]
+                if callback is _passthrough:
+                    continue
+
+                if callback is _resume and _is_trampolined(args[0]):
+                    waiting = args[0]
+                    waiting.result = current.result
+                    waiting.paused = False
+                    if waiting.called:
+                        current._running = True
+                        chain.append(waiting)
+                        break
+                    continue
+
+                current._running = True
                 try:
-                    self.result = callback(self.result, *args, **kwargs)
-
+                    result = callback(current.result, *args, **kwargs)
                 except:
-                    self.result = DeferredException()
+                    result = DeferredException()
+                current._running = False
+
+                if isinstance(result, Exception):
+                    result = DeferredException(result)
+
+                current.result = result
+                if isinstance(result, Deferred):
+                    # If a Deferred was returned, processing of this Deferred
+                    # is paused until all callbacks of the returned Deferred
+                    # have been performed.
+                    current._wait_for(result)
+                    if result.called:
+                        if _is_trampolined(result) and not (result._running or result.paused):
+                            chain.append(result)
+                        else:
+                            result._next()
+                    break
+            else:
+                chain.pop()
+
+
+_deferred_next = getattr(Deferred._next, '__func__', Deferred._next)
+
 
-                finally:
-                    self._running = False
+def _is_trampolined(deferred):
+    """Whether the Deferred is processed by Deferred._next, which can then
+    process it inline."""
+    next_ = type(deferred)._next
+    return getattr(next_, '__func__', next_) is _deferred_next
 
-                if isinstance(self.result, Exception):
-                    self.result = DeferredException(self.result)
 
-            if isinstance(self.result, Deferred):
-                # If a Deferred was returned add this deferred as callbacks to
-                # the returned one. As a result the processing of this Deferred
-                # will be paused until all callbacks of the returned Deferred
-                # have been performed
-                self.paused = True
-                self.result.add_callbacks(self._continue, self._continue)
-                break
+def _resume(result, deferred):
+    """The callback and errback by which a Deferred waits on another one."""
+    return deferred._continue(result)
 
 
 def defer(func, *args, **kwargs):
@@ -436,7 +492,7 @@ def defer(func, *args, **kwargs):
     >>> defer(lambda: deferred) == deferred
     True
     """
-    assert isinstance(func, collections.Callable)
+    assert callable(func)
 
     try:
         result = func(*args, **kwargs)
@@ -455,6 +511,9 @@ def _passthrough(arg):
     return arg
 
 
+_no_kwargs = {}
+
+
 def succeed(result):
     d = Deferred()
     d.callback(result)
@@ -468,8 +527,7 @@ def fail(result=None):
 
 
 class _ResultCollector(Deferred):
-    objects_remaining_to_resolve = 0
-    _result = None
+    __slots__ = ('objects_remaining_to_resolve', '_result')
 
     def _schedule_callbacks(self, items, result, objects_remaining_to_resolve=None):
         self.objects_remaining_to_resolve = \
@@ -511,6 +569,8 @@ class _ResultCollector(Deferred):
 
 
 class DeferredDict(_ResultCollector):
+    __slots__ = ()
+
     def __init__(self, mapping):
         super(DeferredDict, self).__init__()
         assert isinstance(mapping, collections.Mapping)
@@ -518,6 +578,8 @@ class DeferredDict(_ResultCollector):
 
 
 class DeferredList(_ResultCollector):
+    __slots__ = ()
+
     def __init__(self, sequence):
         super(DeferredList, self).__init__()
         assert isinstance(sequence, collections.Sequence)
@@ -21,15 +21,18 @@ single level of the query. These include:
 
 from .base import ExecutionResult
 from .executor import Executor
+from .plan import ExecutionPlan
+from .sync_executor import SynchronousExecutor
 from .middlewares.sync import SynchronousExecutionMiddleware
 
 
-def execute(schema, root, ast, operation_name='', args=None):
+def execute(schema, root, ast, operation_name='', args=None, plan_cache=None):
     """
     Executes an AST synchronously. Assumes that the AST is already validated.
     """
-    e = Executor(schema, [SynchronousExecutionMiddleware()])
+    e = SynchronousExecutor(schema, plan_cache=plan_cache)
     return e.execute(ast, root, args, operation_name, validate_ast=False)
 
 
-__all__ = ['ExecutionResult', 'Executor', 'execute']
+__all__ = ['ExecutionPlan', 'ExecutionResult', 'Executor', 'SynchronousExecutionMiddleware', 'SynchronousExecutor',
+           'execute']
@@ -16,7 +16,7 @@ from ..type.introspection import (
     TypeNameMetaFieldDef,
 )
 from ..utils import type_from_ast
-from .values import get_argument_values, get_variable_values
+from .values import ArgumentValues, get_argument_values, get_variable_values
 
 Undefined = object()
 
@@ -27,29 +27,16 @@ class ExecutionContext(object):
     Namely, schema of the type system that is currently executing,
     and the fragments defined in the query document"""
 
-    def __init__(self, schema, root, document_ast, operation_name, args, request_context):
+    def __init__(self, schema, root, document_ast, operation_name, args, request_context, plan=None):
         """Constructs a ExecutionContext object from the arguments passed
         to execute, which we will pass throughout the other execution
-        methods."""
+        methods. With an ExecutionPlan, the operation and fragments are
+        taken from the plan."""
         errors = []
-        operations = {}
-        fragments = {}
-        for statement in document_ast.definitions:
-            if isinstance(statement, ast.OperationDefinition):
-                name = ''
-                if statement.name:
-                    name = statement.name.value
-                operations[name] = statement
-            elif isinstance(statement, ast.FragmentDefinition):
-                fragments[statement.name.value] = statement
-        if not operation_name and len(operations) != 1:
-            raise GraphQLError(
-                'Must provide operation name '
-                'if query contains multiple operations')
-        op_name = operation_name or next(iter(operations.keys()))
-        operation = operations.get(op_name)
-        if not operation:
-            raise GraphQLError('Unknown operation name: {}'.format(op_name))
+        if plan is None:
+            operation, fragments = get_operation_and_fragments(document_ast, operation_name)
+        else:
+            operation, fragments = plan.operation, plan.fragments
         variables = get_variable_values(schema, operation.variable_definitions or [], args)
 
         self.schema = schema
@@ -59,6 +46,69 @@ class ExecutionContext(object):
         self.variables = variables
         self.errors = errors
         self.request_context = request_context
+        self.plan = plan
+        # Field plans that depend on this request's variables, keyed by the
+        # identity of their field ASTs and their parent type.
+        self.field_plans = {}
+        self._sub_fields = {}
+        self._argument_values = {}
+
+    def get_argument_values(self, field_def, field_ast):
+        """Returns the argument values of a field as ArgumentValues, computed
+        once per request for each field AST and field definition."""
+        key = (id(field_ast), field_def)
+        args = self._argument_values.get(key)
+        if args is None:
+            args = self._argument_values[key] = ArgumentValues(get_argument_values(
+                field_def.args, field_ast.arguments, self.variables
+            ))
+        return args
+
+    def get_sub_fields(self, runtime_type, field_asts):
+        """Returns the fields that the selection sets of field_asts select on
+        runtime_type. They are collected once per request, since directive
+        variables and fragment conditions are the same for every object the
+        fields complete, such as the items of a list."""
+        key = (id(field_asts), runtime_type)
+        entry = self._sub_fields.get(key)
+        if entry is None:
+            subfield_asts = {}
+            visited_fragment_names = set()
+            for field_ast in field_asts:
+                selection_set = field_ast.selection_set
+                if selection_set:
+                    subfield_asts = collect_fields(
+                        self, runtime_type, selection_set,
+                        subfield_asts, visited_fragment_names)
+
+            # Holding on to field_asts keeps its identity from being reused.
+            entry = self._sub_fields[key] = (field_asts, subfield_asts)
+
+        return entry[1]
+
+
+def get_operation_and_fragments(document_ast, operation_name):
+    """Returns the operation to execute and the fragments of a document by
+    name, raising a GraphQLError if the operation is ambiguous or unknown."""
+    operations = {}
+    fragments = {}
+    for statement in document_ast.definitions:
+        if isinstance(statement, ast.OperationDefinition):
+            name = ''
+            if statement.name:
+                name = statement.name.value
+            operations[name] = statement
+        elif isinstance(statement, ast.FragmentDefinition):
+            fragments[statement.name.value] = statement
+    if not operation_name and len(operations) != 1:
+        raise GraphQLError(
+            'Must provide operation name '
+            'if query contains multiple operations')
+    op_name = operation_name or next(iter(operations.keys()))
+    operation = operations.get(op_name)
+    if not operation:
+        raise GraphQLError('Unknown operation name: {}'.format(op_name))
+    return operation, fragments
 
 
 class ExecutionResult(object):
@@ -11,14 +11,19 @@ from ..type import GraphQLEnumType, GraphQLInterfaceType, GraphQLList, GraphQLNo
 from ..utils import is_nullish
 from ..validation import validate
 from .base import ExecutionContext, ExecutionResult, ResolveInfo, Undefined, collect_fields, default_resolve_fn, \
-    get_argument_values, get_field_def, get_operation_root_type
+    get_field_def, get_operation_root_type
+from .plan import ExecutionPlan
 
 
 class Executor(object):
-    def __init__(self, schema, execution_middlewares=None, default_resolver=default_resolve_fn):
+    def __init__(self, schema, execution_middlewares=None, default_resolver=default_resolve_fn, document_cache=None,
+                 validation_cache=None, plan_cache=None):
         self.execution_middlewares = execution_middlewares or []
         self.default_resolve_fn = default_resolver
         self.schema = schema
+        self.document_cache = document_cache
+        self.validation_cache = validation_cache
+        self.plan_cache = plan_cache
 
     def execute(self, request='', root=None, args=None, operation_name=None, request_context=None,
                 execute_serially=False, validate_ast=True):
@@ -41,19 +46,41 @@ class Executor(object):
         return curried_execution_function()
 
     def _execute(self, request, root, args, operation_name, request_context, execute_serially, validate_ast):
+        if isinstance(request, ExecutionPlan):
+            assert request.schema is self.schema, 'The plan was compiled for another schema.'
+            assert not operation_name or (request.operation.name and request.operation.name.value == operation_name), \
+                'The plan was compiled for another operation.'
+            if validate_ast:
+                validation_errors = validate(self.schema, request.document, cache=self.validation_cache)
+                if validation_errors:
+                    return self._invalid_result(validation_errors)
+
+            return self._execute_graphql_query(
+                root or object(),
+                request.document,
+                request.operation_name,
+                args or {},
+                request_context or {},
+                execute_serially,
+                request)
+
         if not isinstance(request, ast.Document):
-            if not isinstance(request, Source):
-                request = Source(request, 'GraphQL request')
+            if self.document_cache is not None:
+                request = self.document_cache.parse(request)
+            else:
+                if not isinstance(request, Source):
+                    request = Source(request, 'GraphQL request')
 
-            request = parse(request)
+                request = parse(request)
 
         if validate_ast:
-            validation_errors = validate(self.schema, request)
+            validation_errors = validate(self.schema, request, cache=self.validation_cache)
             if validation_errors:
-                return succeed(ExecutionResult(
-                    errors=validation_errors,
-                    invalid=True,
-                ))
+                return self._invalid_result(validation_errors)
+
+        plan = None
+        if self.plan_cache is not None:
+            plan = self.plan_cache.get_plan(self.schema, request, operation_name)
 
         return self._execute_graphql_query(
             root or object(),
@@ -61,10 +88,18 @@ class Executor(object):
             operation_name,
             args or {},
             request_context or {},
-            execute_serially)
+            execute_serially,
+            plan)
+
+    def _invalid_result(self, validation_errors):
+        return succeed(ExecutionResult(
+            errors=validation_errors,
+            invalid=True,
+        ))
 
-    def _execute_graphql_query(self, root, ast, operation_name, args, request_context, execute_serially=False):
-        ctx = ExecutionContext(self.schema, root, ast, operation_name, args, request_context)
+    def _execute_graphql_query(self, root, ast, operation_name, args, request_context, execute_serially=False,
+                               plan=None):
+        ctx = ExecutionContext(self.schema, root, ast, operation_name, args, request_context, plan)
 
         return defer(self._execute_operation, ctx, root, ctx.operation, execute_serially) \
             .add_errback(
@@ -76,17 +111,24 @@ class Executor(object):
 
     def _execute_operation(self, ctx, root, operation, execute_serially):
         type = get_operation_root_type(ctx.schema, operation)
-        fields = collect_fields(ctx, type, operation.selection_set, {}, set())
+        if ctx.plan is not None:
+            fields = ctx.plan.get_field_plans(ctx, type)
+            resolve_field = self._resolve_planned_field
+        else:
+            fields = collect_fields(ctx, type, operation.selection_set, {}, set()).items()
+            resolve_field = self._resolve_field
 
         if operation.operation == 'mutation' or execute_serially:
-            return self._execute_fields_serially(ctx, type, root, fields)
+            return self._execute_fields_serially(ctx, type, root, fields, resolve_field)
 
-        return self._execute_fields(ctx, type, root, fields)
+        return self._execute_fields(ctx, type, root, fields, resolve_field)
 
-    def _execute_fields_serially(self, execution_context, parent_type, source_value, fields):
-        def execute_field_callback(results, response_name):
-            field_asts = fields[response_name]
-            result = self._resolve_field(execution_context, parent_type, source_value, field_asts)
+    def _execute_fields_serially(self, execution_context, parent_type, source_value, fields, resolve_field):
+        """Resolves the fields, given as (response name, field) pairs, one
+        after another with resolve_field(execution_context, parent_type,
+        source_value, field). A field is its field ASTs, or its FieldPlan."""
+        def execute_field_callback(results, response_name, field):
+            result = resolve_field(execution_context, parent_type, source_value, field)
             if result is Undefined:
                 return results
 
@@ -100,17 +142,18 @@ class Executor(object):
             else:
                 return collect_result(result)
 
-        def execute_field(prev_deferred, response_name):
-            return prev_deferred.add_callback(execute_field_callback, response_name)
+        def execute_field(prev_deferred, pair):
+            return prev_deferred.add_callback(execute_field_callback, *pair)
 
-        return functools.reduce(execute_field, fields.keys(), succeed({}))
+        return functools.reduce(execute_field, fields, succeed({}))
 
-    def _execute_fields(self, execution_context, parent_type, source_value, fields):
+    def _execute_fields(self, execution_context, parent_type, source_value, fields, resolve_field):
+        """Resolves the fields like _execute_fields_serially, but all at once."""
         contains_deferred = False
 
         results = {}
-        for response_name, field_asts in fields.items():
-            result = self._resolve_field(execution_context, parent_type, source_value, field_asts)
+        for response_name, field in fields:
+            result = resolve_field(execution_context, parent_type, source_value, field)
             if result is Undefined:
                 continue
 
@@ -123,6 +166,23 @@ class Executor(object):
 
         return DeferredDict(results)
 
+    def _resolve_planned_field(self, execution_context, parent_type, source, field_plan):
+        return_type = field_plan.return_type
+        info = ResolveInfo(
+            field_plan.field_name,
+            field_plan.field_asts,
+            return_type,
+            parent_type,
+            execution_context
+        )
+
+        result = self.run_resolve_fn(
+            field_plan.resolver or self.default_resolve_fn, source, field_plan.get_args(execution_context), info
+        )
+        return self.complete_value_catching_error(
+            execution_context, return_type, field_plan.field_asts, info, result
+        )
+
     def _resolve_field(self, execution_context, parent_type, source, field_asts):
         field_ast = field_asts[0]
         field_name = field_ast.name.value
@@ -135,11 +195,9 @@ class Executor(object):
         resolve_fn = field_def.resolver or self.default_resolve_fn
 
         # Build a dict of arguments from the field.arguments AST, using the variables scope to
-        # fulfill any variable references.
-        # TODO: find a way to memoize, in case this field is within a list type.
-        args = get_argument_values(
-            field_def.args, field_ast.arguments, execution_context.variables
-        )
+        # fulfill any variable references. It is computed once for every object the field is
+        # resolved on, and each resolver call gets its own copy.
+        args = execution_context.get_argument_values(field_def, field_ast).copy()
 
         # The resolve function's optional third argument is a collection of
         # information about the current execution state.
@@ -274,17 +332,13 @@ class Executor(object):
         # if hasattr(runtime_type, 'is_type_of') and not runtime_type.is_type_of(result):
         # pass
 
+        if ctx.plan is not None:
+            field_plans = ctx.plan.get_field_plans(ctx, runtime_type, field_asts)
+            return self._execute_fields(ctx, runtime_type, result, field_plans, self._resolve_planned_field)
+
         # Collect sub-fields to execute to complete this value.
-        subfield_asts = {}
-        visited_fragment_names = set()
-        for field_ast in field_asts:
-            selection_set = field_ast.selection_set
-            if selection_set:
-                subfield_asts = collect_fields(
-                    ctx, runtime_type, selection_set,
-                    subfield_asts, visited_fragment_names)
-
-        return self._execute_fields(ctx, runtime_type, result, subfield_asts)
+        subfield_asts = ctx.get_sub_fields(runtime_type, field_asts)
+        return self._execute_fields(ctx, runtime_type, result, subfield_asts.items(), self._resolve_field)
 
     def run_resolve_fn(self, resolve_fn, source, args, info):
         curried_resolve_fn = functools.partial(resolve_fn, source, args, info)
@@ -1,12 +1,14 @@
 from graphql.core.defer import Deferred
 from graphql.core.error import GraphQLError
 
+DEFERRED_RESULT_MESSAGE = 'You cannot return a Deferred from a resolver when using SynchronousExecutionMiddleware'
+
 
 class SynchronousExecutionMiddleware(object):
     def run_resolve_fn(self, resolver, original_resolver):
         result = resolver()
         if isinstance(result, Deferred):
-            raise GraphQLError('You cannot return a Deferred from a resolver when using SynchronousExecutionMiddleware')
+            raise GraphQLError(DEFERRED_RESULT_MESSAGE)
 
         return result
 
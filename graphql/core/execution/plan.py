@@ -0,0 +1,143 @@
+from threading import Lock
+
+from .base import collect_fields, get_argument_values, get_field_def, get_operation_and_fragments
+from .values import ArgumentValues
+
+__all__ = ['ExecutionPlan', 'FieldPlan']
+
+# Stands in for the field plans of a selection whose @skip or @include
+# directives depend on variables, which are collected per request.
+DYNAMIC = object()
+
+
+class ExecutionPlan(object):
+    """What executing one operation of a validated document takes, apart
+    from the request's root value and variables.
+
+    For each selection and runtime type, the plan holds the collected
+    fields as (response name, FieldPlan) pairs, compiled the first time a request meets them and
+    shared by every later request. Selections whose @skip or @include
+    directives use variables are collected again for each request.
+
+    Pass a plan to Executor.execute in place of the request, or give the
+    Executor a PlanCache. A plan passed as the request is validated like a
+    document unless validate_ast is False, and an operation_name given
+    with it must be the name of its operation. The document must not be
+    mutated."""
+
+    def __init__(self, schema, document, operation_name=None):
+        self.schema = schema
+        self.document = document
+        self.operation_name = operation_name
+        self.operation, self.fragments = get_operation_and_fragments(document, operation_name)
+        # Field plans by the identity of the field ASTs they were collected
+        # from (None for the operation) and their parent type.
+        self._field_plans = {}
+        # The identities of the field AST lists held by this plan, whose
+        # subfields it may compile.
+        self._owned = set()
+        self._lock = Lock()
+
+    def get_field_plans(self, ctx, parent_type, field_asts=None):
+        """Returns (response name, FieldPlan) pairs for the fields the
+        selection sets of field_asts select on parent_type, or for those of
+        the operation if field_asts is None."""
+        key = (field_asts if field_asts is None else id(field_asts), parent_type)
+        field_plans = self._field_plans.get(key)
+        if field_plans is None:
+            if field_asts is not None and id(field_asts) not in self._owned:
+                return self.get_request_field_plans(ctx, parent_type, field_asts)
+
+            with self._lock:
+                field_plans = self._field_plans.get(key)
+                if field_plans is None:
+                    variables = RecordingVariables()
+                    field_plans = self.compile(StaticContext(self, variables), parent_type, field_asts)
+                    if variables.used:
+                        field_plans = DYNAMIC
+                    else:
+                        self._owned.update(id(field_plan.field_asts) for _, field_plan in field_plans)
+                    self._field_plans[key] = field_plans
+
+        if field_plans is DYNAMIC:
+            return self.get_request_field_plans(ctx, parent_type, field_asts)
+
+        return field_plans
+
+    def get_request_field_plans(self, ctx, parent_type, field_asts):
+        """Returns field plans compiled with the variables of a request, and
+        kept on its ExecutionContext for the rest of the request."""
+        key = (field_asts if field_asts is None else id(field_asts), parent_type)
+        field_plans = ctx.field_plans.get(key)
+        if field_plans is None:
+            field_plans = ctx.field_plans[key] = self.compile(ctx, parent_type, field_asts)
+        return field_plans
+
+    def compile(self, ctx, parent_type, field_asts):
+        if field_asts is None:
+            selection_sets = [self.operation.selection_set]
+        else:
+            selection_sets = [field_ast.selection_set for field_ast in field_asts if field_ast.selection_set]
+
+        fields = {}
+        visited_fragment_names = set()
+        for selection_set in selection_sets:
+            fields = collect_fields(ctx, parent_type, selection_set, fields, visited_fragment_names)
+
+        field_plans = []
+        for response_name, field_asts in fields.items():
+            field_def = get_field_def(self.schema, parent_type, field_asts[0].name.value)
+            if field_def:
+                field_plans.append((response_name, FieldPlan(response_name, field_asts, field_def)))
+
+        return tuple(field_plans)
+
+
+class FieldPlan(object):
+    """A collected field of an ExecutionPlan: its field definition, its
+    resolver, and its arguments if they are all literals."""
+
+    __slots__ = ('response_name', 'field_name', 'field_asts', 'field_def', 'return_type', 'resolver', 'args')
+
+    def __init__(self, response_name, field_asts, field_def):
+        self.response_name = response_name
+        self.field_name = field_asts[0].name.value
+        self.field_asts = field_asts
+        self.field_def = field_def
+        self.return_type = field_def.type
+        self.resolver = field_def.resolver
+
+        variables = RecordingVariables()
+        args = get_argument_values(field_def.args, field_asts[0].arguments, variables)
+        self.args = None if variables.used else ArgumentValues(args)
+
+    def get_args(self, ctx):
+        """Returns a copy of the argument values of the field for a request."""
+        if self.args is not None:
+            return self.args.copy()
+        return ctx.get_argument_values(self.field_def, self.field_asts[0]).copy()
+
+
+class StaticContext(object):
+    """Stands in for an ExecutionContext while compiling a plan."""
+
+    def __init__(self, plan, variables):
+        self.schema = plan.schema
+        self.fragments = plan.fragments
+        self.variables = variables
+
+
+class RecordingVariables(dict):
+    """An empty variables mapping that records whether a variable was looked
+    up, which tells whether a value depends on the request."""
+
+    used = False
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, name):
+        self.used = True
+        return False
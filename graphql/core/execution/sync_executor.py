@@ -0,0 +1,150 @@
+import collections
+
+from ..defer import Deferred
+from ..error import GraphQLError
+from ..type import GraphQLEnumType, GraphQLInterfaceType, GraphQLList, GraphQLNonNull, GraphQLObjectType, \
+    GraphQLScalarType, GraphQLUnionType
+from ..utils import is_nullish
+from .base import ExecutionContext, ExecutionResult, Undefined, collect_fields, get_operation_root_type
+from .executor import Executor
+from .middlewares.sync import DEFERRED_RESULT_MESSAGE
+
+
+class SynchronousExecutor(Executor):
+    """An Executor for synchronous resolvers that completes values with
+    plain returns and exceptions, and never creates a Deferred.
+
+    It returns an ExecutionResult directly, with the same data and errors
+    as an Executor with a SynchronousExecutionMiddleware. Middlewares may
+    wrap resolvers with run_resolve_fn; execution_result is not used. A
+    resolver that returns a Deferred gets the same field error as with a
+    SynchronousExecutionMiddleware."""
+
+    def execute(self, request='', root=None, args=None, operation_name=None, request_context=None,
+                execute_serially=False, validate_ast=True):
+        return self._execute(request, root, args, operation_name, request_context, execute_serially, validate_ast)
+
+    def _invalid_result(self, validation_errors):
+        return ExecutionResult(
+            errors=validation_errors,
+            invalid=True,
+        )
+
+    def _execute_graphql_query(self, root, ast, operation_name, args, request_context, execute_serially=False,
+                               plan=None):
+        ctx = ExecutionContext(self.schema, root, ast, operation_name, args, request_context, plan)
+
+        try:
+            data = self._execute_operation(ctx, root, ctx.operation, execute_serially)
+        except Exception as e:
+            ctx.errors.append(e)
+            data = None
+
+        return ExecutionResult(data, ctx.errors)
+
+    def _execute_operation(self, ctx, root, operation, execute_serially):
+        # Fields run one after another either way, so mutations are
+        # executed serially without further ado.
+        type = get_operation_root_type(ctx.schema, operation)
+        if ctx.plan is not None:
+            return self._execute_fields(ctx, type, root, ctx.plan.get_field_plans(ctx, type),
+                                        self._resolve_planned_field)
+
+        fields = collect_fields(ctx, type, operation.selection_set, {}, set())
+        return self._execute_fields(ctx, type, root, fields.items(), self._resolve_field)
+
+    def _execute_fields(self, execution_context, parent_type, source_value, fields, resolve_field):
+        results = {}
+        for response_name, field in fields:
+            result = resolve_field(execution_context, parent_type, source_value, field)
+            if result is not Undefined:
+                results[response_name] = result
+
+        return results
+
+    def complete_value_catching_error(self, ctx, return_type, field_asts, info, result):
+        # If the field type is non-nullable, then it is resolved without any
+        # protection from errors.
+        if isinstance(return_type, GraphQLNonNull):
+            return self.complete_value(ctx, return_type, field_asts, info, result)
+
+        # Otherwise, error protection is applied, logging the error and
+        # resolving a null value for this field if one is encountered.
+        try:
+            return self.complete_value(ctx, return_type, field_asts, info, result)
+        except Exception as e:
+            ctx.errors.append(e)
+            return None
+
+    def complete_value(self, ctx, return_type, field_asts, info, result):
+        """Completes a resolved value like Executor.complete_value, for
+        results that are never Deferred."""
+        if isinstance(result, Exception):
+            raise GraphQLError(str(result), field_asts, result)
+
+        if isinstance(return_type, GraphQLNonNull):
+            completed = self.complete_value(
+                ctx, return_type.of_type, field_asts, info, result
+            )
+            if completed is None:
+                raise GraphQLError(
+                    'Cannot return null for non-nullable field {}.{}.'.format(info.parent_type, info.field_name),
+                    field_asts
+                )
+
+            return completed
+
+        if is_nullish(result):
+            return None
+
+        if isinstance(return_type, GraphQLList):
+            assert isinstance(result, collections.Iterable), \
+                'User Error: expected iterable, but did not find one.'
+
+            item_type = return_type.of_type
+            return [self.complete_value_catching_error(ctx, item_type, field_asts, info, item) for item in result]
+
+        if isinstance(return_type, (GraphQLScalarType, GraphQLEnumType)):
+            serialized_result = return_type.serialize(result)
+
+            if is_nullish(serialized_result):
+                return None
+
+            return serialized_result
+
+        runtime_type = None
+
+        if isinstance(return_type, GraphQLObjectType):
+            runtime_type = return_type
+
+        elif isinstance(return_type, (GraphQLInterfaceType, GraphQLUnionType)):
+            runtime_type = return_type.resolve_type(result)
+            if runtime_type and not return_type.is_possible_type(runtime_type):
+                raise GraphQLError(
+                    'Runtime Object type "{}" is not a possible type for "{}".'.format(runtime_type, return_type),
+                    field_asts
+                )
+
+        if not runtime_type:
+            return None
+
+        if ctx.plan is not None:
+            field_plans = ctx.plan.get_field_plans(ctx, runtime_type, field_asts)
+            return self._execute_fields(ctx, runtime_type, result, field_plans, self._resolve_planned_field)
+
+        subfield_asts = ctx.get_sub_fields(runtime_type, field_asts)
+        return self._execute_fields(ctx, runtime_type, result, subfield_asts.items(), self._resolve_field)
+
+    def run_resolve_fn(self, resolve_fn, source, args, info):
+        if self.execution_middlewares:
+            result = super(SynchronousExecutor, self).run_resolve_fn(resolve_fn, source, args, info)
+        else:
+            try:
+                result = resolve_fn(source, args, info)
+            except Exception as e:
+                return e
+
+        if isinstance(result, Deferred):
+            return GraphQLError(DEFERRED_RESULT_MESSAGE)
+
+        return result
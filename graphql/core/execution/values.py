@@ -13,7 +13,7 @@ from ..type import (
 )
 from ..utils import is_nullish, type_from_ast
 
-__all__ = ['get_variable_values', 'get_argument_values']
+__all__ = ['get_variable_values', 'get_argument_values', 'ArgumentValues']
 
 
 def get_variable_values(schema, definition_asts, inputs):
@@ -29,6 +29,40 @@ def get_variable_values(schema, definition_asts, inputs):
     return values
 
 
+class ArgumentValues(dict):
+    """A read-only dict of argument values, computed once and kept for
+    every call of a resolver that gets the same arguments. Each call gets
+    its own copy(), in which input objects and lists are copied too, so a
+    resolver may change its arguments without affecting other calls."""
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._nested = any(isinstance(value, (dict, list)) for value in self.values())
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Argument values are read-only.')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):
+        """Returns a mutable copy, with its input objects and lists copied."""
+        if not self._nested:
+            return dict(self) if self else {}
+        return dict((name, copy_value(value)) for name, value in self.items())
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+def copy_value(value):
+    """Returns a copy of the input objects and lists of a coerced value."""
+    if isinstance(value, dict):
+        return dict((name, copy_value(item)) for name, item in value.items())
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    return value
+
+
 def get_argument_values(arg_defs, arg_asts, variables):
     """Prepares an object map of argument values given a list of argument
     definitions and list of argument AST nodes."""
@@ -1,9 +1,79 @@
 # This is autogenerated code. DO NOT change this manually.
 # Run scripts/generate_ast.py to generate this file.
+from copy import deepcopy
 
 
 class Node(object):
-    pass
+    _kind = None
+    _fields = ()
+
+    def __eq__(self, other):
+        return nodes_equal(self, other)
+
+    def __hash__(self):
+        # Structural and location-insensitive, so equal nodes hash equally.
+        # Cached: a node must not be mutated once it has been hashed.
+        try:
+            return self._hash
+        except AttributeError:
+            return node_hash(self)
+
+
+def nodes_equal(node, other):
+    """Compares two nodes field by field, locations included, using an
+    explicit stack so deeply nested documents compare without recursion."""
+    stack = [(node, other)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+
+        if isinstance(a, Node):
+            if not isinstance(b, Node) or a._kind != b._kind or a.loc != b.loc:
+                return False
+            for name in a._fields:
+                stack.append((getattr(a, name), getattr(b, name)))
+
+        elif isinstance(a, list):
+            if not isinstance(b, list) or len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+
+        elif a != b:
+            return False
+
+    return True
+
+
+def node_hash(node):
+    """Hashes a node and its descendants that have no cached hash yet,
+    children first, using an explicit stack so deeply nested documents hash
+    without recursion."""
+    unhashed = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if hasattr(current, '_hash'):
+            continue
+
+        unhashed.append(current)
+        for name in current._fields:
+            value = getattr(current, name)
+            if isinstance(value, Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+    # Every node comes after its descendants here, whose hashes are cached
+    # by the time it is hashed.
+    for current in reversed(unhashed):
+        values = [current._kind]
+        for name in current._fields:
+            value = getattr(current, name)
+            values.append(tuple(value) if isinstance(value, list) else value)
+        current._hash = hash(tuple(values))
+
+    return node._hash
 
 
 class Definition(Node):
@@ -11,17 +81,24 @@ class Definition(Node):
 
 
 class Document(Node):
-    __slots__ = ('loc', 'definitions')
+    __slots__ = ('loc', 'definitions', '_hash', '_key')
+    _kind = 'Document'
+    _fields = ('definitions',)
 
     def __init__(self, definitions, loc=None):
         self.loc = loc
         self.definitions = definitions
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Document) and
-            self.loc == other.loc and
-            self.definitions == other.definitions
+    def __copy__(self):
+        return type(self)(
+            definitions=self.definitions,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            definitions=deepcopy(self.definitions, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -31,7 +108,9 @@ class Document(Node):
 
 
 class OperationDefinition(Definition):
-    __slots__ = ('loc', 'operation', 'name', 'variable_definitions', 'directives', 'selection_set')
+    __slots__ = ('loc', 'operation', 'name', 'variable_definitions', 'directives', 'selection_set', '_hash')
+    _kind = 'OperationDefinition'
+    _fields = ('operation', 'name', 'variable_definitions', 'directives', 'selection_set')
 
     def __init__(self, operation, selection_set, name=None, variable_definitions=None, directives=None, loc=None):
         self.loc = loc
@@ -41,15 +120,24 @@ class OperationDefinition(Definition):
         self.directives = directives
         self.selection_set = selection_set
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, OperationDefinition) and
-            self.loc == other.loc and
-            self.operation == other.operation and
-            self.name == other.name and
-            self.variable_definitions == other.variable_definitions and
-            self.directives == other.directives and
-            self.selection_set == other.selection_set
+    def __copy__(self):
+        return type(self)(
+            operation=self.operation,
+            name=self.name,
+            variable_definitions=self.variable_definitions,
+            directives=self.directives,
+            selection_set=self.selection_set,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            operation=deepcopy(self.operation, memo),
+            name=deepcopy(self.name, memo),
+            variable_definitions=deepcopy(self.variable_definitions, memo),
+            directives=deepcopy(self.directives, memo),
+            selection_set=deepcopy(self.selection_set, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -63,7 +151,9 @@ class OperationDefinition(Definition):
 
 
 class VariableDefinition(Node):
-    __slots__ = ('loc', 'variable', 'type', 'default_value')
+    __slots__ = ('loc', 'variable', 'type', 'default_value', '_hash')
+    _kind = 'VariableDefinition'
+    _fields = ('variable', 'type', 'default_value')
 
     def __init__(self, variable, type, default_value=None, loc=None):
         self.loc = loc
@@ -71,13 +161,20 @@ class VariableDefinition(Node):
         self.type = type
         self.default_value = default_value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, VariableDefinition) and
-            self.loc == other.loc and
-            self.variable == other.variable and
-            self.type == other.type and
-            self.default_value == other.default_value
+    def __copy__(self):
+        return type(self)(
+            variable=self.variable,
+            type=self.type,
+            default_value=self.default_value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            variable=deepcopy(self.variable, memo),
+            type=deepcopy(self.type, memo),
+            default_value=deepcopy(self.default_value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -89,17 +186,24 @@ class VariableDefinition(Node):
 
 
 class SelectionSet(Node):
-    __slots__ = ('loc', 'selections')
+    __slots__ = ('loc', 'selections', '_hash')
+    _kind = 'SelectionSet'
+    _fields = ('selections',)
 
     def __init__(self, selections, loc=None):
         self.loc = loc
         self.selections = selections
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, SelectionSet) and
-            self.loc == other.loc and
-            self.selections == other.selections
+    def __copy__(self):
+        return type(self)(
+            selections=self.selections,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            selections=deepcopy(self.selections, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -113,7 +217,9 @@ class Selection(Node):
 
 
 class Field(Selection):
-    __slots__ = ('loc', 'alias', 'name', 'arguments', 'directives', 'selection_set')
+    __slots__ = ('loc', 'alias', 'name', 'arguments', 'directives', 'selection_set', '_hash')
+    _kind = 'Field'
+    _fields = ('alias', 'name', 'arguments', 'directives', 'selection_set')
 
     def __init__(self, name, alias=None, arguments=None, directives=None, selection_set=None, loc=None):
         self.loc = loc
@@ -123,15 +229,24 @@ class Field(Selection):
         self.directives = directives
         self.selection_set = selection_set
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Field) and
-            self.loc == other.loc and
-            self.alias == other.alias and
-            self.name == other.name and
-            self.arguments == other.arguments and
-            self.directives == other.directives and
-            self.selection_set == other.selection_set
+    def __copy__(self):
+        return type(self)(
+            alias=self.alias,
+            name=self.name,
+            arguments=self.arguments,
+            directives=self.directives,
+            selection_set=self.selection_set,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            alias=deepcopy(self.alias, memo),
+            name=deepcopy(self.name, memo),
+            arguments=deepcopy(self.arguments, memo),
+            directives=deepcopy(self.directives, memo),
+            selection_set=deepcopy(self.selection_set, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -145,19 +260,27 @@ class Field(Selection):
 
 
 class Argument(Node):
-    __slots__ = ('loc', 'name', 'value')
+    __slots__ = ('loc', 'name', 'value', '_hash')
+    _kind = 'Argument'
+    _fields = ('name', 'value')
 
     def __init__(self, name, value, loc=None):
         self.loc = loc
         self.name = name
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Argument) and
-            self.loc == other.loc and
-            self.name == other.name and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -168,19 +291,27 @@ class Argument(Node):
 
 
 class FragmentSpread(Selection):
-    __slots__ = ('loc', 'name', 'directives')
+    __slots__ = ('loc', 'name', 'directives', '_hash')
+    _kind = 'FragmentSpread'
+    _fields = ('name', 'directives')
 
     def __init__(self, name, directives=None, loc=None):
         self.loc = loc
         self.name = name
         self.directives = directives
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, FragmentSpread) and
-            self.loc == other.loc and
-            self.name == other.name and
-            self.directives == other.directives
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            directives=self.directives,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            directives=deepcopy(self.directives, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -191,7 +322,9 @@ class FragmentSpread(Selection):
 
 
 class InlineFragment(Selection):
-    __slots__ = ('loc', 'type_condition', 'directives', 'selection_set')
+    __slots__ = ('loc', 'type_condition', 'directives', 'selection_set', '_hash')
+    _kind = 'InlineFragment'
+    _fields = ('type_condition', 'directives', 'selection_set')
 
     def __init__(self, type_condition, selection_set, directives=None, loc=None):
         self.loc = loc
@@ -199,13 +332,20 @@ class InlineFragment(Selection):
         self.directives = directives
         self.selection_set = selection_set
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, InlineFragment) and
-            self.loc == other.loc and
-            self.type_condition == other.type_condition and
-            self.directives == other.directives and
-            self.selection_set == other.selection_set
+    def __copy__(self):
+        return type(self)(
+            type_condition=self.type_condition,
+            directives=self.directives,
+            selection_set=self.selection_set,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            type_condition=deepcopy(self.type_condition, memo),
+            directives=deepcopy(self.directives, memo),
+            selection_set=deepcopy(self.selection_set, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -217,7 +357,9 @@ class InlineFragment(Selection):
 
 
 class FragmentDefinition(Definition):
-    __slots__ = ('loc', 'name', 'type_condition', 'directives', 'selection_set')
+    __slots__ = ('loc', 'name', 'type_condition', 'directives', 'selection_set', '_hash')
+    _kind = 'FragmentDefinition'
+    _fields = ('name', 'type_condition', 'directives', 'selection_set')
 
     def __init__(self, name, type_condition, selection_set, directives=None, loc=None):
         self.loc = loc
@@ -226,14 +368,22 @@ class FragmentDefinition(Definition):
         self.directives = directives
         self.selection_set = selection_set
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, FragmentDefinition) and
-            self.loc == other.loc and
-            self.name == other.name and
-            self.type_condition == other.type_condition and
-            self.directives == other.directives and
-            self.selection_set == other.selection_set
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            type_condition=self.type_condition,
+            directives=self.directives,
+            selection_set=self.selection_set,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            type_condition=deepcopy(self.type_condition, memo),
+            directives=deepcopy(self.directives, memo),
+            selection_set=deepcopy(self.selection_set, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -250,17 +400,24 @@ class Value(Node):
 
 
 class Variable(Value):
-    __slots__ = ('loc', 'name')
+    __slots__ = ('loc', 'name', '_hash')
+    _kind = 'Variable'
+    _fields = ('name',)
 
     def __init__(self, name, loc=None):
         self.loc = loc
         self.name = name
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Variable) and
-            self.loc == other.loc and
-            self.name == other.name
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -270,17 +427,24 @@ class Variable(Value):
 
 
 class IntValue(Value):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'IntValue'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, IntValue) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -290,17 +454,24 @@ class IntValue(Value):
 
 
 class FloatValue(Value):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'FloatValue'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, FloatValue) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -310,17 +481,24 @@ class FloatValue(Value):
 
 
 class StringValue(Value):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'StringValue'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, StringValue) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -330,17 +508,24 @@ class StringValue(Value):
 
 
 class BooleanValue(Value):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'BooleanValue'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, BooleanValue) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -350,17 +535,24 @@ class BooleanValue(Value):
 
 
 class EnumValue(Value):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'EnumValue'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, EnumValue) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -370,17 +562,24 @@ class EnumValue(Value):
 
 
 class ListValue(Value):
-    __slots__ = ('loc', 'values')
+    __slots__ = ('loc', 'values', '_hash')
+    _kind = 'ListValue'
+    _fields = ('values',)
 
     def __init__(self, values, loc=None):
         self.loc = loc
         self.values = values
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, ListValue) and
-            self.loc == other.loc and
-            self.values == other.values
+    def __copy__(self):
+        return type(self)(
+            values=self.values,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            values=deepcopy(self.values, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -390,17 +589,24 @@ class ListValue(Value):
 
 
 class ObjectValue(Value):
-    __slots__ = ('loc', 'fields')
+    __slots__ = ('loc', 'fields', '_hash')
+    _kind = 'ObjectValue'
+    _fields = ('fields',)
 
     def __init__(self, fields, loc=None):
         self.loc = loc
         self.fields = fields
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, ObjectValue) and
-            self.loc == other.loc and
-            self.fields == other.fields
+    def __copy__(self):
+        return type(self)(
+            fields=self.fields,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            fields=deepcopy(self.fields, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -410,19 +616,27 @@ class ObjectValue(Value):
 
 
 class ObjectField(Node):
-    __slots__ = ('loc', 'name', 'value')
+    __slots__ = ('loc', 'name', 'value', '_hash')
+    _kind = 'ObjectField'
+    _fields = ('name', 'value')
 
     def __init__(self, name, value, loc=None):
         self.loc = loc
         self.name = name
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, ObjectField) and
-            self.loc == other.loc and
-            self.name == other.name and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -433,19 +647,27 @@ class ObjectField(Node):
 
 
 class Directive(Node):
-    __slots__ = ('loc', 'name', 'arguments')
+    __slots__ = ('loc', 'name', 'arguments', '_hash')
+    _kind = 'Directive'
+    _fields = ('name', 'arguments')
 
     def __init__(self, name, arguments=None, loc=None):
         self.loc = loc
         self.name = name
         self.arguments = arguments
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Directive) and
-            self.loc == other.loc and
-            self.name == other.name and
-            self.arguments == other.arguments
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            arguments=self.arguments,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            arguments=deepcopy(self.arguments, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -460,17 +682,24 @@ class Type(Node):
 
 
 class NamedType(Type):
-    __slots__ = ('loc', 'name')
+    __slots__ = ('loc', 'name', '_hash')
+    _kind = 'NamedType'
+    _fields = ('name',)
 
     def __init__(self, name, loc=None):
         self.loc = loc
         self.name = name
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, NamedType) and
-            self.loc == other.loc and
-            self.name == other.name
+    def __copy__(self):
+        return type(self)(
+            name=self.name,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            name=deepcopy(self.name, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -480,17 +709,24 @@ class NamedType(Type):
 
 
 class ListType(Type):
-    __slots__ = ('loc', 'type')
+    __slots__ = ('loc', 'type', '_hash')
+    _kind = 'ListType'
+    _fields = ('type',)
 
     def __init__(self, type, loc=None):
         self.loc = loc
         self.type = type
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, ListType) and
-            self.loc == other.loc and
-            self.type == other.type
+    def __copy__(self):
+        return type(self)(
+            type=self.type,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            type=deepcopy(self.type, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -500,17 +736,24 @@ class ListType(Type):
 
 
 class NonNullType(Type):
-    __slots__ = ('loc', 'type')
+    __slots__ = ('loc', 'type', '_hash')
+    _kind = 'NonNullType'
+    _fields = ('type',)
 
     def __init__(self, type, loc=None):
         self.loc = loc
         self.type = type
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, NonNullType) and
-            self.loc == other.loc and
-            self.type == other.type
+    def __copy__(self):
+        return type(self)(
+            type=self.type,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            type=deepcopy(self.type, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
@@ -520,17 +763,24 @@ class NonNullType(Type):
 
 
 class Name(Node):
-    __slots__ = ('loc', 'value')
+    __slots__ = ('loc', 'value', '_hash')
+    _kind = 'Name'
+    _fields = ('value',)
 
     def __init__(self, value, loc=None):
         self.loc = loc
         self.value = value
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, Name) and
-            self.loc == other.loc and
-            self.value == other.value
+    def __copy__(self):
+        return type(self)(
+            value=self.value,
+            loc=self.loc
+        )
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            value=deepcopy(self.value, memo),
+            loc=self.loc
         )
 
     def __repr__(self):
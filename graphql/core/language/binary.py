@@ -0,0 +1,326 @@
+"""A compact binary format for parsed documents.
+
+dump(document) serializes a Document to bytes, and load(buffer) reads one
+back from any object supporting the buffer protocol, such as bytes or an
+mmap. Loading is lazy: load() returns a stub for the Document, and every
+node is decoded from the buffer only when one of its attributes is first
+read. Once decoded, a node is an ordinary instance of its ast class.
+
+The layout of each node is derived from the __slots__ of the classes in
+the generated ast module, so it follows scripts/generate_ast.py. Buffers
+written with a different node layout are rejected.
+
+Buffer layout, all integers unsigned 32-bit little-endian:
+
+    header        magic, version, layout signature, root offset, source
+                  name and body string indexes, string count, string data
+                  size, node word count
+    string table  string count + 1 offsets into the string data
+    string data   UTF-8, padded to a multiple of 4 bytes
+    nodes         words; each node is its class id, loc start, loc end and
+                  then one tagged value per field
+"""
+import struct
+import zlib
+from copy import copy, deepcopy
+from threading import Lock
+
+from . import ast
+from ..compat import str_type
+from .location import Loc
+from .source import Source
+
+__all__ = ['dump', 'load']
+
+MAGIC = b'GQLD'
+VERSION = 1
+
+HEADER = struct.Struct('<4sIIIIIIII')
+WORD = struct.Struct('<I')
+NO_INDEX = 0xFFFFFFFF
+
+# Value tags.
+NONE = 0
+NODE = 1
+LIST = 2
+STRING = 3
+FALSE = 4
+TRUE = 5
+
+NODE_CLASSES = sorted(
+    (cls for cls in vars(ast).values()
+     if isinstance(cls, type) and issubclass(cls, ast.Node) and '__slots__' in vars(cls)),
+    key=lambda cls: cls.__name__
+)
+NODE_CLASS_IDS = dict((cls, class_id) for class_id, cls in enumerate(NODE_CLASSES))
+NODE_FIELDS = [tuple(name for name in cls.__slots__ if name != 'loc' and not name.startswith('_'))
+               for cls in NODE_CLASSES]
+
+LAYOUT_SIGNATURE = zlib.crc32(';'.join(
+    cls.__name__ + ':' + ','.join(fields) for cls, fields in zip(NODE_CLASSES, NODE_FIELDS)
+).encode('ascii')) & 0xFFFFFFFF
+
+
+def dump(document, include_source=True):
+    """Serializes a document to bytes.
+
+    With include_source, the source body is stored too, so that locations
+    of loaded nodes refer to an equal Source."""
+    writer = Writer()
+    root = writer.write_node(document)
+
+    source_name = source_body = NO_INDEX
+    source = document.loc and document.loc.source
+    if include_source and source is not None:
+        source_name = writer.string_index(source.name)
+        source_body = writer.string_index(source.body)
+
+    offsets = [0]
+    data = []
+    for string in writer.strings:
+        encoded = string.encode('utf-8')
+        data.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+
+    data = b''.join(data)
+    data += b'\0' * (-len(data) % 4)
+
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION, LAYOUT_SIGNATURE, root, source_name, source_body,
+                    len(writer.strings), len(data), len(writer.words)),
+        struct.pack('<{}I'.format(len(offsets)), *offsets),
+        data,
+        struct.pack('<{}I'.format(len(writer.words)), *writer.words),
+    ])
+
+
+def load(buffer):
+    """Returns the lazily decoded Document stored in buffer.
+
+    The buffer must stay open and unchanged while any node loaded from it
+    has not been decoded yet."""
+    reader = Reader(buffer)
+    return reader.stub(reader.root)
+
+
+class Writer(object):
+    def __init__(self):
+        self.words = []
+        self.strings = []
+        self._string_indexes = {}
+
+    def string_index(self, string):
+        index = self._string_indexes.get(string)
+        if index is None:
+            index = self._string_indexes[string] = len(self.strings)
+            self.strings.append(string)
+        return index
+
+    def write_node(self, node):
+        """Writes the descendants of node and then node itself, returning the
+        offset of the node. Nodes are written from an explicit stack, so
+        documents of any depth can be written."""
+        words = self.words
+        stack = [self.start_node(node)]
+        while True:
+            node, class_id, children, values = stack[-1]
+            for child in children:
+                stack.append(self.start_node(child))
+                break
+            else:
+                stack.pop()
+                offset = len(words)
+                loc = node.loc
+                words.append(class_id)
+                if loc is None:
+                    words.extend((NO_INDEX, NO_INDEX))
+                else:
+                    words.extend((loc.start, loc.end))
+                words.extend(values)
+                if not stack:
+                    return offset
+
+                # The offset of a child completes the value holding it.
+                stack[-1][3].append(offset)
+
+    def start_node(self, node):
+        # An undecoded node is written as a node of its ast class.
+        cls = type(node)
+        class_id = NODE_CLASS_IDS[REAL_CLASSES.get(cls, cls)]
+        values = []
+        return node, class_id, self.write_values(node, class_id, values), values
+
+    def write_values(self, node, class_id, values):
+        """Appends the tagged values of the fields of node to values, and
+        yields each child node in turn, whose offset must be appended before
+        the next value is."""
+        for name in NODE_FIELDS[class_id]:
+            value = getattr(node, name)
+            if value is None:
+                values.append(NONE)
+
+            elif isinstance(value, ast.Node):
+                values.append(NODE)
+                yield value
+
+            elif isinstance(value, list):
+                values.extend((LIST, len(value)))
+                for child in value:
+                    yield child
+
+            elif isinstance(value, bool):
+                values.append(TRUE if value else FALSE)
+
+            elif isinstance(value, str_type):
+                values.extend((STRING, self.string_index(value)))
+
+            else:
+                raise TypeError('Cannot serialize AST value: {!r}'.format(value))
+
+
+class Reader(object):
+    def __init__(self, buffer):
+        if len(buffer) < HEADER.size:
+            raise ValueError('Not a serialized GraphQL document.')
+
+        (magic, version, signature, self.root, self.source_name, self.source_body,
+         string_count, data_size, word_count) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Not a serialized GraphQL document.')
+        if signature != LAYOUT_SIGNATURE:
+            raise ValueError('Serialized document was written with a different AST layout.')
+
+        self.buffer = buffer
+        self.string_offsets = HEADER.size
+        self.string_data = self.string_offsets + (string_count + 1) * WORD.size
+        self.nodes = self.string_data + data_size
+        self._strings = {}
+        self._source = None
+
+    @property
+    def source(self):
+        if self._source is None and self.source_body != NO_INDEX:
+            self._source = Source(self.string(self.source_body), self.string(self.source_name))
+        return self._source
+
+    def word(self, offset):
+        return WORD.unpack_from(self.buffer, self.nodes + offset * WORD.size)[0]
+
+    def string(self, index):
+        string = self._strings.get(index)
+        if string is None:
+            start, end = struct.unpack_from('<II', self.buffer, self.string_offsets + index * WORD.size)
+            data = self.string_data
+            string = self._strings[index] = bytes(self.buffer[data + start:data + end]).decode('utf-8')
+        return string
+
+    def stub(self, offset):
+        """Returns an undecoded node for the node record at offset."""
+        cls = NODE_CLASSES[self.word(offset)]
+        node = object.__new__(LAZY_CLASSES[cls])
+        LOC_SLOTS[cls].__set__(node, PendingNode(self, offset))
+        return node
+
+    def read_value(self, offset):
+        """Reads the value at offset, returning it and the offset of the
+        value that follows."""
+        tag = self.word(offset)
+        if tag == NODE:
+            return self.stub(self.word(offset + 1)), offset + 2
+
+        elif tag == LIST:
+            count = self.word(offset + 1)
+            offset += 2
+            return [self.stub(self.word(offset + i)) for i in range(count)], offset + count
+
+        elif tag == STRING:
+            return self.string(self.word(offset + 1)), offset + 2
+
+        elif tag == NONE:
+            return None, offset + 1
+
+        return tag == TRUE, offset + 1
+
+
+class PendingNode(object):
+    """Stored in the loc slot of a node that has not been decoded yet."""
+    __slots__ = ('reader', 'offset')
+
+    def __init__(self, reader, offset):
+        self.reader = reader
+        self.offset = offset
+
+
+_decode_lock = Lock()
+
+
+def decode(node):
+    """Decodes the fields of an undecoded node in place, and turns it into
+    an instance of its ast class."""
+    with _decode_lock:
+        lazy_cls = type(node)
+        cls = REAL_CLASSES.get(lazy_cls)
+        if cls is None:
+            # Decoded by another thread in the meantime.
+            return
+
+        loc_slot = LOC_SLOTS[cls]
+        pending = loc_slot.__get__(node, cls)
+        reader = pending.reader
+        offset = pending.offset
+
+        # The fields are filled in through the slots of the real class, and
+        # the class is switched last, so other threads keep decoding through
+        # the lazy fields, and waiting for the lock, until all are set.
+        start = reader.word(offset + 1)
+        loc = None if start == NO_INDEX else Loc(start, reader.word(offset + 2), reader.source)
+        offset += 3
+        for name, slot in FIELD_SLOTS[cls]:
+            value, offset = reader.read_value(offset)
+            slot.__set__(node, value)
+
+        loc_slot.__set__(node, loc)
+        node.__class__ = cls
+
+
+def lazy_field(name):
+    def fget(self):
+        decode(self)
+        return getattr(self, name)
+
+    def fset(self, value):
+        decode(self)
+        setattr(self, name, value)
+
+    return property(fget, fset)
+
+
+def make_lazy_class(cls):
+    """Creates a subclass of cls with the same layout, whose fields decode
+    the node on first access. It has the name of cls so visitors dispatch
+    to the same handlers."""
+    namespace = dict((name, lazy_field(name)) for name in cls.__slots__)
+    namespace['__slots__'] = ()
+
+    def __copy__(self):
+        decode(self)
+        return copy(self)
+
+    def __deepcopy__(self, memo):
+        decode(self)
+        return deepcopy(self, memo)
+
+    def __reduce_ex__(self, protocol):
+        decode(self)
+        return self.__reduce_ex__(protocol)
+
+    namespace.update(__copy__=__copy__, __deepcopy__=__deepcopy__, __reduce_ex__=__reduce_ex__)
+    return type(cls.__name__, (cls,), namespace)
+
+
+LOC_SLOTS = dict((cls, vars(cls)['loc']) for cls in NODE_CLASSES)
+FIELD_SLOTS = dict(
+    (cls, tuple((name, vars(cls)[name]) for name in NODE_FIELDS[NODE_CLASS_IDS[cls]])) for cls in NODE_CLASSES
+)
+LAZY_CLASSES = dict((cls, make_lazy_class(cls)) for cls in NODE_CLASSES)
+REAL_CLASSES = dict((lazy_cls, cls) for cls, lazy_cls in LAZY_CLASSES.items())
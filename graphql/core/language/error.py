@@ -22,14 +22,13 @@ class LanguageError(GraphQLError):
 
 def highlight_source_at_location(source, location):
     line = location.line
-    lines = source.body.splitlines()
     pad_len = len(str(line + 1))
     result = u''
     format = (u'{:>' + str(pad_len) + '}: {}\n').format
     if line >= 2:
-        result += format(line - 1, lines[line - 2])
-    result += format(line, lines[line - 1])
+        result += format(line - 1, source.get_line(line - 1))
+    result += format(line, source.get_line(line))
     result += ' ' * (1 + pad_len + location.column) + '^\n'
-    if line < len(lines):
-        result += format(line + 1, lines[line])
+    if line < len(source.line_starts):
+        result += format(line + 1, source.get_line(line + 1))
     return result
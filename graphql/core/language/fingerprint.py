@@ -0,0 +1,78 @@
+import hashlib
+import json
+from json.encoder import encode_basestring_ascii as encode_string
+
+from . import ast
+from ..compat import str_type
+
+__all__ = ['fingerprint', 'document_key']
+
+
+def fingerprint(node):
+    """Returns a stable hex digest of the structure of an AST node.
+
+    Locations are ignored, so documents that differ only in whitespace,
+    commas or comments share a fingerprint. Unlike hash(node), the digest
+    is the same across processes, which makes it suitable as a key for
+    shared caches and allowlists."""
+    parts = []
+    append = parts.append
+    # Each frame iterates over the values of a node or list, each of which
+    # is followed by a comma, and holds the text that closes it.
+    stack = [(iter((node,)), None)]
+    while stack:
+        values, closing = stack[-1]
+        for value in values:
+            if isinstance(value, ast.Node):
+                append(type(value).__name__ + '(')
+                stack.append((iter([getattr(value, name) for name in value._fields]), ')'))
+                break
+
+            elif isinstance(value, list):
+                append('[')
+                stack.append((iter(value), ']'))
+                break
+
+            elif isinstance(value, str_type):
+                append(encode_string(value))
+
+            else:
+                append(json.dumps(value))
+
+            append(',')
+
+        else:
+            stack.pop()
+            if closing is not None:
+                append(closing)
+                append(',')
+
+    # The value itself is not followed by a comma.
+    parts.pop()
+    return hashlib.sha256(''.join(parts).encode('utf-8')).hexdigest()
+
+
+def document_key(document):
+    """Returns a key that identifies a document for caches.
+
+    The key is the fingerprint of the document, together with the name and
+    body of its source if it has one, so that results holding locations are
+    only shared by documents parsed from an identical source. A document
+    edited with visit() keeps the source of the original but gets another
+    fingerprint. Unlike the document itself, the key is cheap to hash and
+    compare however deeply the document is nested.
+
+    The key is computed once and cached on the document, so a document
+    must not be mutated once it has been keyed."""
+    try:
+        return document._key
+    except AttributeError:
+        pass
+
+    key = fingerprint(document)
+    source = document.loc and document.loc.source
+    if source is not None:
+        key = (key, source.name, source.body)
+    document._key = key
+    return key
+
@@ -1,9 +1,13 @@
 import json
-from ..compat import unichr
+import re
+from array import array
+from ..compat import str_type, unichr
 from .error import LanguageError
+from .source import Source
 
 __all__ = ['Token', 'Lexer', 'TokenKind',
-           'get_token_desc', 'get_token_kind_desc']
+           'get_token_desc', 'get_token_kind_desc',
+           'read_token', 'scan_token', 'tokenize', 'TokenBuffer']
 
 
 class Token(object):
@@ -29,14 +33,15 @@ class Token(object):
 
 
 class Lexer(object):
-    def __init__(self, source):
+    def __init__(self, source, scanner=None):
         self.source = source
         self.prev_position = 0
+        self.scanner = scanner or scan_token
 
     def next_token(self, reset_position=None):
         if reset_position is None:
             reset_position = self.prev_position
-        token = read_token(self.source, reset_position)
+        token = self.scanner(self.source, reset_position)
         self.prev_position = token.end
         return token
 
@@ -424,3 +429,211 @@ def read_name(source, position):
         end += 1
 
     return Token(TokenKind.NAME, position, end, body[position:end])
+
+
+PUNCT_CHAR_TO_KIND = dict((unichr(code), kind) for code, kind in PUNCT_CODE_TO_KIND.items())
+
+# Matches ignored characters followed by one complete token. A comment is not
+# allowed to give characters back, otherwise a failed token match could
+# backtrack into the comment and lex its tail as a name.
+TOKEN_RE = re.compile(
+    u'(?:[\ufeff' + r'\t \n\r,]|\#[^\x00-\x08\x0A-\x1F]*(?![^\x00-\x08\x0A-\x1F]))*' +
+    r'''(?:
+        (?P<punct>[!$():=@\[\]{|}]) |
+        (?P<spread>\.\.\.) |
+        (?P<name>[_A-Za-z][_0-9A-Za-z]*) |
+        (?P<number>-?(?:0|[1-9][0-9]*)(?P<frac>\.[0-9]+)?(?P<exp>[eE][+-]?[0-9]+)?)(?![.0-9eE]) |
+        "(?P<string>[^"\\\x00-\x08\x0A-\x1F]*(?:\\(?:u[0-9a-fA-F]{4}|["\\/bfnrt])[^"\\\x00-\x08\x0A-\x1F]*)*)" |
+        (?P<eof>\Z)
+    )''',
+    re.VERBOSE
+)
+
+ESCAPE_RE = re.compile(r'\\(?:u([0-9a-fA-F]{4})|(.))')
+
+
+def unescape(match):
+    char_code = match.group(1)
+    if char_code is not None:
+        return unichr(int(char_code, 16))
+    return ESCAPED_CHAR_CODES[ord(match.group(2))]
+
+
+def scan_token(source, from_position):
+    """Gets the next token from the source starting at the given position.
+
+    Produces the same tokens as read_token, but matches the skipped
+    whitespace and the whole token with a single precompiled pattern
+    instead of walking the body one character at a time. Anything the
+    pattern does not accept is handed to read_token, which either lexes it
+    or raises the appropriate LanguageError."""
+    match = TOKEN_RE.match(source.body, from_position)
+    if match is None:
+        return read_token(source, from_position)
+
+    group = match.lastgroup
+    if group is None or group == 'eof':
+        # An empty group right after skipped whitespace is not always
+        # reported as the last group, so check for EOF first.
+        position = match.end()
+        return Token(TokenKind.EOF, position, position)
+
+    start, end = match.span(group)
+
+    if group == 'punct':
+        return Token(PUNCT_CHAR_TO_KIND[match.group(group)], start, end)
+
+    elif group == 'name':
+        return Token(TokenKind.NAME, start, end, match.group(group))
+
+    elif group == 'string':
+        value = match.group(group)
+        if '\\' in value:
+            value = ESCAPE_RE.sub(unescape, value)
+        return Token(TokenKind.STRING, start - 1, end + 1, value)
+
+    elif group == 'number':
+        is_float = match.start('frac') != -1 or match.start('exp') != -1
+        return Token(
+            TokenKind.FLOAT if is_float else TokenKind.INT,
+            start,
+            end,
+            match.group(group)
+        )
+
+    return Token(TokenKind.SPREAD, start, end)
+
+
+def scan_span(source, from_position):
+    """Like scan_token, but returns the kind, start and end of the token
+    as a tuple instead of building a Token with its value."""
+    match = TOKEN_RE.match(source.body, from_position)
+    if match is None:
+        token = read_token(source, from_position)
+        return token.kind, token.start, token.end
+
+    group = match.lastgroup
+    if group is None or group == 'eof':
+        # An empty group right after skipped whitespace is not always
+        # reported as the last group, so check for EOF first.
+        position = match.end()
+        return TokenKind.EOF, position, position
+
+    start, end = match.span(group)
+
+    if group == 'punct':
+        return PUNCT_CHAR_TO_KIND[source.body[start]], start, end
+
+    elif group == 'name':
+        return TokenKind.NAME, start, end
+
+    elif group == 'string':
+        return TokenKind.STRING, start - 1, end + 1
+
+    elif group == 'number':
+        if match.start('frac') != -1 or match.start('exp') != -1:
+            return TokenKind.FLOAT, start, end
+        return TokenKind.INT, start, end
+
+    return TokenKind.SPREAD, start, end
+
+
+VALUE_TOKEN_KINDS = frozenset([TokenKind.NAME, TokenKind.INT, TokenKind.FLOAT])
+
+
+def token_value(body, kind, start, end):
+    """Returns the value of a token lexed from body, or None for
+    punctuators and EOF."""
+    if kind in VALUE_TOKEN_KINDS:
+        return body[start:end]
+
+    elif kind == TokenKind.STRING:
+        value = body[start + 1:end - 1]
+        if '\\' in value:
+            value = ESCAPE_RE.sub(unescape, value)
+        return value
+
+
+class TokenBuffer(object):
+    """A compact, structure-of-arrays stream of the tokens of a source.
+
+    Kinds and offsets are stored in arrays instead of one Token object per
+    token; values are sliced from the source body only when asked for."""
+    __slots__ = ('source', 'kinds', 'starts', 'ends')
+
+    def __init__(self, source, kinds, starts, ends):
+        self.source = source
+        self.kinds = kinds
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        kind = self.kinds[index]
+        start = self.starts[index]
+        end = self.ends[index]
+        return Token(kind, start, end, token_value(self.source.body, kind, start, end))
+
+    def value(self, index):
+        return token_value(self.source.body, self.kinds[index], self.starts[index], self.ends[index])
+
+
+def tokenize(source):
+    """Lexes the whole source into a TokenBuffer, ending with the EOF token.
+
+    Raises the LanguageError of the first invalid token."""
+    if isinstance(source, str_type):
+        source = Source(source)
+    kinds = array('B')
+    starts = array('i')
+    ends = array('i')
+    append_kind = kinds.append
+    append_start = starts.append
+    append_end = ends.append
+
+    position = 0
+    while True:
+        kind, start, position = scan_span(source, position)
+        append_kind(kind)
+        append_start(start)
+        append_end(position)
+        if kind == TokenKind.EOF:
+            return TokenBuffer(source, kinds, starts, ends)
+
+
+class TokenBufferCursor(object):
+    """Reads a TokenBuffer through the Lexer interface.
+
+    next_token() moves to the following token and returns the cursor itself,
+    which exposes the kind, start, end and value of the current token. The
+    cursor is reused for every token, so read what you need from a token
+    before advancing."""
+    __slots__ = ('buffer', 'index', 'kind', 'start', 'end')
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.index = -1
+        self.kind = None
+        self.start = 0
+        self.end = 0
+
+    @property
+    def source(self):
+        return self.buffer.source
+
+    @property
+    def value(self):
+        return token_value(self.buffer.source.body, self.kind, self.start, self.end)
+
+    def next_token(self, reset_position=None):
+        buffer = self.buffer
+        index = self.index
+        if self.kind != TokenKind.EOF:
+            index += 1
+            self.index = index
+        self.kind = buffer.kinds[index]
+        self.start = buffer.starts[index]
+        self.end = buffer.ends[index]
+        return self
@@ -1,16 +1,65 @@
+import warnings
 from collections import namedtuple
 
-__all__ = ['get_location', 'SourceLocation']
+from ..compat import str_type
+
+__all__ = ['get_location', 'Loc', 'SourceLocation']
 
 SourceLocation = namedtuple('SourceLocation', 'line column')
 
 
+class Loc(namedtuple('Loc', 'start end source')):
+    """The span of source text an AST node was parsed from.
+
+    `source` is a reference to the Source shared by every node of a
+    document, or None when parsing with no_source.
+
+    Dict-style access (`loc['start']`) and comparison with location dicts
+    are kept for compatibility with the dicts used before, and will be
+    removed in the next release."""
+    __slots__ = ()
+
+    def __new__(cls, start, end, source=None):
+        return super(Loc, cls).__new__(cls, start, end, source)
+
+    def __getitem__(self, key):
+        if isinstance(key, str_type):
+            warnings.warn(
+                'Dict-style access to AST locations is deprecated, use loc.{} instead.'.format(key),
+                DeprecationWarning,
+                stacklevel=2
+            )
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return super(Loc, self).__getitem__(key)
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return other == self._as_dict()
+        return (
+            isinstance(other, Loc) and
+            self.start == other.start and
+            self.end == other.end and
+            self.source == other.source
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.start, self.end))
+
+    def __repr__(self):
+        return 'Loc(start={self.start!r}, end={self.end!r})'.format(self=self)
+
+    def _as_dict(self):
+        if self.source is None:
+            return {'start': self.start, 'end': self.end}
+        return {'start': self.start, 'end': self.end, 'source': self.source}
+
+
 def get_location(source, position):
-    lines = source.body[:position].splitlines()
-    if lines:
-        line = len(lines)
-        column = len(lines[-1]) + 1
-    else:
-        line = 1
-        column = 1
+    line = source.line_of(position)
+    column = position - source.line_starts[line - 1] + 1
     return SourceLocation(line, column)
@@ -1,15 +1,29 @@
 from . import ast
 from ..compat import str_type
 from .error import LanguageError
-from .lexer import Lexer, TokenKind, get_token_desc, get_token_kind_desc
+from .lexer import (Lexer, TokenBuffer, TokenBufferCursor, TokenKind,
+                    get_token_desc, get_token_kind_desc, tokenize)
+from .location import Loc
 from .source import Source
 
 __all__ = ['parse']
 
 
 def parse(source, **kwargs):
-    """Given a GraphQL source, parses it into a Document."""
-    options = {'no_location': False, 'no_source': False}
+    """Given a GraphQL source, parses it into a Document.
+
+    With token_buffer=True, or when given a TokenBuffer, the whole source
+    is tokenized up front into a compact buffer and the parser reads from
+    it without allocating a Token per token. In that mode a lexical error
+    anywhere in the source is reported before any syntax error.
+
+    With iterative=True, selection sets, values and types are parsed with
+    an explicit stack instead of recursion, so nesting is not limited by
+    the Python recursion limit. max_depth then bounds how deeply each of
+    them may nest, raising a LanguageError as soon as it is exceeded;
+    giving a max_depth implies iterative=True."""
+    options = {'no_location': False, 'no_source': False, 'token_buffer': False,
+               'iterative': False, 'max_depth': None}
     options.update(kwargs)
     source_obj = source
     if isinstance(source, str_type):
@@ -20,9 +34,18 @@ def parse(source, **kwargs):
 
 class Parser(object):
     def __init__(self, source, options):
-        self.lexer = Lexer(source)
+        if isinstance(source, TokenBuffer):
+            self.lexer = TokenBufferCursor(source)
+            source = source.source
+        elif options.get('token_buffer'):
+            self.lexer = TokenBufferCursor(tokenize(source))
+        else:
+            self.lexer = Lexer(source)
         self.source = source
         self.options = options
+        self.loc_source = None if options['no_source'] else source
+        self.max_depth = options['max_depth']
+        self.iterative = options['iterative'] or self.max_depth is not None
         self.prev_end = 0
         self.token = self.lexer.next_token()
 
@@ -32,16 +55,7 @@ def loc(parser, start):
     the source that created a given parsed object."""
     if parser.options['no_location']:
         return None
-    if parser.options['no_source']:
-        return {
-            'start': start,
-            'end': parser.prev_end
-        }
-    return {
-        'start': start,
-        'end': parser.prev_end,
-        'source': parser.source
-    }
+    return Loc(start, parser.prev_end, parser.loc_source)
 
 
 def advance(parser):
@@ -67,9 +81,13 @@ def skip(parser, kind):
 
 
 def expect(parser, kind):
-    """If the next token is of the given kind, return that token after
-    advancing the parser. Otherwise, do not change the parser state and
-    return False."""
+    """If the next token is of the given kind, advance the parser past it
+    and return it. Otherwise, raise a LanguageError without changing the
+    parser state.
+
+    When parsing from a token buffer, the returned token is the shared
+    cursor, which has already moved on to the following token, so callers
+    must read what they need from parser.token before calling this."""
     token = parser.token
     if token.kind == kind:
         advance(parser)
@@ -85,9 +103,10 @@ def expect(parser, kind):
 
 
 def expect_keyword(parser, value):
-    """If the next token is a keyword with the given value, return that
-    token after advancing the parser. Otherwise, do not change the parser
-    state and return False."""
+    """If the next token is a keyword with the given value, advance the
+    parser past it and return it. Otherwise, raise a LanguageError without
+    changing the parser state. As with expect(), the returned token has
+    already moved on when parsing from a token buffer."""
     token = parser.token
     if token.kind == TokenKind.NAME and token.value == value:
         advance(parser)
@@ -136,10 +155,13 @@ def many(parser, open_kind, parse_fn, close_kind):
 
 def parse_name(parser):
     """Converts a name lex token into a name parse node."""
-    token = expect(parser, TokenKind.NAME)
+    token = parser.token
+    start = token.start
+    value = token.value
+    expect(parser, TokenKind.NAME)
     return ast.Name(
-        value=token.value,
-        loc=loc(parser, token.start)
+        value=value,
+        loc=loc(parser, start)
     )
 
 
@@ -181,8 +203,8 @@ def parse_operation_definition(parser):
             selection_set=parse_selection_set(parser),
             loc=loc(parser, start)
         )
-    operation_token = expect(parser, TokenKind.NAME)
-    operation = operation_token.value
+    operation = parser.token.value
+    expect(parser, TokenKind.NAME)
     return ast.OperationDefinition(
         operation=operation,
         name=parse_name(parser),
@@ -230,6 +252,8 @@ def parse_variable(parser):
 
 
 def parse_selection_set(parser):
+    if parser.iterative:
+        return parse_selection_set_iteratively(parser)
     start = parser.token.start
     return ast.SelectionSet(
         selections=many(parser, TokenKind.BRACE_L, parse_selection, TokenKind.BRACE_R),
@@ -338,31 +362,39 @@ def parse_const_value(parser):
 
 def parse_value(parser, is_const):
     token = parser.token
-    if token.kind == TokenKind.BRACKET_L:
+    kind = token.kind
+    start = token.start
+    if kind == TokenKind.BRACKET_L:
         return parse_array(parser, is_const)
-    elif token.kind == TokenKind.BRACE_L:
+    elif kind == TokenKind.BRACE_L:
         return parse_object(parser, is_const)
-    elif token.kind == TokenKind.INT:
+    elif kind == TokenKind.INT:
+        value = token.value
         advance(parser)
-        return ast.IntValue(value=token.value, loc=loc(parser, token.start))
-    elif token.kind == TokenKind.FLOAT:
+        return ast.IntValue(value=value, loc=loc(parser, start))
+    elif kind == TokenKind.FLOAT:
+        value = token.value
         advance(parser)
-        return ast.FloatValue(value=token.value, loc=loc(parser, token.start))
-    elif token.kind == TokenKind.STRING:
+        return ast.FloatValue(value=value, loc=loc(parser, start))
+    elif kind == TokenKind.STRING:
+        value = token.value
         advance(parser)
-        return ast.StringValue(value=token.value, loc=loc(parser, token.start))
-    elif token.kind == TokenKind.NAME:
+        return ast.StringValue(value=value, loc=loc(parser, start))
+    elif kind == TokenKind.NAME:
+        value = token.value
         advance(parser)
-        if token.value in ('true', 'false'):
-            return ast.BooleanValue(value=token.value == 'true', loc=loc(parser, token.start))
-        return ast.EnumValue(value=token.value, loc=loc(parser, token.start))
-    elif token.kind == TokenKind.DOLLAR:
+        if value in ('true', 'false'):
+            return ast.BooleanValue(value=value == 'true', loc=loc(parser, start))
+        return ast.EnumValue(value=value, loc=loc(parser, start))
+    elif kind == TokenKind.DOLLAR:
         if not is_const:
             return parse_variable(parser)
     raise unexpected(parser)
 
 
 def parse_array(parser, is_const):
+    if parser.iterative:
+        return parse_value_iteratively(parser, is_const)
     start = parser.token.start
     if is_const:
         item = parse_const_value
@@ -377,6 +409,8 @@ def parse_array(parser, is_const):
 
 
 def parse_object(parser, is_const):
+    if parser.iterative:
+        return parse_value_iteratively(parser, is_const)
     start = parser.token.start
     expect(parser, TokenKind.BRACE_L)
     fields = []
@@ -421,6 +455,8 @@ def parse_directive(parser):
 def parse_type(parser):
     """Handles the 'Type': TypeName, ListType, and NonNullType
     parsing rules."""
+    if parser.iterative:
+        return parse_type_iteratively(parser)
     start = parser.token.start
     type = None
     if skip(parser, TokenKind.BRACKET_L):
@@ -440,3 +476,175 @@ def parse_named_type(parser):
         name=parse_name(parser),
         loc=loc(parser, start),
     )
+
+
+# Explicit-stack versions of the rules above that nest. They build the same
+# nodes, in the same order, without recursing once per nesting level.
+
+def check_depth(parser, depth):
+    """Raises a LanguageError at the current token if opening another
+    nesting level would exceed the parser's max_depth."""
+    max_depth = parser.max_depth
+    if max_depth is not None and depth >= max_depth:
+        raise LanguageError(
+            parser.source,
+            parser.token.start,
+            u'Exceeded maximum nesting depth of {}'.format(max_depth)
+        )
+
+
+def parse_selection_set_iteratively(parser):
+    # Each frame holds an enclosing selection set being parsed, and the
+    # selection that owns the nested set: a Field as (start, alias, name,
+    # arguments, directives) or an InlineFragment as (start, type_condition,
+    # directives).
+    frames = []
+    check_depth(parser, 0)
+    start = parser.token.start
+    expect(parser, TokenKind.BRACE_L)
+    selections = []
+    owner = None
+
+    while True:
+        if selections and skip(parser, TokenKind.BRACE_R):
+            selection_set = ast.SelectionSet(
+                selections=selections,
+                loc=loc(parser, start)
+            )
+            if not frames:
+                return selection_set
+            if len(owner) == 5:
+                selection = ast.Field(
+                    alias=owner[1],
+                    name=owner[2],
+                    arguments=owner[3],
+                    directives=owner[4],
+                    selection_set=selection_set,
+                    loc=loc(parser, owner[0])
+                )
+            else:
+                selection = ast.InlineFragment(
+                    type_condition=owner[1],
+                    directives=owner[2],
+                    selection_set=selection_set,
+                    loc=loc(parser, owner[0])
+                )
+            start, selections, owner = frames.pop()
+            selections.append(selection)
+            continue
+
+        selection_start = parser.token.start
+        if peek(parser, TokenKind.SPREAD):
+            advance(parser)
+            if parser.token.value != 'on':
+                selections.append(ast.FragmentSpread(
+                    name=parse_name(parser),
+                    directives=parse_directives(parser),
+                    loc=loc(parser, selection_start)
+                ))
+                continue
+            advance(parser)
+            nested_owner = (selection_start, parse_named_type(parser), parse_directives(parser))
+        else:
+            name_or_alias = parse_name(parser)
+            if skip(parser, TokenKind.COLON):
+                alias = name_or_alias
+                name = parse_name(parser)
+            else:
+                alias = None
+                name = name_or_alias
+            arguments = parse_arguments(parser)
+            directives = parse_directives(parser)
+            if not peek(parser, TokenKind.BRACE_L):
+                selections.append(ast.Field(
+                    alias=alias,
+                    name=name,
+                    arguments=arguments,
+                    directives=directives,
+                    selection_set=None,
+                    loc=loc(parser, selection_start)
+                ))
+                continue
+            nested_owner = (selection_start, alias, name, arguments, directives)
+
+        check_depth(parser, len(frames) + 1)
+        frames.append((start, selections, owner))
+        start = parser.token.start
+        expect(parser, TokenKind.BRACE_L)
+        selections = []
+        owner = nested_owner
+
+
+class ValueFrame(object):
+    """A list or object value whose items are being parsed."""
+    __slots__ = ('is_list', 'start', 'items', 'field_start', 'field_name')
+
+    def __init__(self, is_list, start):
+        self.is_list = is_list
+        self.start = start
+        self.items = []
+        self.field_start = None
+        self.field_name = None
+
+
+def parse_value_iteratively(parser, is_const):
+    frames = []
+    while True:
+        value = None
+        if frames:
+            frame = frames[-1]
+            if frame.is_list:
+                if skip(parser, TokenKind.BRACKET_R):
+                    frames.pop()
+                    value = ast.ListValue(values=frame.items, loc=loc(parser, frame.start))
+            elif skip(parser, TokenKind.BRACE_R):
+                frames.pop()
+                value = ast.ObjectValue(fields=frame.items, loc=loc(parser, frame.start))
+            else:
+                frame.field_start = parser.token.start
+                frame.field_name = parse_name(parser)
+                expect(parser, TokenKind.COLON)
+
+        if value is None:
+            kind = parser.token.kind
+            if kind == TokenKind.BRACKET_L or kind == TokenKind.BRACE_L:
+                check_depth(parser, len(frames))
+                frames.append(ValueFrame(kind == TokenKind.BRACKET_L, parser.token.start))
+                advance(parser)
+                continue
+            value = parse_value(parser, is_const)
+
+        if not frames:
+            return value
+
+        frame = frames[-1]
+        if frame.is_list:
+            frame.items.append(value)
+        else:
+            frame.items.append(ast.ObjectField(
+                name=frame.field_name,
+                value=value,
+                loc=loc(parser, frame.field_start)
+            ))
+
+
+def parse_type_iteratively(parser):
+    list_starts = []
+    while peek(parser, TokenKind.BRACKET_L):
+        check_depth(parser, len(list_starts))
+        list_starts.append(parser.token.start)
+        advance(parser)
+
+    start = parser.token.start
+    type = parse_named_type(parser)
+    if skip(parser, TokenKind.BANG):
+        type = ast.NonNullType(type=type, loc=loc(parser, start))
+
+    while list_starts:
+        start = list_starts.pop()
+        expect(parser, TokenKind.BRACKET_R)
+        type = ast.ListType(type=type, loc=loc(parser, start))
+        if skip(parser, TokenKind.BANG):
+            type = ast.NonNullType(type=type, loc=loc(parser, start))
+
+    return type
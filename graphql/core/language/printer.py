@@ -1,14 +1,266 @@
 import json
-from .visitor import Visitor, visit
+from .visitor import Visitor
 
 __all__ = ['print_ast']
 
 
-def print_ast(ast):
-    return visit(ast, PrintingVisitor())
+# How many nodes deep the printer writes by recursion. Subtrees below that
+# are written afterwards, starting again from the top of the stack.
+MAX_DEPTH = 100
+
+
+def print_ast(ast, compact=False):
+    """Returns the source text of an AST.
+
+    With compact, the text is minified and canonical: insignificant
+    whitespace is left out, and arguments and input object fields are
+    sorted by name, so documents that differ only in those print the
+    same. This suits cache keys rather than display."""
+    return Printer(compact).print_node(ast)
+
+
+class Printer(object):
+    """Prints an AST by appending its text to a single list of parts."""
+
+    __slots__ = ('parts', 'compact', 'comma', 'colon', 'gap', 'depth', 'deferred')
+
+    def __init__(self, compact=False):
+        self.parts = []
+        self.compact = compact
+        self.comma = ',' if compact else ', '
+        self.colon = ':' if compact else ': '
+        self.gap = '' if compact else ' '
+        self.depth = 0
+        # (parts, index, node, indent) of the subtrees left to write.
+        self.deferred = []
+
+    def print_node(self, node, indent=''):
+        """Returns the text of node.
+
+        Subtrees more than MAX_DEPTH nodes below the one being written are
+        left out at first, and each is then written into its own list of
+        parts, so documents of any depth print without deep recursion."""
+        parts = self.parts = []
+        self.write(node, indent)
+
+        written = []
+        deferred = self.deferred
+        while deferred:
+            outer, index, node, indent = deferred.pop()
+            self.parts = []
+            self.write(node, indent)
+            written.append((outer, index, self.parts))
+
+        # Every subtree is written after the one holding it, so in reverse
+        # order each is joined before the text it goes into.
+        for outer, index, inner in reversed(written):
+            outer[index] = ''.join(inner)
+
+        return ''.join(parts)
+
+    def write(self, node, indent):
+        writer = WRITERS.get(type(node).__name__)
+        if writer is None:
+            raise AssertionError('Invalid AST Node: ' + repr(node))
+
+        depth = self.depth
+        if depth == MAX_DEPTH:
+            self.deferred.append((self.parts, len(self.parts), node, indent))
+            self.parts.append('')
+            return
+
+        self.depth = depth + 1
+        writer(self, node, indent)
+        self.depth = depth
+
+    def write_list(self, nodes, separator, indent):
+        first = True
+        for node in nodes:
+            if not first:
+                self.parts.append(separator)
+            first = False
+            self.write(node, indent)
+
+    def write_arguments(self, arguments, indent):
+        if arguments:
+            if self.compact:
+                arguments = sorted(arguments, key=argument_name)
+            self.parts.append('(')
+            self.write_list(arguments, self.comma, indent)
+            self.parts.append(')')
+
+    def write_directives(self, directives, indent):
+        for directive in directives or ():
+            self.parts.append(self.gap)
+            self.write(directive, indent)
+
+    def write_selection_set(self, selection_set, indent):
+        if selection_set and selection_set.selections:
+            self.parts.append(self.gap)
+            self.write(selection_set, indent)
+
+    def write_Name(self, node, indent):
+        self.parts.append(node.value)
+
+    def write_Variable(self, node, indent):
+        self.parts.append('$')
+        self.write(node.name, indent)
+
+    def write_Document(self, node, indent):
+        parts = self.parts
+        if self.compact:
+            for definition in node.definitions:
+                if parts and not parts[-1].endswith('}'):
+                    parts.append(' ')
+                self.write(definition, indent)
+        else:
+            self.write_list(node.definitions, '\n\n', indent)
+            parts.append('\n')
+
+    def write_OperationDefinition(self, node, indent):
+        if not node.name:
+            self.write(node.selection_set, indent)
+            return
+
+        parts = self.parts
+        parts.append(node.operation)
+        parts.append(' ')
+        self.write(node.name, indent)
+        if node.variable_definitions:
+            parts.append('(')
+            self.write_list(node.variable_definitions, self.comma, indent)
+            parts.append(')')
+        self.write_directives(node.directives, indent)
+        self.write_selection_set(node.selection_set, indent)
+
+    def write_VariableDefinition(self, node, indent):
+        self.write(node.variable, indent)
+        self.parts.append(self.colon)
+        self.write(node.type, indent)
+        if node.default_value:
+            self.parts.append(' = ' if not self.compact else '=')
+            self.write(node.default_value, indent)
+
+    def write_SelectionSet(self, node, indent):
+        parts = self.parts
+        if not node.selections:
+            return
+
+        if self.compact:
+            parts.append('{')
+            self.write_list(node.selections, ' ', indent)
+            parts.append('}')
+            return
+
+        inner = indent + '  '
+        parts.append('{')
+        for selection in node.selections:
+            parts.append('\n' + inner)
+            self.write(selection, inner)
+        parts.append('\n' + indent + '}')
+
+    def write_Field(self, node, indent):
+        if node.alias:
+            self.write(node.alias, indent)
+            self.parts.append(self.colon)
+        self.write(node.name, indent)
+        self.write_arguments(node.arguments, indent)
+        self.write_directives(node.directives, indent)
+        self.write_selection_set(node.selection_set, indent)
+
+    def write_Argument(self, node, indent):
+        self.write(node.name, indent)
+        self.parts.append(self.colon)
+        self.write(node.value, indent)
+
+    # Fragments
+
+    def write_FragmentSpread(self, node, indent):
+        self.parts.append('...')
+        self.write(node.name, indent)
+        self.write_directives(node.directives, indent)
+
+    def write_InlineFragment(self, node, indent):
+        self.parts.append('...on ' if self.compact else '... on ')
+        self.write(node.type_condition, indent)
+        self.write_directives(node.directives, indent)
+        self.write_selection_set(node.selection_set, indent)
+
+    def write_FragmentDefinition(self, node, indent):
+        self.parts.append('fragment ')
+        self.write(node.name, indent)
+        self.parts.append(' on ')
+        self.write(node.type_condition, indent)
+        self.write_directives(node.directives, indent)
+        self.write_selection_set(node.selection_set, indent)
+
+    # Value
+
+    def write_IntValue(self, node, indent):
+        self.parts.append(node.value)
+
+    write_FloatValue = write_IntValue
+    write_EnumValue = write_IntValue
+
+    def write_StringValue(self, node, indent):
+        self.parts.append(json.dumps(node.value))
+
+    write_BooleanValue = write_StringValue
+
+    def write_ListValue(self, node, indent):
+        self.parts.append('[')
+        self.write_list(node.values or (), self.comma, indent)
+        self.parts.append(']')
+
+    def write_ObjectValue(self, node, indent):
+        fields = node.fields or ()
+        if self.compact:
+            fields = sorted(fields, key=argument_name)
+        self.parts.append('{')
+        self.write_list(fields, self.comma, indent)
+        self.parts.append('}')
+
+    def write_ObjectField(self, node, indent):
+        self.write(node.name, indent)
+        self.parts.append(self.colon)
+        self.write(node.value, indent)
+
+    # Directive
+
+    def write_Directive(self, node, indent):
+        self.parts.append('@')
+        self.write(node.name, indent)
+        self.write_arguments(node.arguments, indent)
+
+    # Type
+
+    def write_NamedType(self, node, indent):
+        self.write(node.name, indent)
+
+    def write_ListType(self, node, indent):
+        self.parts.append('[')
+        self.write(node.type, indent)
+        self.parts.append(']')
+
+    def write_NonNullType(self, node, indent):
+        self.write(node.type, indent)
+        self.parts.append('!')
+
+
+WRITERS = dict(
+    (name[len('write_'):], writer) for name, writer in vars(Printer).items()
+    if name.startswith('write_') and name[len('write_')].isupper()
+)
+
+
+def argument_name(node):
+    return node.name.value
 
 
 class PrintingVisitor(Visitor):
+    """Prints an AST through visit(). print_ast uses the faster Printer;
+    this is kept for subclasses that customize printing per node kind."""
+
     def leave_Name(self, node, *args):
         return node.value
 
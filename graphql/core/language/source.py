@@ -1,10 +1,39 @@
+import re
+from bisect import bisect_right
+
 __all__ = ['Source']
 
+LINE_BREAK_RE = re.compile(r'\r\n|[\n\r]')
+
 
 class Source(object):
     def __init__(self, body, name='GraphQL'):
         self.body = body
         self.name = name
+        self._line_starts = None
+
+    @property
+    def line_starts(self):
+        """Offsets at which each line of the body starts, built on first use."""
+        if self._line_starts is None:
+            self._line_starts = [0] + [match.end() for match in LINE_BREAK_RE.finditer(self.body)]
+        return self._line_starts
+
+    def line_of(self, position):
+        """Returns the 1-indexed line containing the given position."""
+        return bisect_right(self.line_starts, position)
+
+    def get_line(self, line):
+        """Returns the text of the given 1-indexed line, without its line
+        terminator."""
+        line_starts = self.line_starts
+        start = line_starts[line - 1]
+        if line < len(line_starts):
+            end = line_starts[line]
+            if self.body[end - 2:end] == '\r\n':
+                return self.body[start:end - 2]
+            return self.body[start:end - 1]
+        return self.body[start:]
 
     def __eq__(self, other):
         if isinstance(other, Source):
@@ -1,5 +1,7 @@
 from collections import namedtuple
-from copy import copy, deepcopy
+from copy import copy
+from operator import attrgetter
+from types import FunctionType
 from . import ast
 
 QUERY_DOCUMENT_KEYS = {
@@ -33,14 +35,126 @@ QUERY_DOCUMENT_KEYS = {
     ast.NonNullType: ('type', ),
 }
 
+_VALUE_KINDS = ('Variable', 'IntValue', 'FloatValue', 'StringValue', 'BooleanValue', 'EnumValue',
+                'ListValue', 'ObjectValue')
+_TYPE_KINDS = ('NamedType', 'ListType', 'NonNullType')
+
+# The node kinds that may appear as direct children of each node kind,
+# used by walk() to skip subtrees that cannot contain a handled kind.
+QUERY_DOCUMENT_CHILD_KINDS = {
+    'Name': (),
+
+    'Document': ('OperationDefinition', 'FragmentDefinition'),
+    'OperationDefinition': ('Name', 'VariableDefinition', 'Directive', 'SelectionSet'),
+    'VariableDefinition': ('Variable',) + _TYPE_KINDS + _VALUE_KINDS,
+    'Variable': ('Name', ),
+    'SelectionSet': ('Field', 'FragmentSpread', 'InlineFragment'),
+    'Field': ('Name', 'Argument', 'Directive', 'SelectionSet'),
+    'Argument': ('Name', ) + _VALUE_KINDS,
+
+    'FragmentSpread': ('Name', 'Directive'),
+    'InlineFragment': ('NamedType', 'Directive', 'SelectionSet'),
+    'FragmentDefinition': ('Name', 'NamedType', 'Directive', 'SelectionSet'),
+
+    'IntValue': (),
+    'FloatValue': (),
+    'StringValue': (),
+    'BooleanValue': (),
+    'EnumValue': (),
+    'ListValue': _VALUE_KINDS,
+    'ObjectValue': ('ObjectField', ),
+    'ObjectField': ('Name', ) + _VALUE_KINDS,
+
+    'Directive': ('Name', 'Argument'),
+
+    'NamedType': ('Name', ),
+    'ListType': _TYPE_KINDS,
+    'NonNullType': ('NamedType', 'ListType'),
+}
+
+
+def get_descendant_kinds(child_kinds):
+    """Returns, for each node kind, the set of kinds that may appear
+    anywhere below it."""
+    descendant_kinds = {}
+    for kind in child_kinds:
+        found = set()
+        stack = list(child_kinds[kind])
+        while stack:
+            child = stack.pop()
+            if child not in found:
+                found.add(child)
+                stack.extend(child_kinds.get(child, ()))
+        descendant_kinds[kind] = frozenset(found)
+    return descendant_kinds
+
+
+QUERY_DOCUMENT_DESCENDANT_KINDS = get_descendant_kinds(QUERY_DOCUMENT_CHILD_KINDS)
+
 BREAK = object()
 REMOVE = object()
 
 Stack = namedtuple('Stack', 'in_array index keys edits prev')
 
 
+def make_child_getter(keys):
+    """Returns a function listing the (key, child) pairs of a node that
+    has the given child keys, leaving out absent and empty children."""
+    keys = tuple(keys)
+    if not keys:
+        return lambda node: ()
+
+    get_values = attrgetter(*keys)
+
+    def get_children(node):
+        try:
+            values = get_values(node)
+        except AttributeError:
+            values = tuple(getattr(node, key, None) for key in keys)
+        else:
+            if len(keys) == 1:
+                values = (values,)
+
+        return [(key, value) for key, value in zip(keys, values) if value]
+
+    return get_children
+
+
+def get_child_keys(node_class, key_map=QUERY_DOCUMENT_KEYS):
+    """Returns the child keys of a node class in a key map, which are those
+    of its nearest base class in the map for classes not in it, such as the
+    lazily decoded node classes of the binary format."""
+    for cls in node_class.__mro__:
+        keys = key_map.get(cls)
+        if keys is not None:
+            return keys
+    return ()
+
+
+class ChildGetters(dict):
+    """Maps node classes to their child getters, built on first use from
+    a key map."""
+
+    def __init__(self, key_map):
+        super(ChildGetters, self).__init__()
+        self.key_map = key_map
+
+    def __missing__(self, node_class):
+        get_children = self[node_class] = make_child_getter(get_child_keys(node_class, self.key_map))
+        return get_children
+
+
+QUERY_DOCUMENT_CHILDREN = ChildGetters(QUERY_DOCUMENT_KEYS)
+
+
 def visit(root, visitor, key_map=None):
-    visitor_keys = key_map or QUERY_DOCUMENT_KEYS
+    """Visits the AST below root, calling visitor.enter and visitor.leave
+    for every node, and returns the root of the edited AST.
+
+    Edits are copy-on-write: the original AST is never changed, only the
+    edited nodes and their ancestors are shallow copies, and every
+    untouched subtree is shared between the original and the result."""
+    child_getters = ChildGetters(key_map) if key_map else QUERY_DOCUMENT_CHILDREN
 
     stack = None
     in_array = isinstance(root, list)
@@ -78,7 +192,6 @@ def visit(root, visitor, key_map=None):
                         if isinstance(node, list):
                             node[edit_key] = edit_value
                         else:
-                            node = deepcopy(node)
                             setattr(node, edit_key, edit_value)
             index = stack.index
             keys = stack.keys
@@ -87,11 +200,11 @@ def visit(root, visitor, key_map=None):
             stack = stack.prev
         else:
             if parent:
-                key = index if in_array else keys[index]
-                if isinstance(parent, list):
-                    node = parent[key]
+                if in_array:
+                    key = index
+                    node = keys[index]
                 else:
-                    node = getattr(parent, key, None)
+                    key, node = keys[index]
             else:
                 key = None
                 node = new_root
@@ -130,7 +243,7 @@ def visit(root, visitor, key_map=None):
         if not is_leaving:
             stack = Stack(in_array, index, keys, edits, prev=stack)
             in_array = isinstance(node, list)
-            keys = node if in_array else visitor_keys.get(type(node), [])
+            keys = node if in_array else child_getters[type(node)](node)
             index = -1
             edits = []
             if parent:
@@ -146,16 +259,240 @@ def visit(root, visitor, key_map=None):
     return new_root
 
 
+class WalkPlan(dict):
+    """Maps node classes to whether walk() calls the handlers for them and
+    whether it descends into them, for one set of handled kinds."""
+
+    def __init__(self, kinds):
+        super(WalkPlan, self).__init__()
+        self.kinds = kinds
+
+    def __missing__(self, node_class):
+        kind = node_class.__name__
+        if self.kinds is None:
+            plan = (True, True)
+        else:
+            descendant_kinds = QUERY_DOCUMENT_DESCENDANT_KINDS.get(kind)
+            plan = (
+                kind in self.kinds,
+                descendant_kinds is None or not descendant_kinds.isdisjoint(self.kinds)
+            )
+        self[node_class] = plan
+        return plan
+
+
+_walk_plans = {}
+
+
+def get_walk_plan(kinds):
+    plan = _walk_plans.get(kinds)
+    if plan is None:
+        plan = _walk_plans[kinds] = WalkPlan(kinds)
+    return plan
+
+
+def get_handled_kinds(visitor_class):
+    """Returns the node kinds a visitor class has enter_ or leave_ handlers
+    for, or None when it overrides enter or leave, or looks up its handlers
+    per instance, and so handles every kind."""
+    cached = vars(visitor_class).get('_handled_kinds')
+    if cached is not None:
+        return cached[0]
+
+    if (get_handler(visitor_class, 'enter') is not get_handler(Visitor, 'enter') or
+            get_handler(visitor_class, 'leave') is not get_handler(Visitor, 'leave') or
+            looks_up_handlers_per_instance(visitor_class)):
+        kinds = None
+    else:
+        kinds = frozenset(
+            name.split('_', 1)[1] for name in dir(visitor_class)
+            if name.startswith(('enter_', 'leave_')) and getattr(visitor_class, name) is not None
+        )
+
+    visitor_class._handled_kinds = (kinds, )
+    return kinds
+
+
+def walk(root, visitor, kinds=None):
+    """Walks the AST below root like visit() does, without supporting edits.
+
+    Only nodes whose kind is in kinds, a collection of node class names,
+    are passed to the visitor, and subtrees that cannot contain such a
+    node are not walked at all. By default the kinds are those the visitor
+    has enter_ or leave_ handlers for, or every kind if it overrides enter
+    or leave. Returning False from enter skips the node's subtree and
+    BREAK stops the walk; any other result is ignored."""
+    if kinds is None:
+        kinds = get_handled_kinds(type(visitor))
+    else:
+        kinds = frozenset(kinds)
+
+    plan = get_walk_plan(kinds)
+    child_getters = QUERY_DOCUMENT_CHILDREN
+    enter = visitor.enter
+    leave = visitor.leave
+    path = []
+    ancestors = []
+    parent = None
+    stack = [iter(((None, root), ))]
+
+    while True:
+        for key, node in stack[-1]:
+            break
+        else:
+            stack.pop()
+            if not stack:
+                return
+
+            node = parent
+            if ancestors:
+                key = path.pop()
+                parent = ancestors.pop()
+            else:
+                key = parent = None
+
+            if not isinstance(node, list) and plan[type(node)][0]:
+                if leave(node, key, parent, path, ancestors) is BREAK:
+                    return
+            continue
+
+        if parent is not None:
+            path.append(key)
+
+        if isinstance(node, list):
+            children = [(index, item) for index, item in enumerate(node) if any(plan[type(item)])]
+        else:
+            handles, descends = plan[type(node)]
+            if handles:
+                result = enter(node, key, parent, path, ancestors)
+                if result is BREAK:
+                    return
+
+                if result is False:
+                    if parent is not None:
+                        path.pop()
+                    continue
+
+            children = [
+                (child_key, child) for child_key, child in child_getters[type(node)](node)
+                if isinstance(child, list) or any(plan[type(child)])
+            ] if descends else ()
+
+        if parent is not None:
+            ancestors.append(parent)
+        parent = node
+        stack.append(iter(children))
+
+
+class HandlerTable(dict):
+    """Maps node classes to the handler functions of one visitor class for
+    one prefix, filled in on first use. For a visitor class that looks up
+    its handlers per instance, every handler calls its
+    _call_kind_specific_visitor."""
+
+    def __init__(self, visitor_class, prefix, per_instance=False):
+        super(HandlerTable, self).__init__()
+        self.visitor_class = visitor_class
+        self.prefix = prefix
+        self.per_instance = per_instance
+
+    def __missing__(self, node_class):
+        if self.per_instance:
+            prefix = self.prefix
+
+            def handler(visitor, *args):
+                return visitor._call_kind_specific_visitor(prefix, *args)
+        else:
+            handler = get_handler(self.visitor_class, self.prefix + node_class.__name__)
+
+        self[node_class] = handler
+        return handler
+
+
+def get_handler(visitor_class, name):
+    for klass in visitor_class.__mro__:
+        namespace = vars(klass)
+        if name not in namespace:
+            continue
+
+        # A handler set to None disables the one it overrides.
+        attribute = namespace[name]
+        if attribute is None:
+            return None
+
+        if isinstance(attribute, FunctionType):
+            return attribute
+
+        # Static methods, class methods and other descriptors are called
+        # through the instance.
+        return lambda visitor, *args: getattr(visitor, name)(*args)
+
+
+def looks_up_handlers_per_instance(visitor_class):
+    """Returns whether a visitor class finds its handlers on each instance,
+    by overriding _call_kind_specific_visitor or through __getattr__, so
+    they cannot be looked up once for the class."""
+    return (
+        get_handler(visitor_class, '_call_kind_specific_visitor') is not
+        get_handler(Visitor, '_call_kind_specific_visitor') or
+        hasattr(visitor_class, '__getattr__')
+    )
+
+
+def get_handler_tables(visitor_class):
+    """Returns the enter and leave handler tables of a visitor class, and
+    whether it looks up its handlers per instance. They are stored on the
+    class itself, tagged with it, since subclasses inherit the attribute
+    but need tables of their own."""
+    tables = getattr(visitor_class, '_handler_tables', None)
+    if tables is None or tables[0] is not visitor_class:
+        per_instance = looks_up_handlers_per_instance(visitor_class)
+        tables = visitor_class._handler_tables = (
+            visitor_class,
+            HandlerTable(visitor_class, 'enter_', per_instance),
+            HandlerTable(visitor_class, 'leave_', per_instance),
+            per_instance,
+        )
+    return tables
+
+
 class Visitor(object):
+    """Calls the enter_<Kind> and leave_<Kind> handlers of its class for
+    each node. Handlers are looked up once per class, unless the class
+    overrides _call_kind_specific_visitor or defines __getattr__; handlers
+    set on an instance are not seen."""
+
+    _handler_tables = None
+
     def enter(self, node, key, parent, path, ancestors):
-        return self._call_kind_specific_visitor('enter_', node, key, parent, path, ancestors)
+        tables = self._handler_tables
+        if tables is None or tables[0] is not type(self):
+            tables = get_handler_tables(type(self))
+
+        handler = tables[1][type(node)]
+        if handler:
+            return handler(self, node, key, parent, path, ancestors)
 
     def leave(self, node, key, parent, path, ancestors):
-        return self._call_kind_specific_visitor('leave_', node, key, parent, path, ancestors)
+        tables = self._handler_tables
+        if tables is None or tables[0] is not type(self):
+            tables = get_handler_tables(type(self))
+
+        handler = tables[2][type(node)]
+        if handler:
+            return handler(self, node, key, parent, path, ancestors)
 
     def _call_kind_specific_visitor(self, prefix, node, key, parent, path, ancestors):
-        node_kind = type(node).__name__
-        method_name = prefix + node_kind
-        method = getattr(self, method_name, None)
-        if method:
-            return method(node, key, parent, path, ancestors)
+        tables = get_handler_tables(type(self))
+        if prefix == 'enter_' and not tables[3]:
+            handler = tables[1][type(node)]
+        elif prefix == 'leave_' and not tables[3]:
+            handler = tables[2][type(node)]
+        else:
+            method = getattr(self, prefix + type(node).__name__, None)
+            if method:
+                return method(node, key, parent, path, ancestors)
+            return
+
+        if handler:
+            return handler(self, node, key, parent, path, ancestors)
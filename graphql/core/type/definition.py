@@ -157,17 +157,32 @@ def add_impl_to_interfaces(impl):
 
 
 class GraphQLField(object):
+    """A field of an object or interface type.
+
+    `cost` and `multiplier` annotate the field for the QueryCost
+    validation rule: cost is what resolving the field once costs, and
+    multiplier is how many items a list field returns, either as a number
+    or as the name (or names) of the argument that limits it, such as
+    'first'."""
+
     def __init__(self, type, args=None, resolver=None,
-                 deprecation_reason=None, description=None):
+                 deprecation_reason=None, description=None, cost=None, multiplier=None):
         self.type = type
         self.args = []
+        self.arg_map = {}
         if args:
             for arg_name, arg in args.items():
                 arg.name = arg_name
                 self.args.append(arg)
+                self.arg_map[arg_name] = arg
         self.resolver = resolver
         self.deprecation_reason = deprecation_reason
         self.description = description
+        self.cost = cost
+        self.multiplier = multiplier
+
+    def get_arg(self, name):
+        return self.arg_map.get(name)
 
 
 class GraphQLArgument(object):
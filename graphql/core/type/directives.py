@@ -3,7 +3,15 @@ from .scalars import GraphQLBoolean
 
 
 class GraphQLDirective(object):
-    pass
+    args = []
+
+    @classmethod
+    def get_arg(cls, name):
+        arg_map = cls.__dict__.get('_arg_map')
+        if arg_map is None:
+            arg_map = dict((arg.name, arg) for arg in cls.args)
+            cls._arg_map = arg_map
+        return arg_map.get(name)
 
 
 def arg(name, *args, **kwargs):
@@ -29,6 +29,7 @@ class GraphQLSchema(object):
         self.mutation = mutation
         self._type_map = None
         self._directives = None
+        self._wrapped_types = None
 
     def get_query_type(self):
         return self.query
@@ -58,6 +59,33 @@ class GraphQLSchema(object):
                 return directive
         return None
 
+    def get_wrapped_type(self, wrapper, of_type):
+        """Returns a GraphQLList or GraphQLNonNull of of_type. The wrappers
+        used by the schema's own fields and arguments are shared; any other
+        is made afresh, so documents cannot grow the schema."""
+        if self._wrapped_types is None:
+            self._wrapped_types = self._build_wrapped_types()
+
+        wrapped_type = self._wrapped_types.get((wrapper, of_type))
+        if wrapped_type is None:
+            return wrapper(of_type)
+        return wrapped_type
+
+    def _build_wrapped_types(self):
+        types = [arg.type for directive in self.get_directives() for arg in directive.args]
+        for type in self.get_type_map().values():
+            if isinstance(type, (GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType)):
+                for field in type.get_fields().values():
+                    types.append(field.type)
+                    types.extend(arg.type for arg in getattr(field, 'args', ()))
+
+        wrapped_types = {}
+        for type in types:
+            while isinstance(type, (GraphQLList, GraphQLNonNull)):
+                wrapped_types.setdefault((type.__class__, type.of_type), type)
+                type = type.of_type
+        return wrapped_types
+
     def _build_type_map(self):
         # TODO: make pythonic
         return reduce(type_map_reducer, [
@@ -1,4 +1,5 @@
 from .language import ast
+from .language.visitor import HandlerTable
 from .type.definition import (
     GraphQLEnumType,
     GraphQLInputObjectType,
@@ -16,20 +17,21 @@ from .type.introspection import SchemaMetaFieldDef, TypeMetaFieldDef, TypeNameMe
 
 
 def type_from_ast(schema, input_type_ast):
+    """Returns the schema type a type AST refers to, or None if it names an
+    unknown type. List and non-null types are shared through the schema."""
+    if isinstance(input_type_ast, ast.NamedType):
+        return schema.get_type(input_type_ast.name.value)
+
     if isinstance(input_type_ast, ast.ListType):
-        inner_type = type_from_ast(schema, input_type_ast.type)
-        if inner_type:
-            return GraphQLList(inner_type)
-        else:
-            return None
-    if isinstance(input_type_ast, ast.NonNullType):
-        inner_type = type_from_ast(schema, input_type_ast.type)
-        if inner_type:
-            return GraphQLNonNull(inner_type)
-        else:
-            return None
-    assert isinstance(input_type_ast, ast.NamedType), 'Must be a type name.'
-    return schema.get_type(input_type_ast.name.value)
+        wrapper = GraphQLList
+    else:
+        assert isinstance(input_type_ast, ast.NonNullType), 'Must be a type name.'
+        wrapper = GraphQLNonNull
+
+    inner_type = type_from_ast(schema, input_type_ast.type)
+    if inner_type:
+        return schema.get_wrapped_type(wrapper, inner_type)
+    return None
 
 
 def is_nullish(value):
@@ -42,6 +44,9 @@ def pop(lst):
 
 
 class TypeInfo(object):
+    """Tracks the schema types of the node being visited. enter and leave
+    dispatch on the node class through ENTERERS and LEAVERS."""
+
     def __init__(self, schema):
         self._schema = schema
         self._type_stack = []
@@ -74,81 +79,100 @@ class TypeInfo(object):
         return self._argument
 
     def enter(self, node):
-        schema = self._schema
-        type = None
-        if isinstance(node, ast.SelectionSet):
-            named_type = get_named_type(self.get_type())
-            composite_type = None
-            if is_composite_type(named_type):
-                composite_type = named_type
-            self._parent_type_stack.append(composite_type)
-        elif isinstance(node, ast.Field):
-            parent_type = self.get_parent_type()
-            field_def = None
-            if parent_type:
-                field_def = get_field_def(schema, parent_type, node)
-            self._field_def_stack.append(field_def)
-            self._type_stack.append(field_def and field_def.type)
-        elif isinstance(node, ast.Directive):
-            self._directive = schema.get_directive(node.name.value)
-        elif isinstance(node, ast.OperationDefinition):
-            if node.operation == 'query':
-                type = schema.get_query_type()
-            elif node.operation == 'mutation':
-                type = schema.get_mutation_type()
-            self._type_stack.append(type)
-        elif isinstance(node, (ast.InlineFragment, ast.FragmentDefinition)):
-            type = type_from_ast(schema, node.type_condition)
-            self._type_stack.append(type)
-        elif isinstance(node, ast.VariableDefinition):
-            self._input_type_stack.append(type_from_ast(schema, node.type))
-        elif isinstance(node, ast.Argument):
-            arg_def = None
-            arg_type = None
-            field_or_directive = self.get_directive() or self.get_field_def()
-            if field_or_directive:
-                arg_def = [arg for arg in field_or_directive.args if arg.name == node.name.value]
-                if arg_def:
-                    arg_def = arg_def[0]
-                    arg_type = arg_def.type
-                else:
-                    arg_def = None
-            self._argument = arg_def
-            self._input_type_stack.append(arg_type)
-        elif isinstance(node, ast.ListValue):
-            list_type = get_nullable_type(self.get_input_type())
-            self._input_type_stack.append(
-                list_type.of_type if isinstance(list_type, GraphQLList) else None
-            )
-        elif isinstance(node, ast.ObjectField):
-            object_type = get_named_type(self.get_input_type())
-            field_type = None
-            if isinstance(object_type, GraphQLInputObjectType):
-                input_field = object_type.get_fields().get(node.name.value)
-                field_type = input_field.type if input_field else None
-            self._input_type_stack.append(field_type)
+        enterer = ENTERERS[type(node)]
+        if enterer is not None:
+            enterer(self, node)
 
     def leave(self, node):
-        if isinstance(node, ast.SelectionSet):
-            pop(self._parent_type_stack)
-        elif isinstance(node, ast.Field):
-            pop(self._field_def_stack)
-            pop(self._type_stack)
-        elif isinstance(node, ast.Directive):
-            self._directive = None
-        elif isinstance(node, (
-                ast.OperationDefinition,
-                ast.InlineFragment,
-                ast.FragmentDefinition,
-        )):
-            pop(self._type_stack)
-        elif isinstance(node, ast.VariableDefinition):
-            pop(self._input_type_stack)
-        elif isinstance(node, ast.Argument):
-            self._argument = None
-            pop(self._input_type_stack)
-        elif isinstance(node, (ast.ListType, ast.ObjectField)):
-            pop(self._input_type_stack)
+        leaver = LEAVERS[type(node)]
+        if leaver is not None:
+            leaver(self, node)
+
+    def enter_SelectionSet(self, node):
+        named_type = get_named_type(self.get_type())
+        self._parent_type_stack.append(named_type if is_composite_type(named_type) else None)
+
+    def enter_Field(self, node):
+        parent_type = self.get_parent_type()
+        field_def = parent_type and get_field_def(self._schema, parent_type, node)
+        self._field_def_stack.append(field_def)
+        self._type_stack.append(field_def and field_def.type)
+
+    def enter_Directive(self, node):
+        self._directive = self._schema.get_directive(node.name.value)
+
+    def enter_OperationDefinition(self, node):
+        type = None
+        if node.operation == 'query':
+            type = self._schema.get_query_type()
+        elif node.operation == 'mutation':
+            type = self._schema.get_mutation_type()
+        self._type_stack.append(type)
+
+    def enter_InlineFragment(self, node):
+        self._type_stack.append(type_from_ast(self._schema, node.type_condition))
+
+    enter_FragmentDefinition = enter_InlineFragment
+
+    def enter_VariableDefinition(self, node):
+        self._input_type_stack.append(type_from_ast(self._schema, node.type))
+
+    def enter_Argument(self, node):
+        arg_def = None
+        field_or_directive = self._directive or self.get_field_def()
+        if field_or_directive:
+            arg_def = field_or_directive.get_arg(node.name.value)
+        self._argument = arg_def
+        self._input_type_stack.append(arg_def and arg_def.type)
+
+    def enter_ListValue(self, node):
+        list_type = get_nullable_type(self.get_input_type())
+        self._input_type_stack.append(
+            list_type.of_type if isinstance(list_type, GraphQLList) else None
+        )
+
+    def enter_ObjectField(self, node):
+        object_type = get_named_type(self.get_input_type())
+        field_type = None
+        if isinstance(object_type, GraphQLInputObjectType):
+            input_field = object_type.get_fields().get(node.name.value)
+            field_type = input_field.type if input_field else None
+        self._input_type_stack.append(field_type)
+
+    def leave_SelectionSet(self, node):
+        pop(self._parent_type_stack)
+
+    def leave_Field(self, node):
+        pop(self._field_def_stack)
+        pop(self._type_stack)
+
+    def leave_Directive(self, node):
+        self._directive = None
+
+    def leave_OperationDefinition(self, node):
+        pop(self._type_stack)
+
+    leave_InlineFragment = leave_OperationDefinition
+    leave_FragmentDefinition = leave_OperationDefinition
+
+    def leave_VariableDefinition(self, node):
+        pop(self._input_type_stack)
+
+    leave_ListValue = leave_VariableDefinition
+    leave_ObjectField = leave_VariableDefinition
+
+    def leave_Argument(self, node):
+        self._argument = None
+        pop(self._input_type_stack)
+
+
+ENTERERS = HandlerTable(TypeInfo, 'enter_')
+LEAVERS = HandlerTable(TypeInfo, 'leave_')
+
+# The node kinds enter and leave keep track of.
+TypeInfo.kinds = frozenset(
+    name.split('_', 1)[1] for name in vars(TypeInfo) if name.startswith(('enter_', 'leave_'))
+)
 
 
 def get_field_def(schema, parent_type, field_ast):
@@ -1,7 +1,10 @@
+from collections import namedtuple
+
 from . import rules as Rules
 from ..error import GraphQLError
-from ..language.ast import FragmentDefinition, FragmentSpread
-from ..language.visitor import Visitor, visit
+from ..language.ast import FragmentDefinition, FragmentSpread, Variable, VariableDefinition
+from ..language.fingerprint import document_key
+from ..language.visitor import BREAK, Visitor, get_handled_kinds, visit, walk
 from ..type import GraphQLSchema
 from ..utils import TypeInfo
 
@@ -31,31 +34,111 @@ specified_rules = [
     Rules.UniqueInputFieldNames
 ]
 
+# Rules that reject malformed documents cheaply; with structural_first,
+# validate runs these on their own before the other rules.
+structural_rules = (
+    Rules.KnownTypeNames,
+    Rules.FieldsOnCorrectType,
+    Rules.ScalarLeafs,
+    Rules.SelectionLimitRule,
+)
+
+
+def validate(schema, ast, rules=None, parallel=True, cache=None, max_errors=None, structural_first=False):
+    """Returns the errors the rules find in the document.
 
-def validate(schema, ast, rules=None):
+    With max_errors, validation stops as soon as that many errors are
+    found, and at most that many are returned. With structural_first, the
+    given rules that are structural_rules run first, and the other rules
+    only run if those find no errors.
+
+    With a cache, such as a ValidationCache, errors are stored per
+    document, schema, rule set and options, and a repeated document is
+    not validated again."""
     assert schema, 'Must provide schema'
     assert ast, 'Must provide document'
     assert isinstance(schema, GraphQLSchema)
+    assert max_errors is None or max_errors > 0, 'max_errors must be positive.'
     if rules is None:
         rules = specified_rules
-    return visit_using_rules(schema, ast, rules)
 
+    if cache is None:
+        return validate_uncached(schema, ast, rules, parallel, max_errors, structural_first)
+
+    key = (document_key(ast), schema, tuple(rules), max_errors, structural_first)
+    errors = cache.get(key)
+    if errors is None:
+        errors = tuple(validate_uncached(schema, ast, rules, parallel, max_errors, structural_first))
+        cache.set(key, errors)
+    return list(errors)
+
+
+def validate_uncached(schema, ast, rules, parallel, max_errors, structural_first):
+    if not structural_first:
+        return visit_using_rules(schema, ast, rules, parallel, max_errors)
+
+    first = [rule for rule in rules if issubclass(rule, structural_rules)]
+    errors = first and visit_using_rules(schema, ast, first, parallel, max_errors)
+    if errors:
+        return errors
+
+    rest = [rule for rule in rules if not issubclass(rule, structural_rules)]
+    return visit_using_rules(schema, ast, rest, parallel, max_errors)
 
-def visit_using_rules(schema, ast, rules):
+
+def visit_using_rules(schema, ast, rules, parallel=True, max_errors=None):
+    """Runs every rule over the document and returns their errors, grouped
+    by rule in the order the rules are given.
+
+    With parallel, all rules share a single traversal of the document;
+    otherwise the document is traversed once per rule. Either way the
+    traversal breaks off once max_errors errors are found."""
     type_info = TypeInfo(schema)
     context = ValidationContext(schema, ast, type_info)
+    if parallel:
+        instances = [rule(context) for rule in rules]
+        rule_errors = [[] for _ in instances]
+        error_limit = max_errors and ErrorLimit(max_errors)
+        visitor = ParallelValidationVisitor(instances, type_info, rule_errors, error_limit=error_limit)
+        walk(ast, visitor, visitor.kinds)
+        errors = [error for errors in rule_errors for error in errors]
+        return errors[:max_errors] if max_errors else errors
+
     errors = []
     for rule in rules:
         instance = rule(context)
-        visit(ast, ValidationVisitor(instance, type_info, errors))
+        visit(ast, ValidationVisitor(instance, type_info, errors, max_errors))
+        if max_errors and len(errors) >= max_errors:
+            return errors[:max_errors]
     return errors
 
 
+class ErrorLimit(object):
+    """Counts the errors found by a parallel traversal and its nested
+    traversals against max_errors."""
+    __slots__ = ('max_errors', 'count')
+
+    def __init__(self, max_errors):
+        self.max_errors = max_errors
+        self.count = 0
+
+    def add(self, errors):
+        self.count += len(errors) if isinstance(errors, list) else 1
+
+    @property
+    def reached(self):
+        return self.count >= self.max_errors
+
+
 class ValidationVisitor(Visitor):
-    def __init__(self, instance, type_info, errors):
+    def __init__(self, instance, type_info, errors, max_errors=None):
         self.instance = instance
         self.type_info = type_info
         self.errors = errors
+        self.max_errors = max_errors
+
+    def limit_reached(self):
+        return self.max_errors is not None and len(self.errors) >= self.max_errors
 
     def enter(self, node, key, parent, path, ancestors):
         self.type_info.enter(node)
@@ -66,12 +149,16 @@ class ValidationVisitor(Visitor):
         result = self.instance.enter(node, key, parent, path, ancestors)
         if result and is_error(result):
             append(self.errors, result)
+            if self.limit_reached():
+                return BREAK
             result = False
 
         if result is None and getattr(self.instance, 'visit_spread_fragments', False) and isinstance(node, FragmentSpread):
             fragment = self.instance.context.get_fragment(node.name.value)
             if fragment:
                 visit(fragment, self)
+                if self.limit_reached():
+                    return BREAK
 
         if result is False:
             self.type_info.leave(node)
@@ -83,12 +170,157 @@ class ValidationVisitor(Visitor):
 
         if result and is_error(result):
             append(self.errors, result)
+            if self.limit_reached():
+                return BREAK
             result = False
 
         self.type_info.leave(node)
         return result
 
 
+class ParallelValidationVisitor(Visitor):
+    """Dispatches each node to several rule instances during one traversal,
+    keeping the TypeInfo in step once for all of them.
+
+    Each rule sees exactly the calls it would see when visited on its own:
+    a rule returning False (or errors) on enter skips that node's subtree
+    until the node is left, a rule returning BREAK is done for the rest of
+    the document, and rules with visit_spread_fragments descend into
+    spread fragments through a nested traversal of just those rules.
+
+    With an ErrorLimit, the traversal breaks off once it is reached."""
+
+    def __init__(self, instances, type_info, errors, finished=None, error_limit=None):
+        self.instances = instances
+        self.type_info = type_info
+        self.errors = errors
+        self.error_limit = error_limit
+        # The node whose subtree each rule is skipping, or BREAK once the
+        # rule is finished.
+        self.skipping = [None] * len(instances)
+        self.skips_fragment_definitions = [hasattr(instance, 'visit_spread_fragments') for instance in instances]
+        self.visits_spread_fragments = [getattr(instance, 'visit_spread_fragments', False) for instance in instances]
+        # Rules finished by BREAK, shared with nested traversals.
+        self.finished = set() if finished is None else finished
+        self.kinds = get_parallel_kinds(instances)
+
+    def enter(self, node, key, parent, path, ancestors):
+        self.type_info.enter(node)
+
+        skipping = self.skipping
+        is_fragment_definition = key and isinstance(node, FragmentDefinition)
+        is_fragment_spread = isinstance(node, FragmentSpread)
+        spreading = None
+        active = False
+
+        for i, instance in enumerate(self.instances):
+            if skipping[i] is not None:
+                continue
+
+            if is_fragment_definition and self.skips_fragment_definitions[i]:
+                skipping[i] = node
+                continue
+
+            result = instance.enter(node, key, parent, path, ancestors)
+            if result is BREAK:
+                self.finish(i)
+                continue
+
+            if result and is_error(result):
+                append(self.errors[i], result)
+                if self.add_errors(result):
+                    return BREAK
+                result = False
+
+            if result is False:
+                skipping[i] = node
+                continue
+
+            active = True
+            if is_fragment_spread and self.visits_spread_fragments[i]:
+                if spreading is None:
+                    spreading = []
+                spreading.append(i)
+
+        if spreading:
+            fragment = self.instances[spreading[0]].context.get_fragment(node.name.value)
+            if fragment:
+                self.visit_fragment(fragment, spreading)
+                if self.error_limit and self.error_limit.reached:
+                    return BREAK
+
+        if not active:
+            for i, skipped in enumerate(skipping):
+                if skipped is node:
+                    skipping[i] = None
+
+            self.type_info.leave(node)
+            if all(skipped is BREAK for skipped in skipping):
+                return BREAK
+
+            return False
+
+    def leave(self, node, key, parent, path, ancestors):
+        skipping = self.skipping
+        for i, instance in enumerate(self.instances):
+            skipped = skipping[i]
+            if skipped is not None:
+                if skipped is node:
+                    skipping[i] = None
+                continue
+
+            result = instance.leave(node, key, parent, path, ancestors)
+            if result is BREAK:
+                self.finish(i)
+
+            elif result and is_error(result):
+                append(self.errors[i], result)
+                if self.add_errors(result):
+                    return BREAK
+
+        self.type_info.leave(node)
+
+    def add_errors(self, errors):
+        """Counts errors against the limit, returning whether it is reached."""
+        error_limit = self.error_limit
+        if error_limit is None:
+            return False
+        error_limit.add(errors)
+        return error_limit.reached
+
+    def finish(self, i):
+        self.skipping[i] = BREAK
+        self.finished.add(self.instances[i])
+
+    def visit_fragment(self, fragment, indexes):
+        visitor = ParallelValidationVisitor(
+            [self.instances[i] for i in indexes],
+            self.type_info,
+            [self.errors[i] for i in indexes],
+            self.finished,
+            self.error_limit
+        )
+        walk(fragment, visitor, visitor.kinds)
+
+        for i in indexes:
+            if self.instances[i] in self.finished:
+                self.skipping[i] = BREAK
+
+
+def get_parallel_kinds(instances):
+    """Returns the node kinds a parallel traversal must visit: those the
+    rules handle, those TypeInfo tracks, and fragment spreads and
+    definitions for visit_spread_fragments. None means every kind."""
+    kinds = set(TypeInfo.kinds)
+    kinds.update(('FragmentSpread', 'FragmentDefinition'))
+    for instance in instances:
+        rule_kinds = get_handled_kinds(type(instance))
+        if rule_kinds is None:
+            return None
+        kinds.update(rule_kinds)
+    return frozenset(kinds)
+
+
 def is_error(value):
     if isinstance(value, list):
         return all(isinstance(item, GraphQLError) for item in value)
@@ -102,12 +334,30 @@ def append(arr, items):
         arr.append(items)
 
 
+VariableUsage = namedtuple('VariableUsage', 'node type fragment')
+VariableUsage.__doc__ = """A Variable node, the input type expected where it is used, and the
+fragment definition it is used in, if any."""
+
+SpreadUsages = namedtuple('SpreadUsages', 'name usages')
+
+
 class ValidationContext(object):
+    """What rules know about the document being validated.
+
+    Besides the state of the traversal, the context holds analyses of the
+    whole document that several rules need. They are computed on first
+    use and cached for the rest of the validation."""
+
     def __init__(self, schema, ast, type_info):
         self._schema = schema
         self._ast = ast
         self._type_info = type_info
         self._fragments = None
+        self._fragment_spreads = {}
+        self._fragment_dependencies = None
+        self._recursively_referenced_fragments = {}
+        self._usage_entries = {}
+        self._recursive_variable_usages = {}
 
     def get_schema(self):
         return self._schema
@@ -124,6 +374,101 @@ class ValidationContext(object):
                     fragments[statement.name.value] = statement
         return fragments.get(name)
 
+    def get_fragment_spreads(self, node):
+        """Returns the fragment spreads below node in document order,
+        without following them into their fragments."""
+        spreads = self._fragment_spreads.get(id(node))
+        if spreads is None:
+            collector = FragmentSpreadCollector()
+            walk(node, collector)
+            spreads = self._fragment_spreads[id(node)] = collector.spreads
+        return spreads
+
+    def get_fragment_dependencies(self):
+        """Returns the fragment dependency graph: the fragment spreads in
+        each fragment definition, by fragment name."""
+        dependencies = self._fragment_dependencies
+        if dependencies is None:
+            self._fragment_dependencies = dependencies = {}
+            for statement in self.get_ast().definitions:
+                if isinstance(statement, FragmentDefinition):
+                    dependencies[statement.name.value] = self.get_fragment_spreads(statement)
+        return dependencies
+
+    def get_recursively_referenced_fragments(self, operation):
+        """Returns the definitions of the fragments an operation spreads,
+        directly or through other fragments."""
+        fragments = self._recursively_referenced_fragments.get(id(operation))
+        if fragments is None:
+            fragments = self._recursively_referenced_fragments[id(operation)] = []
+            collected_names = set()
+            nodes_to_visit = [operation]
+            while nodes_to_visit:
+                node = nodes_to_visit.pop()
+                for spread in self.get_fragment_spreads(node):
+                    fragment_name = spread.name.value
+                    if fragment_name in collected_names:
+                        continue
+
+                    collected_names.add(fragment_name)
+                    fragment = self.get_fragment(fragment_name)
+                    if fragment:
+                        fragments.append(fragment)
+                        nodes_to_visit.append(fragment)
+        return fragments
+
+    def get_variable_usages(self, node):
+        """Returns the usages of variables below node in document order,
+        without following fragment spreads. Variable definitions are not
+        usages."""
+        usages = []
+        for entry in self.get_usage_entries(node):
+            if isinstance(entry, SpreadUsages):
+                usages.extend(entry.usages)
+            else:
+                usages.append(entry)
+        return usages
+
+    def get_recursive_variable_usages(self, operation):
+        """Returns the usages of variables in an operation, including those
+        in the fragments it spreads, in the order a traversal that visits
+        each fragment at its first spread would reach them."""
+        usages = self._recursive_variable_usages.get(id(operation))
+        if usages is None:
+            usages = self._recursive_variable_usages[id(operation)] = []
+            self._add_recursive_variable_usages(usages, self.get_usage_entries(operation), None, set())
+        return usages
+
+    def _add_recursive_variable_usages(self, usages, entries, fragment, visited_fragment_names):
+        for entry in entries:
+            if not isinstance(entry, SpreadUsages):
+                usages.append(entry if fragment is None else entry._replace(fragment=fragment))
+                continue
+
+            if entry.name in visited_fragment_names:
+                continue
+
+            visited_fragment_names.add(entry.name)
+            spread_fragment = self.get_fragment(entry.name)
+            if spread_fragment:
+                self._add_recursive_variable_usages(
+                    usages, self.get_usage_entries(spread_fragment), spread_fragment, visited_fragment_names
+                )
+
+            # Usages in the directives of the spread itself.
+            self._add_recursive_variable_usages(usages, entry.usages, fragment, visited_fragment_names)
+
+    def get_usage_entries(self, node):
+        """Returns the variable usages below node in document order, with
+        each fragment spread as a SpreadUsages holding the usages in its
+        directives."""
+        entries = self._usage_entries.get(id(node))
+        if entries is None:
+            collector = VariableUsageCollector(TypeInfo(self._schema))
+            walk(node, collector, VariableUsageCollector.kinds)
+            entries = self._usage_entries[id(node)] = collector.entries
+        return entries
+
     def get_type(self):
         return self._type_info.get_type()
 
@@ -141,3 +486,39 @@ class ValidationContext(object):
 
     def get_argument(self):
         return self._type_info.get_argument()
+
+
+class FragmentSpreadCollector(Visitor):
+    def __init__(self):
+        self.spreads = []
+
+    def enter_FragmentSpread(self, node, *args):
+        self.spreads.append(node)
+
+
+class VariableUsageCollector(Visitor):
+    kinds = TypeInfo.kinds | frozenset(['Variable', 'VariableDefinition', 'FragmentSpread'])
+
+    def __init__(self, type_info):
+        self.type_info = type_info
+        self.entries = []
+        self.targets = [self.entries]
+
+    def enter(self, node, *args):
+        if isinstance(node, VariableDefinition):
+            return False
+
+        self.type_info.enter(node)
+        if isinstance(node, Variable):
+            self.targets[-1].append(VariableUsage(node, self.type_info.get_input_type(), None))
+
+        elif isinstance(node, FragmentSpread):
+            spread = SpreadUsages(node.name.value, [])
+            self.targets[-1].append(spread)
+            self.targets.append(spread.usages)
+
+    def leave(self, node, *args):
+        if isinstance(node, FragmentSpread):
+            self.targets.pop()
+
+        self.type_info.leave(node)
@@ -1,8 +1,10 @@
 import itertools
+from ..cache import LRUCache
+from ..compat import str_type
 from ..error import GraphQLError
 from ..language import ast
 from ..language.printer import print_ast
-from ..language.visitor import Visitor, visit
+from ..language.visitor import Visitor, walk
 from ..type.definition import (
     GraphQLInterfaceType,
     GraphQLList,
@@ -14,7 +16,7 @@ from ..type.definition import (
     is_input_type,
     is_leaf_type,
 )
-from ..utils import is_valid_literal_value, type_from_ast
+from ..utils import get_field_def, is_valid_literal_value, type_from_ast
 from .utils import DefaultOrderedDict, PairSet
 
 
@@ -22,6 +24,32 @@ class ValidationRule(Visitor):
     def __init__(self, context):
         self.context = context
 
+    @classmethod
+    def with_options(cls, **options):
+        """Returns a subclass of a configurable rule with some of its option
+        class attributes overridden. The subclasses for recently used sets of
+        hashable options are kept and returned again, so validation caches
+        keyed on the rules keep hitting when a rule is configured on every
+        request."""
+        for name in options:
+            assert hasattr(cls, name) and not callable(getattr(cls, name)), \
+                'Unknown {} option "{}".'.format(cls.__name__, name)
+
+        key = (cls, frozenset(options.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return type(cls.__name__, (cls, ), options)
+
+        rule = _configured_rules.get(key)
+        if rule is None:
+            rule = type(cls.__name__, (cls, ), options)
+            _configured_rules.set(key, rule)
+        return rule
+
+
+_configured_rules = LRUCache(max_size=256)
+
 
 class UniqueOperationNames(ValidationRule):
     def __init__(self, context):
@@ -205,47 +233,20 @@ class KnownFragmentNames(ValidationRule):
 
 
 class NoUnusedFragments(ValidationRule):
-    def __init__(self, context):
-        super(NoUnusedFragments, self).__init__(context)
-        self.fragment_definitions = []
-        self.spreads_within_operation = []
-        self.fragment_adjacencies = {}
-        self.spread_names = set()
-
-    def enter_OperationDefinition(self, *args):
-        self.spread_names = set()
-        self.spreads_within_operation.append(self.spread_names)
-
-    def enter_FragmentDefinition(self, node, *args):
-        self.fragment_definitions.append(node)
-        self.spread_names = set()
-        self.fragment_adjacencies[node.name.value] = self.spread_names
-
-    def enter_FragmentSpread(self, node, *args):
-        self.spread_names.add(node.name.value)
-
-    def leave_Document(self, *args):
+    def leave_Document(self, node, *args):
         fragment_names_used = set()
-
-        def reduce_spread_fragments(spreads):
-            for fragment_name in spreads:
-                if fragment_name in fragment_names_used:
-                    continue
-
-                fragment_names_used.add(fragment_name)
-                if fragment_name in self.fragment_adjacencies:
-                    reduce_spread_fragments(self.fragment_adjacencies[fragment_name])
-
-        for spreads in self.spreads_within_operation:
-            reduce_spread_fragments(spreads)
+        for definition in node.definitions:
+            if isinstance(definition, ast.OperationDefinition):
+                for fragment in self.context.get_recursively_referenced_fragments(definition):
+                    fragment_names_used.add(fragment.name.value)
 
         errors = [
             GraphQLError(
-                self.unused_fragment_message(fragment_definition.name.value),
-                [fragment_definition]
+                self.unused_fragment_message(definition.name.value),
+                [definition]
             )
-            for fragment_definition in self.fragment_definitions
-            if fragment_definition.name.value not in fragment_names_used
+            for definition in node.definitions
+            if isinstance(definition, ast.FragmentDefinition) and definition.name.value not in fragment_names_used
         ]
 
         if errors:
@@ -311,11 +312,7 @@ class PossibleFragmentSpreads(ValidationRule):
 class NoFragmentCycles(ValidationRule):
     def __init__(self, context):
         super(NoFragmentCycles, self).__init__(context)
-        self.spreads_in_fragment = {
-            node.name.value: self.gather_spreads(node)
-            for node in context.get_ast().definitions
-            if isinstance(node, ast.FragmentDefinition)
-        }
+        self.spreads_in_fragment = context.get_fragment_dependencies()
         self.known_to_lead_to_cycle = set()
 
     def enter_FragmentDefinition(self, node, *args):
@@ -327,7 +324,7 @@ class NoFragmentCycles(ValidationRule):
         # to a set. Otherwise we get a `unhashable type: dict` error.
         # This makes it so that we can define a way to uniquely identify a FragmentDefinition
         # within a set.
-        fragment_node_to_hashable = lambda fs: (fs.loc['start'], fs.loc['end'], fs.name.value)
+        fragment_node_to_hashable = lambda fs: (fs.loc.start, fs.loc.end, fs.name.value)
 
         def detect_cycle_recursive(fragment_name):
             spread_nodes = self.spreads_in_fragment[fragment_name]
@@ -365,7 +362,7 @@ class NoFragmentCycles(ValidationRule):
     @classmethod
     def gather_spreads(cls, node):
         visitor = cls.CollectFragmentSpreadNodesVisitor()
-        visit(node, visitor)
+        walk(node, visitor)
         return visitor.collect_fragment_spread_nodes()
 
     class CollectFragmentSpreadNodesVisitor(Visitor):
@@ -380,14 +377,6 @@ class NoFragmentCycles(ValidationRule):
 
 
 class NoUndefinedVariables(ValidationRule):
-    visit_spread_fragments = True
-    operation = None
-
-    def __init__(self, context):
-        self.visited_fragment_names = set()
-        self.defined_variable_names = set()
-        super(NoUndefinedVariables, self).__init__(context)
-
     @staticmethod
     def undefined_var_message(var_name):
         return 'Variable "${}" is not defined.'.format(var_name)
@@ -398,81 +387,51 @@ class NoUndefinedVariables(ValidationRule):
             var_name, op_name
         )
 
-    def enter_OperationDefinition(self, node, *args):
-        self.operation = node
-        self.visited_fragment_names = set()
-        self.defined_variable_names = set()
-
-    def enter_VariableDefinition(self, node, *args):
-        self.defined_variable_names.add(node.variable.name.value)
-
-    def enter_Variable(self, variable, key, parent, path, ancestors):
-        var_name = variable.name.value
-        if var_name not in self.defined_variable_names:
-            within_fragment = any(isinstance(node, ast.FragmentDefinition) for node in ancestors)
-            if within_fragment and self.operation and self.operation.name:
-                return GraphQLError(
-                    self.undefined_var_by_op_message(var_name, self.operation.name.value),
-                    [variable, self.operation]
-                )
+    def enter_OperationDefinition(self, operation, *args):
+        defined_variable_names = set(
+            definition.variable.name.value for definition in operation.variable_definitions or ()
+        )
 
-            return GraphQLError(
-                self.undefined_var_message(var_name),
-                [variable]
-            )
+        errors = []
+        for usage in self.context.get_recursive_variable_usages(operation):
+            variable = usage.node
+            var_name = variable.name.value
+            if var_name in defined_variable_names:
+                continue
 
-    def enter_FragmentSpread(self, spread_ast, *args):
-        if spread_ast.name.value in self.visited_fragment_names:
-            return False
+            if usage.fragment and operation.name:
+                errors.append(GraphQLError(
+                    self.undefined_var_by_op_message(var_name, operation.name.value),
+                    [variable, operation]
+                ))
+            else:
+                errors.append(GraphQLError(
+                    self.undefined_var_message(var_name),
+                    [variable]
+                ))
 
-        self.visited_fragment_names.add(spread_ast.name.value)
+        if errors:
+            return errors
 
 
 class NoUnusedVariables(ValidationRule):
-    visited_fragment_names = None
-    variable_definitions = None
-    variable_name_used = None
-    visit_spread_fragments = True
-
-    def __init__(self, context):
-        super(NoUnusedVariables, self).__init__(context)
-
-    def enter_OperationDefinition(self, *args):
-        self.visited_fragment_names = set()
-        self.variable_definitions = []
-        self.variable_name_used = set()
+    def leave_OperationDefinition(self, operation, *args):
+        variable_name_used = set(
+            usage.node.name.value for usage in self.context.get_recursive_variable_usages(operation)
+        )
 
-    def leave_OperationDefinition(self, *args):
         errors = [
             GraphQLError(
                 self.unused_variable_message(variable_definition.variable.name.value),
                 [variable_definition]
             )
-            for variable_definition in self.variable_definitions
-            if variable_definition.variable.name.value not in self.variable_name_used
+            for variable_definition in operation.variable_definitions or ()
+            if variable_definition.variable.name.value not in variable_name_used
         ]
 
         if errors:
             return errors
 
-    def enter_VariableDefinition(self, node, *args):
-        if self.variable_definitions is not None:
-            self.variable_definitions.append(node)
-
-        return False
-
-    def enter_Variable(self, node, *args):
-        if self.variable_name_used is not None:
-            self.variable_name_used.add(node.name.value)
-
-    def enter_FragmentSpread(self, node, *args):
-        if self.visited_fragment_names is not None:
-            spread_name = node.name.value
-            if spread_name in self.visited_fragment_names:
-                return False
-
-            self.visited_fragment_names.add(spread_name)
-
     @staticmethod
     def unused_variable_message(variable_name):
         return 'Variable "${}" is never used.'.format(variable_name)
@@ -530,7 +489,7 @@ class KnownArgumentNames(ValidationRule):
             if not field_def:
                 return
 
-            field_arg_def = next((arg for arg in field_def.args if arg.name == node.name.value), None)
+            field_arg_def = field_def.get_arg(node.name.value)
 
             if not field_arg_def:
                 parent_type = self.context.get_parent_type()
@@ -545,7 +504,7 @@ class KnownArgumentNames(ValidationRule):
             if not directive:
                 return
 
-            directive_arg_def = next((arg for arg in directive.args if arg.name == node.name.value), None)
+            directive_arg_def = directive.get_arg(node.name.value)
 
             if not directive_arg_def:
                 return GraphQLError(
@@ -683,34 +642,24 @@ class DefaultValuesOfCorrectType(ValidationRule):
 
 
 class VariablesInAllowedPosition(ValidationRule):
-    visit_spread_fragments = True
-
-    def __init__(self, context):
-        super(VariablesInAllowedPosition, self).__init__(context)
-        self.var_def_map = {}
-        self.visited_fragment_names = set()
-
-    def enter_OperationDefinition(self, *args):
-        self.var_def_map = {}
-        self.visited_fragment_names = set()
+    def enter_OperationDefinition(self, operation, *args):
+        var_def_map = dict(
+            (definition.variable.name.value, definition) for definition in operation.variable_definitions or ()
+        )
 
-    def enter_VariableDefinition(self, node, *args):
-        self.var_def_map[node.variable.name.value] = node
-
-    def enter_Variable(self, node, *args):
-        var_name = node.name.value
-        var_def = self.var_def_map.get(var_name)
-        var_type = var_def and type_from_ast(self.context.get_schema(), var_def.type)
-        input_type = self.context.get_input_type()
-        if var_type and input_type and not self.var_type_allowed_for_type(self.effective_type(var_type, var_def),
-                                                                          input_type):
-            return GraphQLError(self.bad_var_pos_message(var_name, var_type, input_type),
-                                [node])
+        errors = []
+        for usage in self.context.get_recursive_variable_usages(operation):
+            var_name = usage.node.name.value
+            var_def = var_def_map.get(var_name)
+            var_type = var_def and type_from_ast(self.context.get_schema(), var_def.type)
+            input_type = usage.type
+            if var_type and input_type and not self.var_type_allowed_for_type(self.effective_type(var_type, var_def),
+                                                                              input_type):
+                errors.append(GraphQLError(self.bad_var_pos_message(var_name, var_type, input_type),
+                                           [usage.node]))
 
-    def enter_FragmentSpread(self, node, *args):
-        if node.name.value in self.visited_fragment_names:
-            return False
-        self.visited_fragment_names.add(node.name.value)
+        if errors:
+            return errors
 
     @staticmethod
     def effective_type(var_type, var_def):
@@ -745,6 +694,7 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
     def __init__(self, context):
         super(OverlappingFieldsCanBeMerged, self).__init__(context)
         self.compared_set = PairSet()
+        self.selections_by_selection_set = {}
 
     def find_conflicts(self, field_map):
         conflicts = []
@@ -753,9 +703,11 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
             if field_len <= 1:
                 continue
 
-            for field_a in fields:
-                for field_b in fields:
-                    conflict = self.find_conflict(response_name, field_a, field_b)
+            # Each unordered pair once, in the order a full double loop
+            # would first reach it.
+            for i, field_a in enumerate(fields):
+                for j in range(i + 1, field_len):
+                    conflict = self.find_conflict(response_name, field_a, fields[j])
                     if conflict:
                         conflicts.append(conflict)
 
@@ -770,7 +722,8 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
         if not ast:
             return None
 
-        return ast.__class__, ast.loc['start'], ast.loc['end']
+        loc = ast.loc
+        return type(ast), loc.start, loc.end
 
     def find_conflict(self, response_name, pair1, pair2):
         ast1, def1 = pair1
@@ -857,9 +810,35 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
     def same_type(type1, type2):
         return type1.is_same_type(type2)
 
-    @staticmethod
-    def same_value(value1, value2):
-        return (not value1 and not value2) or print_ast(value1) == print_ast(value2)
+    @classmethod
+    def same_value(cls, value1, value2):
+        """Whether two value ASTs print the same, compared structurally."""
+        if not value1 or not value2:
+            return not value1 and not value2
+
+        kind = type(value1).__name__
+        if kind != type(value2).__name__:
+            return False
+
+        if kind == 'Variable':
+            return value1.name.value == value2.name.value
+
+        if kind == 'ListValue':
+            values1 = value1.values or []
+            values2 = value2.values or []
+            return len(values1) == len(values2) and all(
+                cls.same_value(item1, item2) for item1, item2 in zip(values1, values2)
+            )
+
+        if kind == 'ObjectValue':
+            fields1 = value1.fields or []
+            fields2 = value2.fields or []
+            return len(fields1) == len(fields2) and all(
+                field1.name.value == field2.name.value and cls.same_value(field1.value, field2.value)
+                for field1, field2 in zip(fields1, fields2)
+            )
+
+        return value1.value == value2.value
 
     @classmethod
     def same_arguments(cls, arguments1, arguments2):
@@ -918,44 +897,60 @@ class OverlappingFieldsCanBeMerged(ValidationRule):
             # the errors are different, when in-fact they are the same, just that the ordering of the reasons differ.
             ast_and_defs = DefaultOrderedDict(list)
 
-        for selection in selection_set.selections:
-            if isinstance(selection, ast.Field):
-                field_name = selection.name.value
-                field_def = None
-                if isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
-                    field_def = parent_type.get_fields().get(field_name)
-
-                response_name = selection.alias.value if selection.alias else field_name
-                ast_and_defs[response_name].append((selection, field_def))
-
-            elif isinstance(selection, ast.InlineFragment):
-                self.collect_field_asts_and_defs(
-                    type_from_ast(self.context.get_schema(), selection.type_condition),
-                    selection.selection_set,
-                    visited_fragment_names,
-                    ast_and_defs
-                )
+        for response_name, item in self.get_selections(parent_type, selection_set):
+            if response_name is not None:
+                ast_and_defs[response_name].append(item)
+                continue
 
-            elif isinstance(selection, ast.FragmentSpread):
-                fragment_name = selection.name.value
-                if fragment_name in visited_fragment_names:
-                    continue
+            fragment_name = item
+            if fragment_name in visited_fragment_names:
+                continue
 
-                visited_fragment_names.add(fragment_name)
-                fragment = self.context.get_fragment(fragment_name)
+            visited_fragment_names.add(fragment_name)
+            fragment = self.context.get_fragment(fragment_name)
 
-                if not fragment:
-                    continue
+            if not fragment:
+                continue
 
-                self.collect_field_asts_and_defs(
-                    type_from_ast(self.context.get_schema(), fragment.type_condition),
-                    fragment.selection_set,
-                    visited_fragment_names,
-                    ast_and_defs
-                )
+            self.collect_field_asts_and_defs(
+                type_from_ast(self.context.get_schema(), fragment.type_condition),
+                fragment.selection_set,
+                visited_fragment_names,
+                ast_and_defs
+            )
 
         return ast_and_defs
 
+    def get_selections(self, parent_type, selection_set):
+        """Returns the selections of a selection set with inline fragments
+        expanded, in order, as (response name, (field ast, field def))
+        pairs for fields and (None, fragment name) pairs for fragment
+        spreads. Memoized per selection set and parent type."""
+        key = (id(selection_set), parent_type)
+        selections = self.selections_by_selection_set.get(key)
+        if selections is None:
+            selections = self.selections_by_selection_set[key] = []
+            for selection in selection_set.selections:
+                if isinstance(selection, ast.Field):
+                    field_name = selection.name.value
+                    field_def = None
+                    if isinstance(parent_type, (GraphQLObjectType, GraphQLInterfaceType)):
+                        field_def = parent_type.get_fields().get(field_name)
+
+                    response_name = selection.alias.value if selection.alias else field_name
+                    selections.append((response_name, (selection, field_def)))
+
+                elif isinstance(selection, ast.InlineFragment):
+                    selections.extend(self.get_selections(
+                        type_from_ast(self.context.get_schema(), selection.type_condition),
+                        selection.selection_set
+                    ))
+
+                elif isinstance(selection, ast.FragmentSpread):
+                    selections.append((None, selection.name.value))
+
+        return selections
+
     @classmethod
     def fields_conflict_message(cls, reason_name, reason):
         return 'Fields "{}" conflict because {}'.format(reason_name, cls.reason_message(reason))
@@ -990,3 +985,319 @@ class UniqueInputFieldNames(ValidationRule):
     @staticmethod
     def duplicate_input_field_message(field_name):
         return 'There can only be one input field named "{}".'.format(field_name)
+
+
+class QueryCost(ValidationRule):
+    """Rejects operations whose worst-case cost exceeds a budget.
+
+    A field costs its `cost` annotation, or `default_cost`, plus the cost
+    of its selections, times its multiplier. The multiplier of a list
+    field is its `multiplier` annotation when that is a number. Otherwise
+    it is the value of the first of the annotated arguments, or of
+    `multiplier_arguments`, given as an integer literal or as a variable
+    with a default value. Failing that it is `default_list_multiplier`
+    for each level of list. Every fragment and inline fragment is counted,
+    so the cost is an upper bound.
+
+    The budget and defaults are class attributes; use with_options() to
+    make a configured rule, for example QueryCost.with_options(max_cost=500)."""
+
+    max_cost = 1000
+    default_cost = 1
+    default_list_multiplier = 10
+    multiplier_arguments = ('first', 'last', 'limit')
+
+    def enter_OperationDefinition(self, node, *args):
+        cost = self.get_operation_cost(node)
+        if cost > self.max_cost:
+            return GraphQLError(
+                self.operation_too_expensive_message(node.name and node.name.value, cost, self.max_cost),
+                [node]
+            )
+
+        return False
+
+    def get_operation_cost(self, operation, variable_values=None):
+        """Returns the worst-case cost of an operation. Variables take their
+        values from variable_values, or else their defaults."""
+        variables = {}
+        for definition in operation.variable_definitions or ():
+            default_value = definition.default_value
+            if isinstance(default_value, ast.IntValue):
+                variables[definition.variable.name.value] = int(default_value.value)
+        if variable_values:
+            variables.update(variable_values)
+
+        schema = self.context.get_schema()
+        if operation.operation == 'mutation':
+            root_type = schema.get_mutation_type()
+        else:
+            root_type = schema.get_query_type()
+
+        return self.get_selection_set_cost(root_type, operation.selection_set, variables, {})
+
+    def get_selection_set_cost(self, parent_type, selection_set, variables, fragment_costs):
+        """Fragment costs are memoized in fragment_costs, by fragment name.
+        Nested selection sets are costed with an explicit stack."""
+        schema = self.context.get_schema()
+        # Each frame costs a selection set: its parent type, its remaining
+        # selections, its cost so far, and what it is the selection set of:
+        # a field's own cost and multiplier, a fragment name, or None.
+        stack = [[parent_type, iter(selection_set.selections), 0, None]]
+        while True:
+            frame = stack[-1]
+            parent_type = frame[0]
+            for selection in frame[1]:
+                if isinstance(selection, ast.Field):
+                    field_def = get_field_def(schema, parent_type, selection)
+                    if not field_def:
+                        continue
+
+                    cost = getattr(field_def, 'cost', None)
+                    if cost is None:
+                        cost = self.default_cost
+                    multiplier = self.get_multiplier(field_def, selection, variables)
+                    if selection.selection_set:
+                        stack.append([get_named_type(field_def.type), iter(selection.selection_set.selections), 0,
+                                      (cost, multiplier)])
+                        break
+
+                    frame[2] += cost * multiplier
+
+                elif isinstance(selection, ast.InlineFragment):
+                    stack.append([type_from_ast(schema, selection.type_condition),
+                                  iter(selection.selection_set.selections), 0, None])
+                    break
+
+                elif isinstance(selection, ast.FragmentSpread):
+                    fragment_name = selection.name.value
+                    if fragment_name in fragment_costs:
+                        # None while the fragment is being costed: a cycle,
+                        # which NoFragmentCycles reports.
+                        frame[2] += fragment_costs[fragment_name] or 0
+                        continue
+
+                    fragment = self.context.get_fragment(fragment_name)
+                    if not fragment:
+                        continue
+
+                    fragment_costs[fragment_name] = None
+                    stack.append([type_from_ast(schema, fragment.type_condition),
+                                  iter(fragment.selection_set.selections), 0, fragment_name])
+                    break
+
+            else:
+                stack.pop()
+                cost, of = frame[2], frame[3]
+                if isinstance(of, tuple):
+                    cost = (of[0] + cost) * of[1]
+                elif of is not None:
+                    fragment_costs[of] = cost
+
+                if not stack:
+                    return cost
+                stack[-1][2] += cost
+
+    def get_multiplier(self, field_def, field_ast, variables):
+        list_depth = 0
+        type = field_def.type
+        while isinstance(type, (GraphQLList, GraphQLNonNull)):
+            if isinstance(type, GraphQLList):
+                list_depth += 1
+            type = type.of_type
+
+        multiplier = getattr(field_def, 'multiplier', None)
+        if isinstance(multiplier, (int, float)):
+            return multiplier
+
+        if isinstance(multiplier, str_type):
+            argument_names = (multiplier, )
+        else:
+            argument_names = multiplier or (self.multiplier_arguments if list_depth else ())
+
+        for argument in field_ast.arguments or ():
+            if argument.name.value not in argument_names:
+                continue
+
+            value = argument.value
+            if isinstance(value, ast.IntValue):
+                return max(int(value.value), 0)
+            if isinstance(value, ast.Variable) and isinstance(variables.get(value.name.value), int):
+                return max(variables[value.name.value], 0)
+
+        return self.default_list_multiplier ** list_depth
+
+    @staticmethod
+    def operation_too_expensive_message(operation_name, cost, max_cost):
+        if operation_name:
+            return 'Operation "{}" has a cost of {}, which exceeds the maximum of {}.'.format(
+                operation_name, cost, max_cost)
+        return 'The operation has a cost of {}, which exceeds the maximum of {}.'.format(cost, max_cost)
+
+
+class SelectionLimitRule(ValidationRule):
+    """Base for rules that reject operations in which some measure of the
+    selections, such as their depth, exceeds a limit.
+
+    Fragments are measured once each, and their measure is counted at
+    every spread, so a fragment reused many times counts that many
+    times. Measuring stops as soon as the limit is exceeded, and neither
+    deep selections nor long chains of fragments recurse, so these rules
+    are cheap enough to run before the other rules.
+
+    A rule names the class attribute that holds its limit in limit_name,
+    gives the format of its error message in limit_message, and defines
+    measure(selection_set). That returns the measure of a selection set,
+    whose spread fragments are already measured, or any value over the
+    limit once it is exceeded."""
+
+    limit_name = None
+    limit_message = None
+
+    def __init__(self, context):
+        super(SelectionLimitRule, self).__init__(context)
+        self.fragment_measures = {}
+
+    @classmethod
+    def limit_exceeded_message(cls, operation_name, limit):
+        if operation_name:
+            return cls.limit_message.format('Operation "{}"'.format(operation_name), limit)
+        return cls.limit_message.format('The operation', limit)
+
+    def enter_OperationDefinition(self, node, *args):
+        for spread in self.context.get_fragment_spreads(node):
+            self.measure_fragment(spread.name.value)
+
+        limit = getattr(self, self.limit_name)
+        if self.measure(node.selection_set) > limit:
+            return GraphQLError(
+                self.limit_exceeded_message(node.name and node.name.value, limit),
+                [node]
+            )
+
+        return False
+
+    def measure_fragment(self, fragment_name):
+        """Measures a fragment after the fragments it spreads, using an
+        explicit stack. A fragment spread within its own cycle measures 0,
+        the cycle is reported by NoFragmentCycles."""
+        measures = self.fragment_measures
+        in_progress = set()
+        stack = [fragment_name]
+        while stack:
+            name = stack[-1]
+            if name in measures:
+                stack.pop()
+                continue
+
+            fragment = self.context.get_fragment(name)
+            if not fragment:
+                measures[name] = 0
+                stack.pop()
+                continue
+
+            if name not in in_progress:
+                in_progress.add(name)
+                stack.extend(
+                    spread.name.value for spread in self.context.get_fragment_spreads(fragment)
+                    if spread.name.value not in measures and spread.name.value not in in_progress
+                )
+                continue
+
+            measures[name] = self.measure(fragment.selection_set)
+            stack.pop()
+
+
+class MaxDepth(SelectionLimitRule):
+    """Rejects operations whose fields nest deeper than max_depth. Root
+    fields are at depth 1, and fragments add no depth of their own."""
+
+    max_depth = 15
+    limit_name = 'max_depth'
+    limit_message = '{} exceeds the maximum depth of {}.'
+
+    def measure(self, selection_set):
+        limit = self.max_depth
+        fragment_measures = self.fragment_measures
+        deepest = 0
+        stack = [(selection_set, 0)]
+        while stack:
+            selection_set, depth = stack.pop()
+            for selection in selection_set.selections:
+                if isinstance(selection, ast.Field):
+                    selection_depth = depth + 1
+                    if selection.selection_set:
+                        stack.append((selection.selection_set, selection_depth))
+
+                elif isinstance(selection, ast.InlineFragment):
+                    stack.append((selection.selection_set, depth))
+                    continue
+
+                else:
+                    selection_depth = depth + fragment_measures.get(selection.name.value, 0)
+
+                if selection_depth > deepest:
+                    deepest = selection_depth
+                    if deepest > limit:
+                        return deepest
+
+        return deepest
+
+
+class MaxAliases(SelectionLimitRule):
+    """Rejects operations with more than max_aliases aliased fields,
+    counting those in fragments at every spread."""
+
+    max_aliases = 30
+    limit_name = 'max_aliases'
+    limit_message = '{} uses more than {} aliases.'
+
+    def measure(self, selection_set):
+        limit = self.max_aliases
+        fragment_measures = self.fragment_measures
+        count = 0
+        stack = [selection_set]
+        while stack:
+            for selection in stack.pop().selections:
+                if isinstance(selection, ast.Field):
+                    if selection.alias:
+                        count += 1
+                    if selection.selection_set:
+                        stack.append(selection.selection_set)
+
+                elif isinstance(selection, ast.InlineFragment):
+                    stack.append(selection.selection_set)
+
+                else:
+                    count += fragment_measures.get(selection.name.value, 0)
+
+            if count > limit:
+                return count
+
+        return count
+
+
+class MaxRootFields(SelectionLimitRule):
+    """Rejects operations that select more than max_root_fields root
+    fields, counting those in fragments at every spread."""
+
+    max_root_fields = 20
+    limit_name = 'max_root_fields'
+    limit_message = '{} selects more than {} root fields.'
+
+    def measure(self, selection_set):
+        fragment_measures = self.fragment_measures
+        count = 0
+        stack = [selection_set]
+        while stack:
+            for selection in stack.pop().selections:
+                if isinstance(selection, ast.Field):
+                    count += 1
+
+                elif isinstance(selection, ast.InlineFragment):
+                    stack.append(selection.selection_set)
+
+                else:
+                    count += fragment_measures.get(selection.name.value, 0)
+
+        return count
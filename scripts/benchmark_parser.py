@@ -0,0 +1,41 @@
+"""Compares the recursive-descent parser with the explicit-stack parser.
+
+Run from the project root: python scripts/benchmark_parser.py
+"""
+import os.path
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from graphql.core.language.parser import parse  # noqa
+from graphql.core.language.source import Source  # noqa
+
+NESTED_DEPTH = 200
+
+DOCUMENTS = {
+    'kitchen sink': open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'core_language', 'fixtures.py'))
+    .read().split('"""')[1] * 50,
+    'wide query': '{' + ' '.join('f{}(a: [1, 2, {{b: "c"}}]) {{ g h {{ i }} }}'.format(i) for i in range(2000)) + '}',
+    'nested query': '{' + 'a {' * NESTED_DEPTH + 'b' + '}' * NESTED_DEPTH + '}',
+}
+
+MODES = [
+    ('recursive', {}),
+    ('iterative', {'iterative': True}),
+    ('recursive, token buffer', {'token_buffer': True}),
+    ('iterative, token buffer', {'iterative': True, 'token_buffer': True}),
+]
+
+
+def main(number=10):
+    for name, body in sorted(DOCUMENTS.items()):
+        source = Source(body)
+        print('{} ({} chars)'.format(name, len(body)))
+        for mode, options in MODES:
+            best = min(timeit.repeat(lambda: parse(source, **options), number=number, repeat=5))
+            print('  {:<26} {:8.2f} ms'.format(mode, best / number * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -33,10 +33,80 @@ class Printer(object):
     def start_file(self):
         print '''# This is autogenerated code. DO NOT change this manually.
 # Run scripts/generate_ast.py to generate this file.
+from copy import deepcopy
 
 
 class Node(object):
-    pass'''
+    _kind = None
+    _fields = ()
+
+    def __eq__(self, other):
+        return nodes_equal(self, other)
+
+    def __hash__(self):
+        # Structural and location-insensitive, so equal nodes hash equally.
+        # Cached: a node must not be mutated once it has been hashed.
+        try:
+            return self._hash
+        except AttributeError:
+            return node_hash(self)
+
+
+def nodes_equal(node, other):
+    """Compares two nodes field by field, locations included, using an
+    explicit stack so deeply nested documents compare without recursion."""
+    stack = [(node, other)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+
+        if isinstance(a, Node):
+            if not isinstance(b, Node) or a._kind != b._kind or a.loc != b.loc:
+                return False
+            for name in a._fields:
+                stack.append((getattr(a, name), getattr(b, name)))
+
+        elif isinstance(a, list):
+            if not isinstance(b, list) or len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+
+        elif a != b:
+            return False
+
+    return True
+
+
+def node_hash(node):
+    """Hashes a node and its descendants that have no cached hash yet,
+    children first, using an explicit stack so deeply nested documents hash
+    without recursion."""
+    unhashed = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if hasattr(current, '_hash'):
+            continue
+
+        unhashed.append(current)
+        for name in current._fields:
+            value = getattr(current, name)
+            if isinstance(value, Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(value)
+
+    # Every node comes after its descendants here, whose hashes are cached
+    # by the time it is hashed.
+    for current in reversed(unhashed):
+        values = [current._kind]
+        for name in current._fields:
+            value = getattr(current, name)
+            values.append(tuple(value) if isinstance(value, list) else value)
+        current._hash = hash(tuple(values))
+
+    return node._hash'''
 
     def end_file(self):
         pass
@@ -54,15 +124,22 @@ class {name}({parent_type}):'''.format(name=name, parent_type=parent_type)
 
     def end_type(self, typename):
         typename = remap_type(typename)
-        self._print_slots()
+        self._print_slots(typename)
         self._print_ctor()
-        self._print_comparator(typename)
+        self._print_copy()
+        self._print_deepcopy()
         self._print_repr(typename)
         self._fields = []
 
-    def _print_slots(self):
-        slots = ', '.join("'" + snake(name) + "'" for (type, name, nullable, plural) in self._fields)
-        print '''    __slots__ = ('loc', {slots})'''.format(slots=slots)
+    def _print_slots(self, typename):
+        names = [snake(name) for (type, name, nullable, plural) in self._fields]
+        fields = ', '.join("'" + name + "'" for name in names) + (',' if len(names) == 1 else '')
+        # Documents also cache their document_key().
+        cached = "'_hash', '_key'" if typename == 'Document' else "'_hash'"
+        print '''    __slots__ = ('loc', {slots}, {cached})
+    _kind = '{typename}'
+    _fields = ({fields})'''.format(slots=', '.join("'" + name + "'" for name in names), cached=cached,
+                                   typename=typename, fields=fields)
 
     def _print_ctor(self):
         fields = (
@@ -75,17 +152,23 @@ class {name}({parent_type}):'''.format(name=name, parent_type=parent_type)
         for type, name, nullable, plural in self._fields:
             print '''        self.{name} = {name}'''.format(name=snake(name))
 
-    def _print_comparator(self, typename):
+    def _print_copy(self):
         print '''
-    def __eq__(self, other):
-        return (
-            isinstance(other, {typename}) and
-            self.loc == other.loc and'''.format(typename=typename)
-        print ' and\n'.join(
-            '''            self.{name} == other.{name}'''.format(name=snake(name))
-            for type, name, nullable, plural in self._fields
-        )
-        print '        )'
+    def __copy__(self):
+        return type(self)('''
+        for type, name, nullable, plural in self._fields:
+            print '''            {name}=self.{name},'''.format(name=snake(name))
+        print '''            loc=self.loc
+        )'''
+
+    def _print_deepcopy(self):
+        print '''
+    def __deepcopy__(self, memo):
+        return type(self)('''
+        for type, name, nullable, plural in self._fields:
+            print '''            {name}=deepcopy(self.{name}, memo),'''.format(name=snake(name))
+        print '''            loc=self.loc
+        )'''
 
     def _print_repr(self, typename):
         print '''
@@ -273,4 +273,56 @@ def test_deferred_exception_catch():
     deferred = Deferred()
     deferred.add_errback(dummy_errback)
     deferred.errback(OSError())
-    assert deferred.result == 'caught'
\ No newline at end of file
+    assert deferred.result == 'caught'
+
+
+def test_long_chain_of_deferreds_resolves_without_recursion():
+    first = Deferred()
+    last = first
+    for i in range(10000):
+        d = Deferred()
+        d.callback(last)
+        d.add_callback(lambda r: r + 1)
+        last = d
+
+    first.callback(0)
+    assert last.result == 10000
+    assert not last.paused
+
+
+def test_waiting_deferred_resumes_before_remaining_callbacks():
+    order = []
+    d = Deferred()
+    d.add_callback(lambda r: order.append(('before', r)) or r)
+    waiting = Deferred()
+    waiting.callback(d)
+    waiting.add_callback(lambda r: order.append(('waiting', r)))
+    d.add_callback(lambda r: order.append(('after', r)) or r)
+
+    d.callback(1)
+    assert order == [('before', 1), ('waiting', 1), ('after', 1)]
+
+
+def test_deferred_exception_without_traceback():
+    DeferredException.capture_tracebacks = False
+    try:
+        d = Deferred()
+        d.add_callback(lambda r: 1 / r)
+        d.callback(0)
+    finally:
+        DeferredException.capture_tracebacks = True
+
+    assert d.result.type is ZeroDivisionError
+    assert d.result.traceback is None
+    with raises(ZeroDivisionError):
+        d.result.raise_exception()
+
+    d = Deferred()
+    d.add_callback(lambda r: 1 / r)
+    d.callback(0)
+    assert d.result.traceback is not None
+
+
+def test_deferreds_have_no_instance_dict():
+    for d in (Deferred(), DeferredList([]), DeferredDict({}), DeferredException(Exception())):
+        assert not hasattr(d, '__dict__')
@@ -0,0 +1,88 @@
+from graphql.core import graphql
+from graphql.core.cache import DocumentCache, LRUCache, ValidationCache
+from graphql.core.execution import Executor
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from graphql.core.language import parser
+from graphql.core.type import GraphQLSchema, GraphQLObjectType, GraphQLField, GraphQLString
+
+schema = GraphQLSchema(
+    query=GraphQLObjectType(
+        name='Query',
+        fields={
+            'a': GraphQLField(GraphQLString, resolver=lambda *_: 'Apple'),
+        }
+    )
+)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+
+def test_lru_cache_respects_memory_budget():
+    cache = LRUCache(max_size=None, max_memory=10, get_size=len)
+    cache.set('a', 'xxxx')
+    cache.set('b', 'yyyy')
+    cache.set('c', 'zzzz')
+    assert 'a' not in cache
+    assert cache.memory == 8
+    cache.set('d', 'x' * 11)
+    assert 'd' not in cache
+    assert cache.memory == 8
+
+
+def test_document_cache_skips_parsing_on_hit(monkeypatch):
+    cache = DocumentCache()
+    document = cache.parse('{ a }')
+    monkeypatch.setattr(parser, 'parse_document', None)
+    assert cache.parse('{ a }') is document
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.memory == 0
+
+
+def test_document_cache_tracks_memory():
+    cache = DocumentCache(max_memory=10 ** 6)
+    cache.parse('{ a }')
+    assert 0 < cache.memory < 10 ** 6
+
+
+def test_executor_uses_document_cache():
+    cache = DocumentCache()
+    executor = Executor(schema, [SynchronousExecutionMiddleware()], document_cache=cache)
+    assert executor.execute('{ a }').data == {'a': 'Apple'}
+    assert executor.execute('{ a }').data == {'a': 'Apple'}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_graphql_uses_document_cache():
+    cache = DocumentCache()
+    assert graphql(schema, '{ a }', document_cache=cache).data == {'a': 'Apple'}
+    assert graphql(schema, '{ a }', document_cache=cache).data == {'a': 'Apple'}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_executor_uses_validation_cache():
+    cache = ValidationCache()
+    executor = Executor(schema, [SynchronousExecutionMiddleware()], document_cache=DocumentCache(),
+                        validation_cache=cache)
+    assert executor.execute('{ a }').data == {'a': 'Apple'}
+    assert executor.execute('{ a }').data == {'a': 'Apple'}
+    assert executor.execute('{ b }').invalid
+    assert executor.execute('{ b }').invalid
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_graphql_uses_validation_cache():
+    cache = ValidationCache()
+    assert graphql(schema, '{ a }', validation_cache=cache).data == {'a': 'Apple'}
+    assert graphql(schema, '{ a }', validation_cache=cache).data == {'a': 'Apple'}
+    assert (cache.hits, cache.misses) == (1, 1)
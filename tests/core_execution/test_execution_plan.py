@@ -0,0 +1,188 @@
+from graphql.core.cache import DocumentCache, PlanCache, ValidationCache
+from graphql.core.error import format_error
+from graphql.core.execution import ExecutionPlan, Executor
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from graphql.core.language import fingerprint
+from graphql.core.language.parser import parse
+from graphql.core.type import (GraphQLArgument, GraphQLField, GraphQLInt, GraphQLInterfaceType, GraphQLList,
+                               GraphQLNonNull, GraphQLObjectType, GraphQLSchema, GraphQLString)
+from pytest import raises
+
+
+class Item(object):
+    def __init__(self, id):
+        self.id = id
+
+
+Named = GraphQLInterfaceType('Named', {
+    'name': GraphQLField(GraphQLString),
+}, resolve_type=lambda item: ItemType)
+
+ItemType = GraphQLObjectType('Item', lambda: {
+    'id': GraphQLField(GraphQLInt),
+    'name': GraphQLField(GraphQLString, resolver=lambda item, *_: 'item {}'.format(item.id)),
+    'children': GraphQLField(GraphQLList(ItemType), {
+        'count': GraphQLArgument(GraphQLInt, default_value=2),
+    }, resolver=lambda item, args, *_: [Item(item.id * 10 + i) for i in range(args['count'])]),
+    'broken': GraphQLField(GraphQLString, resolver=lambda *_: raise_error()),
+    'required': GraphQLField(GraphQLNonNull(GraphQLString), resolver=lambda *_: None),
+}, interfaces=[Named])
+
+
+def raise_error():
+    raise Exception('broken')
+
+
+schema = GraphQLSchema(
+    query=GraphQLObjectType('Query', {
+        'item': GraphQLField(ItemType, {
+            'id': GraphQLArgument(GraphQLInt),
+        }, resolver=lambda root, args, *_: Item(args['id'])),
+        'named': GraphQLField(Named, resolver=lambda *_: Item(7)),
+    }),
+    mutation=GraphQLObjectType('Mutation', {
+        'first': GraphQLField(GraphQLInt, resolver=lambda root, *_: root.append(1) or len(root)),
+        'second': GraphQLField(GraphQLInt, resolver=lambda root, *_: root.append(2) or len(root)),
+    })
+)
+
+QUERY = '''
+query Q($id: Int, $count: Int, $skip: Boolean!) {
+    item(id: $id) {
+        ...ItemFields
+        children(count: $count) { id name @skip(if: $skip) children { id } }
+    }
+    literal: item(id: 3) { id children(count: 1) { ... on Named { name } } }
+    named { name ... on Item { id broken } }
+    nothing: item(id: 4) @include(if: false) { id }
+    error: item(id: 5) { required }
+}
+fragment ItemFields on Item { id name }
+'''
+
+
+def execute(request, args=None, **kwargs):
+    executor = Executor(schema, [SynchronousExecutionMiddleware()], **kwargs)
+    result = executor.execute(request, args=args)
+    return result.data, [format_error(error) for error in result.errors or []]
+
+
+def test_plans_execute_like_documents():
+    document = parse(QUERY)
+    plan = ExecutionPlan(schema, document)
+    for args in ({'id': 1, 'skip': False}, {'id': 2, 'count': 3, 'skip': True}):
+        assert execute(plan, args) == execute(document, args)
+
+
+def test_plans_are_reused_across_requests():
+    document = parse('{ item(id: 1) { children { id } } }')
+    plan = ExecutionPlan(schema, document)
+    execute(plan)
+    compiled = dict(plan._field_plans)
+    assert len(compiled) == 3
+    assert execute(plan) == ({'item': {'children': [{'id': 10}, {'id': 11}]}}, [])
+    assert plan._field_plans == compiled
+
+
+def test_plans_hold_literal_arguments():
+    plan = ExecutionPlan(schema, parse('query Q($id: Int) { a: item(id: 1) { id } b: item(id: $id) { id } }'))
+    execute(plan, {'id': 2})
+    (_, a), (_, b) = plan._field_plans[None, schema.get_query_type()]
+    assert a.args == {'id': 1}
+    assert b.args is None
+
+
+def test_collects_fields_per_request_when_directives_use_variables():
+    plan = ExecutionPlan(schema, parse('query Q($skip: Boolean!) { item(id: 1) { id name @skip(if: $skip) } }'))
+    assert execute(plan, {'skip': True}) == ({'item': {'id': 1}}, [])
+    assert execute(plan, {'skip': False}) == ({'item': {'id': 1, 'name': 'item 1'}}, [])
+
+
+def test_executes_mutation_plans_serially():
+    plan = ExecutionPlan(schema, parse('mutation M { first second again: first }'))
+    executor = Executor(schema, [SynchronousExecutionMiddleware()])
+    assert executor.execute(plan, root=[0]).data == {'first': 2, 'second': 3, 'again': 4}
+
+
+def test_rejects_unknown_operations():
+    with raises(Exception) as excinfo:
+        ExecutionPlan(schema, parse('query A { named { name } }'), 'B')
+    assert str(excinfo.value) == 'Unknown operation name: B'
+
+
+def test_executor_uses_plan_cache():
+    cache = PlanCache()
+    for args in ({'id': 1, 'skip': False}, {'id': 2, 'skip': True}):
+        assert execute(QUERY, args, plan_cache=cache) == execute(QUERY, args)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_warm_requests_do_not_walk_the_document(monkeypatch):
+    walks = []
+    original = fingerprint.fingerprint
+    monkeypatch.setattr(fingerprint, 'fingerprint', lambda node: walks.append(node) or original(node))
+    caches = dict(document_cache=DocumentCache(), validation_cache=ValidationCache(), plan_cache=PlanCache())
+    args = {'id': 1, 'skip': False}
+    expected = execute(QUERY, args)
+
+    assert execute(QUERY, args, **caches) == expected
+    assert len(walks) == 1
+    for i in range(2):
+        assert execute(QUERY, args, **caches) == expected
+    assert len(walks) == 1
+    assert caches['plan_cache'].hits == 2
+
+    # A newly parsed document is walked once, for validation and planning.
+    del caches['document_cache']
+    assert execute(parse(QUERY), args, **caches) == expected
+    assert len(walks) == 2
+
+
+def test_plan_cache_keys_deeply_nested_documents():
+    cache = PlanCache()
+    source = '{ item(id: 1) { ' + 'children { ' * 300 + 'id' + ' }' * 302
+    plan = cache.get_plan(schema, parse(source, iterative=True))
+    assert cache.get_plan(schema, parse(source, iterative=True)) is plan
+
+    plan = cache.get_plan(schema, parse(source, no_location=True, iterative=True))
+    assert cache.get_plan(schema, parse(source, no_location=True, iterative=True)) is plan
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_validates_plans_passed_as_the_request():
+    plan = ExecutionPlan(schema, parse('{ item(id: 1) { id unknown } }'))
+    executor = Executor(schema, [SynchronousExecutionMiddleware()])
+    result = executor.execute(plan)
+    assert result.invalid
+    assert [error.message for error in result.errors] == ['Cannot query field "unknown" on "Item".']
+
+    assert executor.execute(plan, validate_ast=False).data == {'item': {'id': 1}}
+
+
+def test_plans_passed_as_the_request_reject_other_operation_names():
+    plan = ExecutionPlan(schema, parse('query A { item(id: 1) { id } } query B { named { name } }'), 'A')
+    executor = Executor(schema, [SynchronousExecutionMiddleware()])
+    assert executor.execute(plan, operation_name='A').data == {'item': {'id': 1}}
+    with raises(AssertionError) as excinfo:
+        executor.execute(plan, operation_name='B')
+    assert str(excinfo.value) == 'The plan was compiled for another operation.'
+
+
+def test_plan_cache_does_not_share_plans_with_edited_documents():
+    from graphql.core.language import ast
+    from graphql.core.language.visitor import Visitor, visit
+
+    class Alias(Visitor):
+        def enter_Field(self, node, *args):
+            if not node.alias and node.name.value == 'id':
+                return ast.Field(name=node.name, alias=ast.Name(value='key'), loc=node.loc)
+
+    cache = PlanCache()
+    document = parse('{ item(id: 1) { id } }')
+    executor = Executor(schema, [SynchronousExecutionMiddleware()], plan_cache=cache)
+    assert executor.execute(document).data == {'item': {'id': 1}}
+
+    edited = visit(document, Alias())
+    assert edited.loc == document.loc
+    assert executor.execute(edited).data == {'item': {'key': 1}}
+    assert cache.hits == 0
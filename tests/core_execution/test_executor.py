@@ -1,8 +1,8 @@
 from pytest import raises
-from graphql.core.execution import execute
+from graphql.core.execution import ExecutionPlan, SynchronousExecutor, execute
 from graphql.core.language.parser import parse
 from graphql.core.type import (GraphQLSchema, GraphQLObjectType, GraphQLField,
-    GraphQLArgument, GraphQLList, GraphQLInt, GraphQLString)
+    GraphQLArgument, GraphQLList, GraphQLInt, GraphQLString, GraphQLInputObjectType, GraphQLInputObjectField)
 from graphql.core.error import GraphQLError
 
 
@@ -343,3 +343,78 @@ def test_does_not_include_illegal_fields_in_output():
     result = execute(GraphQLSchema(Q, M), None, ast)
     assert not result.errors
     assert result.data == {}
+
+
+def test_collects_list_item_fields_once(monkeypatch):
+    from graphql.core.execution import base
+
+    calls = []
+    collect_fields = base.collect_fields
+
+    def counting_collect_fields(ctx, type, selection_set, fields, prev_fragment_names):
+        calls.append(type.name)
+        return collect_fields(ctx, type, selection_set, fields, prev_fragment_names)
+
+    monkeypatch.setattr(base, 'collect_fields', counting_collect_fields)
+
+    Item = GraphQLObjectType('Item', {
+        'a': GraphQLField(GraphQLString, resolver=lambda *_: 'a'),
+        'b': GraphQLField(GraphQLString, resolver=lambda *_: 'b'),
+    })
+    schema = GraphQLSchema(GraphQLObjectType('Query', {
+        'items': GraphQLField(GraphQLList(Item), resolver=lambda *_: range(100)),
+    }))
+    ast = parse('query Q($skip: Boolean!) { items { a b @skip(if: $skip) ... on Item { a } } }')
+
+    result = execute(schema, None, ast, 'Q', {'skip': True})
+    assert not result.errors
+    assert result.data == {'items': [{'a': 'a'}] * 100}
+    assert calls == ['Item', 'Item']
+
+
+def test_computes_argument_values_once_and_copies_them_per_resolver_call(monkeypatch):
+    from graphql.core.execution import base
+
+    calls = []
+    get_argument_values = base.get_argument_values
+    monkeypatch.setattr(base, 'get_argument_values',
+                        lambda *args: calls.append(len(args[0])) or get_argument_values(*args))
+    options = []
+
+    def resolve_size(item, args, info):
+        options.append(args['options'])
+        size = args.pop('size') * item + args['options']['scale'] + len(args['options']['tags'])
+        args['options']['scale'] = 0
+        args['options']['tags'].append(item)
+        return size
+
+    Options = GraphQLInputObjectType('Options', {
+        'scale': GraphQLInputObjectField(GraphQLInt),
+        'tags': GraphQLInputObjectField(GraphQLList(GraphQLInt)),
+    })
+    Item = GraphQLObjectType('Item', {
+        'size': GraphQLField(GraphQLInt, {
+            'size': GraphQLArgument(GraphQLInt),
+            'options': GraphQLArgument(Options),
+        }, resolver=resolve_size),
+    })
+    schema = GraphQLSchema(GraphQLObjectType('Query', {
+        'items': GraphQLField(GraphQLList(Item), resolver=lambda *_: range(3)),
+    }))
+    ast = parse('query Q($size: Int) { items { size(size: $size, options: {scale: 10, tags: []}) } }')
+
+    result = execute(schema, None, ast, 'Q', {'size': 2})
+    assert not result.errors
+    assert result.data == {'items': [{'size': 10}, {'size': 12}, {'size': 14}]}
+    assert calls == [0, 2]
+    # Changes a resolver makes to its input objects and lists stay in its own copy.
+    assert options == [{'scale': 0, 'tags': [0]}, {'scale': 0, 'tags': [1]}, {'scale': 0, 'tags': [2]}]
+
+    plan = ExecutionPlan(schema, ast, 'Q')
+    for i in range(3):
+        assert SynchronousExecutor(schema).execute(plan, args={'size': 2}).data == result.data
+
+    # Literal arguments are kept on the plan, and shared by its requests.
+    plan = ExecutionPlan(schema, parse('{ items { size(size: 2, options: {scale: 10, tags: []}) } }'))
+    for i in range(3):
+        assert SynchronousExecutor(schema).execute(plan).data == result.data
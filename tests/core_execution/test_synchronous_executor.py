@@ -0,0 +1,125 @@
+from graphql.core.defer import Deferred, succeed
+from graphql.core.error import GraphQLError, format_error
+from graphql.core.execution import ExecutionPlan, Executor, SynchronousExecutor
+from graphql.core.execution.middlewares.sync import SynchronousExecutionMiddleware
+from graphql.core.language.parser import parse
+from graphql.core.type import (GraphQLField, GraphQLInt, GraphQLInterfaceType, GraphQLList, GraphQLNonNull,
+                               GraphQLObjectType, GraphQLSchema, GraphQLString)
+from pytest import mark
+
+
+def throw(*_):
+    raise Exception('thrown')
+
+
+class Node(object):
+    def __init__(self, depth=0):
+        self.depth = depth
+
+    def child(self):
+        return Node(self.depth + 1)
+
+    def children(self):
+        return [Node(self.depth + 1), None, Node(self.depth + 1)]
+
+
+Named = GraphQLInterfaceType('Named', {
+    'depth': GraphQLField(GraphQLInt),
+}, resolve_type=lambda value: NodeType)
+
+NodeType = GraphQLObjectType('Node', lambda: {
+    'depth': GraphQLField(GraphQLInt),
+    'nullable': GraphQLField(GraphQLString, resolver=lambda *_: None),
+    'throws': GraphQLField(GraphQLString, resolver=throw),
+    'nonNullThrows': GraphQLField(GraphQLNonNull(GraphQLString), resolver=throw),
+    'nonNullNull': GraphQLField(GraphQLNonNull(GraphQLString), resolver=lambda *_: None),
+    'returnsError': GraphQLField(GraphQLString, resolver=lambda *_: ValueError('returned')),
+    'deferred': GraphQLField(GraphQLString, resolver=lambda *_: succeed('deferred')),
+    'child': GraphQLField(NodeType),
+    'nonNullChild': GraphQLField(GraphQLNonNull(NodeType), resolver=lambda node, *_: node.child()),
+    'children': GraphQLField(GraphQLList(NodeType)),
+    'nonNullChildren': GraphQLField(GraphQLList(GraphQLNonNull(NodeType)), resolver=lambda node, *_: node.children()),
+    'notIterable': GraphQLField(GraphQLList(GraphQLInt), resolver=lambda *_: 1),
+    'named': GraphQLField(Named, resolver=lambda node, *_: node.child()),
+}, interfaces=[Named])
+
+schema = GraphQLSchema(
+    query=NodeType,
+    mutation=GraphQLObjectType('Mutation', {
+        'first': GraphQLField(GraphQLInt, resolver=lambda root, *_: root.append(1) or len(root)),
+        'fails': GraphQLField(GraphQLNonNull(GraphQLInt), resolver=throw),
+        'second': GraphQLField(GraphQLInt, resolver=lambda root, *_: root.append(2) or len(root)),
+    })
+)
+
+QUERIES = [
+    '{ depth nullable throws returnsError }',
+    '{ child { depth nonNullThrows } throws }',
+    '{ child { nonNullChild { nonNullNull } } depth }',
+    '{ nonNullChild { nonNullChild { nonNullThrows } } }',
+    '{ nonNullNull }',
+    '{ children { depth throws } nonNullChildren { depth } }',
+    '{ child { nonNullChildren { nonNullThrows } } }',
+    '{ notIterable }',
+    '{ named { depth ... on Node { throws child { depth } } } }',
+    'query Q($skip: Boolean!) { child { depth @skip(if: $skip) throws @include(if: $skip) } }',
+    '{ unknown }',
+    'query A { depth } query B { throws }',
+]
+
+
+def describe_error(error):
+    if isinstance(error, GraphQLError):
+        return format_error(error)
+    return type(error).__name__, str(error)
+
+
+def run(executor, request, **kwargs):
+    result = executor.execute(request, **kwargs)
+    return result.data, [describe_error(error) for error in result.errors or []], result.invalid
+
+
+@mark.parametrize('query', QUERIES)
+def test_matches_the_deferred_executor(query):
+    kwargs = dict(root=Node(), args={'skip': True}, operation_name='B' if 'query B' in query else None)
+    expected = run(Executor(schema, [SynchronousExecutionMiddleware()]), query, **kwargs)
+    assert run(SynchronousExecutor(schema), query, **kwargs) == expected
+    if not expected[2]:
+        plan = ExecutionPlan(schema, parse(query), kwargs['operation_name'])
+        assert run(SynchronousExecutor(schema), plan, **kwargs) == expected
+
+
+@mark.parametrize('query', ['mutation M { first second }', 'mutation M { first fails second }'])
+def test_executes_mutations_serially(query):
+    expected = run(Executor(schema, [SynchronousExecutionMiddleware()]), query, root=[0])
+    assert run(SynchronousExecutor(schema), query, root=[0]) == expected
+
+
+def test_rejects_deferred_results_like_the_middleware():
+    result = SynchronousExecutor(schema).execute('{ deferred depth }', Node())
+    assert result.data == {'deferred': None, 'depth': 0}
+    assert run(SynchronousExecutor(schema), '{ deferred depth }', root=Node()) == \
+        run(Executor(schema, [SynchronousExecutionMiddleware()]), '{ deferred depth }', root=Node())
+
+
+def test_never_creates_deferreds(monkeypatch):
+    def no_deferreds(*args, **kwargs):
+        raise AssertionError('A Deferred was created.')
+
+    monkeypatch.setattr(Deferred, '__init__', no_deferreds)
+    result = SynchronousExecutor(schema).execute('{ child { depth throws nonNullChild { depth } } }', Node())
+    assert result.data == {'child': {'depth': 1, 'throws': None, 'nonNullChild': {'depth': 2}}}
+    assert [error.message for error in result.errors] == ['thrown']
+
+
+def test_runs_resolver_middlewares():
+    calls = []
+
+    class RecordingMiddleware(object):
+        def run_resolve_fn(self, resolver, original_resolver):
+            calls.append(original_resolver)
+            return resolver()
+
+    result = SynchronousExecutor(schema, [RecordingMiddleware()]).execute('{ child { depth } }', Node())
+    assert result.data == {'child': {'depth': 1}}
+    assert len(calls) == 2
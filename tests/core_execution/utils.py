@@ -8,7 +8,7 @@ class RaisingDeferred(Deferred):
             return
         while self.callbacks:
             # Get the next callback pair
-            next_pair = self.callbacks.pop(0)
+            next_pair = self.callbacks.popleft()
             # Continue with the errback if the last result was an exception
             callback, args, kwargs = next_pair[isinstance(self.result,
                                                           DeferredException)]
@@ -0,0 +1,148 @@
+import copy
+import mmap
+import sys
+import tempfile
+import threading
+
+from pytest import raises
+from graphql.core.language import ast
+from graphql.core.language.binary import LAZY_CLASSES, dump, load
+from graphql.core.language.parser import parse
+from graphql.core.language.printer import print_ast
+from graphql.core.language.source import Source
+from graphql.core.language.visitor import QUERY_DOCUMENT_KEYS, Visitor, visit
+from fixtures import KITCHEN_SINK
+
+
+def test_round_trips_kitchen_sink():
+    document = parse(KITCHEN_SINK)
+    assert load(dump(document)) == document
+    assert print_ast(load(dump(document))) == print_ast(document)
+
+
+def test_dumps_loaded_documents():
+    document = parse(KITCHEN_SINK)
+    buffer = dump(document)
+    assert dump(load(buffer)) == buffer
+    assert load(dump(load(buffer))) == document
+
+    # Partly decoded documents dump the same.
+    loaded = load(buffer)
+    loaded.definitions[0].selection_set
+    assert dump(loaded) == buffer
+
+
+def test_round_trips_deeply_nested_documents():
+    document = parse('{' + 'a{' * 200 + 'b' + '}' * 201)
+    assert load(dump(document)) == document
+
+    document = parse('{' + 'a{' * 3000 + 'b' + '}' * 3001, iterative=True)
+    buffer = dump(document)
+    assert load(buffer) == document
+    assert dump(load(buffer)) == buffer
+
+
+def test_round_trips_without_source_or_location():
+    document = parse(KITCHEN_SINK)
+    loaded = load(dump(document, include_source=False))
+    assert loaded.loc.source is None
+    assert loaded.loc.start == document.loc.start
+
+    document = parse(KITCHEN_SINK, no_location=True)
+    assert load(dump(document)) == document
+
+
+def test_loaded_locations_share_one_source():
+    source = Source('{ a }', 'Query.graphql')
+    loaded = load(dump(parse(source)))
+    field = loaded.definitions[0].selection_set.selections[0]
+    assert field.loc.source == source
+    assert field.loc.source is loaded.loc.source
+
+
+def test_decodes_nodes_only_when_read():
+    loaded = load(dump(parse('{ a { b } }')))
+    assert type(loaded) is not ast.Document
+    assert isinstance(loaded, ast.Document)
+
+    operation = loaded.definitions[0]
+    assert type(loaded) is ast.Document
+    assert type(operation) is not ast.OperationDefinition
+
+    assert operation.operation == 'query'
+    assert type(operation) is ast.OperationDefinition
+    assert type(operation.selection_set) is not ast.SelectionSet
+
+
+def test_visits_undecoded_nodes():
+    class FieldNames(Visitor):
+        def __init__(self):
+            self.names = []
+
+        def enter_Field(self, node, *args):
+            self.names.append(node.name.value)
+
+    visitor = FieldNames()
+    visit(load(dump(parse('{ a { b } c }'))), visitor)
+    assert visitor.names == ['a', 'b', 'c']
+
+
+def test_copies_undecoded_nodes():
+    document = parse('{ a }')
+    assert copy.copy(load(dump(document))) == document
+    assert copy.deepcopy(load(dump(document))) == document
+
+
+def test_loads_from_mmap():
+    document = parse(KITCHEN_SINK)
+    with tempfile.TemporaryFile() as fp:
+        fp.write(dump(document))
+        fp.flush()
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            assert load(buffer) == document
+        finally:
+            buffer.close()
+
+
+def test_rejects_other_buffers():
+    with raises(ValueError):
+        load(b'\0' * 64)
+    with raises(ValueError):
+        load(b'GQLD')
+
+
+def test_decodes_nodes_safely_from_several_threads():
+    buffer = dump(parse(KITCHEN_SINK))
+    expected = print_ast(parse(KITCHEN_SINK))
+    # Switch threads as often as possible; Python 2 counts instructions.
+    if hasattr(sys, 'setswitchinterval'):
+        get_interval, set_interval, shortest = sys.getswitchinterval, sys.setswitchinterval, 1e-6
+    else:
+        get_interval, set_interval, shortest = sys.getcheckinterval, sys.setcheckinterval, 1
+    interval = get_interval()
+    set_interval(shortest)
+    try:
+        for _ in range(20):
+            document = load(buffer)
+            results = []
+
+            def read():
+                try:
+                    results.append(print_ast(document))
+                except Exception as e:
+                    results.append(e)
+
+            threads = [threading.Thread(target=read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert results == [expected] * 4
+    finally:
+        set_interval(interval)
+
+
+def test_visitor_tables_are_not_patched_for_lazy_classes():
+    assert not any(lazy_cls in QUERY_DOCUMENT_KEYS for lazy_cls in LAZY_CLASSES.values())
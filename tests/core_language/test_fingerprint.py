@@ -0,0 +1,80 @@
+import copy
+
+from graphql.core.language.binary import dump, load
+from graphql.core.language import fingerprint as fingerprint_module
+from graphql.core.language.fingerprint import document_key, fingerprint
+from graphql.core.language.parser import parse
+from fixtures import KITCHEN_SINK
+
+
+def test_equivalent_documents_hash_equally():
+    a = parse('{ a(b: 1) { c } }')
+    b = parse('''
+        # comment
+        {
+          a(b: 1) {
+            c
+          }
+        }
+    ''')
+    assert hash(a) == hash(b)
+    assert hash(parse(KITCHEN_SINK)) == hash(parse(KITCHEN_SINK, no_location=True))
+    assert len(set([a, parse('{ a(b: 1) { c } }')])) == 1
+
+
+def test_documents_can_be_dict_keys():
+    document = parse(KITCHEN_SINK)
+    cache = {document: 'value'}
+    assert cache[parse(KITCHEN_SINK)] == 'value'
+
+
+def test_hash_depends_on_structure():
+    assert hash(parse('{ a(b: 1) }')) != hash(parse('{ a(b: 2) }'))
+    assert hash(parse('{ a(b: true) }')) != hash(parse('{ a(b: "true") }'))
+
+
+def test_copies_do_not_share_cached_hash():
+    document = parse('{ a }')
+    hash(document)
+    field = document.definitions[0].selection_set.selections[0]
+    hash(field)
+    copied = copy.copy(field)
+    copied.name = parse('{ b }').definitions[0].selection_set.selections[0].name
+    assert hash(copied) == hash(parse('{ b }').definitions[0].selection_set.selections[0])
+    assert copy.deepcopy(document) == document
+
+
+def test_fingerprint_ignores_locations():
+    assert fingerprint(parse('{ a, b }')) == fingerprint(parse('{\n  a\n  b\n}\n'))
+    assert fingerprint(parse(KITCHEN_SINK)) == fingerprint(parse(KITCHEN_SINK, no_location=True))
+    assert fingerprint(load(dump(parse(KITCHEN_SINK)))) == fingerprint(parse(KITCHEN_SINK))
+
+
+def test_fingerprint_is_stable():
+    assert fingerprint(parse('{ a }')) == 'c75c43b827d51b848e485c5314452542a270857268d7e9dd744b2a213be55707'
+
+
+def test_document_key_is_computed_once_per_document(monkeypatch):
+    calls = []
+    monkeypatch.setattr(fingerprint_module, 'fingerprint', lambda node: calls.append(node) or fingerprint(node))
+    document = parse('{ a }')
+    key = document_key(document)
+    assert document_key(document) is key
+    assert calls == [document]
+
+    assert document_key(parse('{ a }')) == key
+    assert document_key(copy.copy(document)) == key
+    assert len(calls) == 3
+
+    loaded = load(dump(document))
+    assert document_key(loaded) == document_key(loaded) == key
+    assert len(calls) == 4
+
+
+def test_deeply_nested_documents_hash_and_compare_without_recursion():
+    source = '{' + 'a {' * 2000 + 'b' + '}' * 2001
+    document = parse(source, iterative=True)
+    other = parse(source, iterative=True)
+    assert hash(document) == hash(other)
+    assert document == parse(source, iterative=True)
+    assert document != parse(source.replace('b', 'c'), iterative=True)
@@ -0,0 +1,76 @@
+from pytest import mark, raises
+from graphql.core.language import lexer
+from graphql.core.language.error import LanguageError
+from graphql.core.language.source import Source
+from graphql.core.language.lexer import Lexer, TokenKind, read_token, scan_token, tokenize
+from fixtures import KITCHEN_SINK
+import test_lexer
+
+LEXER_TESTS = sorted(
+    (name, fn) for name, fn in vars(test_lexer).items()
+    if name.startswith('test_')
+)
+
+
+@mark.parametrize('name,test', LEXER_TESTS)
+def test_lexer_tests_pass_with_reference_scanner(monkeypatch, name, test):
+    monkeypatch.setattr(lexer, 'scan_token', read_token)
+    assert Lexer(Source(u'')).scanner is read_token
+    test()
+
+
+def lex_all(body, scanner):
+    tokens = []
+    lex = Lexer(Source(body), scanner)
+    while True:
+        token = lex.next_token()
+        tokens.append(token)
+        if token.kind == TokenKind.EOF:
+            return tokens
+
+
+def lex_error(body, scanner):
+    with raises(LanguageError) as excinfo:
+        lex_all(body, scanner)
+    return excinfo.value.message
+
+
+def test_scanners_produce_same_tokens():
+    bodies = [
+        KITCHEN_SINK,
+        u'﻿{ a(b: "c\\u00e9\\n\\"", d: -1.5e+3, e: 0, f: [1, 2.0]) }',
+        u'123abc 1.5e3x 0 ...frag #comment',
+        u'{ a } # trailing comment without newline',
+        u'"tab\tinside" $var @dir |',
+    ]
+    for body in bodies:
+        assert lex_all(body, scan_token) == lex_all(body, read_token)
+
+
+def test_scanners_produce_same_errors():
+    bodies = [
+        u'{ a }\n#comment\u0007',
+        u'{ a(b: 00) }',
+        u'{ a(b: 1.5e) }',
+        u'{ a(b: "bad \\u12 esc") }',
+        u'{ a(b: "unterminated\n") }',
+        u'..',
+        u'-',
+        u'{ a } ※',
+    ]
+    for body in bodies:
+        assert lex_error(body, scan_token) == lex_error(body, read_token)
+
+
+def test_tokenize_matches_token_stream():
+    body = u'{ a(b: "c\\u00e9", d: -1.5e3, e: true) @skip(if: $v) ...F }'
+    buffer = tokenize(body)
+    assert list(buffer) == lex_all(body, scan_token)
+    assert buffer.kinds.typecode == 'B'
+    assert buffer.starts.typecode == 'i'
+    assert buffer.value(3) == u'b'
+    assert buffer.value(5) == u'cé'
+
+
+def test_tokenize_reports_first_lexical_error():
+    assert raises(LanguageError, tokenize, u'{ a ?').value.message == lex_error(u'{ a ?', read_token)
@@ -0,0 +1,75 @@
+from pytest import raises, warns
+from graphql.core.language.error import LanguageError
+from graphql.core.language.location import Loc, SourceLocation, get_location
+from graphql.core.language.parser import parse
+from graphql.core.language.source import Source
+
+
+def test_get_location_on_first_line():
+    source = Source(u'{ a }')
+    assert get_location(source, 0) == SourceLocation(1, 1)
+    assert get_location(source, 2) == SourceLocation(1, 3)
+
+
+def test_get_location_at_start_of_line():
+    source = Source(u'{\n  a\n}')
+    assert get_location(source, 2) == SourceLocation(2, 1)
+    assert get_location(source, 4) == SourceLocation(2, 3)
+    assert get_location(source, 6) == SourceLocation(3, 1)
+
+
+def test_get_location_handles_all_line_terminators():
+    source = Source(u'a\r\nb\rc\nd')
+    assert get_location(source, 3) == SourceLocation(2, 1)
+    assert get_location(source, 5) == SourceLocation(3, 1)
+    assert get_location(source, 7) == SourceLocation(4, 1)
+
+
+def test_get_location_right_after_a_newline_is_on_the_next_line():
+    source = Source(u'{ a\n')
+    assert source.line_of(4) == 2
+    assert get_location(source, 3) == SourceLocation(1, 4)
+    assert get_location(source, 4) == SourceLocation(2, 1)
+    with raises(LanguageError) as excinfo:
+        parse(source)
+    assert excinfo.value.locations == [SourceLocation(2, 1)]
+
+
+def test_get_line_strips_line_terminators():
+    source = Source(u'a\r\nb\rc\n')
+    assert [source.get_line(line) for line in range(1, 5)] == [u'a', u'b', u'c', u'']
+
+
+def test_line_starts_are_cached():
+    source = Source(u'a\nb')
+    assert source.line_starts is source.line_starts
+
+
+def test_parsed_nodes_share_compact_locations():
+    source = Source(u'{ a }')
+    document = parse(source)
+    field = document.definitions[0].selection_set.selections[0]
+    assert field.loc == Loc(2, 3, source)
+    assert field.loc.source is document.loc.source is source
+    assert parse(source, no_source=True).loc == Loc(0, 5)
+    assert parse(source, no_location=True).loc is None
+
+
+def test_loc_is_hashable_and_immutable():
+    loc = Loc(1, 2, Source(u'{ a }'))
+    assert hash(loc) == hash(Loc(1, 2))
+    with raises(AttributeError):
+        loc.start = 3
+
+
+def test_loc_supports_dict_style_access():
+    source = Source(u'{ a }')
+    loc = Loc(1, 2, source)
+    assert loc == {'start': 1, 'end': 2, 'source': source}
+    assert Loc(1, 2) == {'start': 1, 'end': 2}
+    assert loc != {'start': 1, 'end': 3, 'source': source}
+    with warns(DeprecationWarning):
+        assert loc['start'] == 1
+    with warns(DeprecationWarning):
+        with raises(KeyError):
+            loc['line']
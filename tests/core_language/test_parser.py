@@ -1,6 +1,7 @@
 from pytest import raises
 from graphql.core.language.error import LanguageError
 from graphql.core.language.source import Source
+from graphql.core.language.lexer import tokenize
 from graphql.core.language.parser import parse
 from graphql.core.language import ast
 from fixtures import KITCHEN_SINK
@@ -104,3 +105,63 @@ def test_parse_creates_ast():
                                     arguments=[],
                                     directives=[],
                                     selection_set=None)]))]))])
+
+
+def test_parses_from_token_buffer():
+    source = Source(KITCHEN_SINK)
+    assert parse(source, token_buffer=True) == parse(source)
+    assert parse(tokenize(source)) == parse(source)
+
+
+def test_token_buffer_parse_provides_useful_errors():
+    with raises(LanguageError) as excinfo:
+        parse(Source('query', 'MyQuery.graphql'), token_buffer=True)
+    assert 'Syntax Error MyQuery.graphql (1:6) Expected Name, found EOF' in str(excinfo.value)
+
+    with raises(LanguageError) as excinfo:
+        parse('{ field: {} }', token_buffer=True)
+    assert 'Syntax Error GraphQL (1:10) Expected Name, found {' in str(excinfo.value)
+
+
+def test_iterative_parse_matches_recursive_parse():
+    source = Source(KITCHEN_SINK + '''
+query Q($a: [[Int!]]!, $b: In = {a: [1, {b: [[]]}], c: {}}) {
+  f(a: [[1], [2, [3]]], b: {c: {d: [{e: 1}]}}) { ... on T { g { h } } }
+}
+''')
+    assert parse(source, iterative=True) == parse(source)
+    assert parse(source, iterative=True, token_buffer=True) == parse(source)
+
+
+def test_iterative_parse_provides_useful_errors():
+    for body in ['{ field: {} }', '{ a { } }', '{ a(b: [1, {c 2}]) }', 'query Q($a: [Int) { a }']:
+        with raises(LanguageError) as recursive_error:
+            parse(body)
+        with raises(LanguageError) as iterative_error:
+            parse(body, iterative=True)
+        assert iterative_error.value.message == recursive_error.value.message
+
+
+def test_iterative_parse_does_not_recurse_per_nesting_level():
+    depth = 5000
+    document = parse('{' + 'a {' * depth + 'b' + '}' * depth + '}', iterative=True, no_location=True)
+    assert document.definitions[0].selection_set.selections[0].name.value == 'a'
+
+    value = parse('{ a(b: ' + '[' * depth + ']' * depth + ') }', iterative=True)
+    assert value.definitions[0].selection_set.selections[0].arguments[0].value.values
+
+
+def test_parse_limits_nesting_depth():
+    assert parse('{ a { b { c } } }', max_depth=3)
+
+    with raises(LanguageError) as excinfo:
+        parse('{ a { b { c { d } } } }', max_depth=3)
+    assert 'Syntax Error GraphQL (1:13) Exceeded maximum nesting depth of 3' in str(excinfo.value)
+
+    with raises(LanguageError) as excinfo:
+        parse('{ a(b: [[[[1]]]]) }', max_depth=3)
+    assert 'Syntax Error GraphQL (1:11) Exceeded maximum nesting depth of 3' in str(excinfo.value)
+
+    with raises(LanguageError) as excinfo:
+        parse('query Q($a: [[[[Int]]]]) { a }', max_depth=3)
+    assert 'Syntax Error GraphQL (1:16) Exceeded maximum nesting depth of 3' in str(excinfo.value)
@@ -1,7 +1,8 @@
 import copy
 from graphql.core.language.ast import Field, Name
 from graphql.core.language.parser import parse
-from graphql.core.language.printer import print_ast
+from graphql.core.language.printer import PrintingVisitor, print_ast
+from graphql.core.language.visitor import visit
 from pytest import raises
 from fixtures import KITCHEN_SINK
 
@@ -60,3 +61,48 @@ fragment frag on Friend {
   query
 }
 '''
+
+
+def test_prints_the_same_as_the_printing_visitor():
+    ast = parse(KITCHEN_SINK)
+    assert print_ast(ast) == visit(ast, PrintingVisitor())
+
+
+def test_prints_compact_kitchen_sink():
+    ast = parse(KITCHEN_SINK)
+    printed = print_ast(ast, compact=True)
+    assert printed == (
+        'query queryName($foo:ComplexType,$site:Site=MOBILE){'
+        'whoever123is:node(id:[123,456]){id ...on User@defer{field2{id '
+        'alias:field1(after:$foo,first:10)@include(if:$foo){id ...frag}}}}}'
+        'mutation likeStory{like(story:123)@defer{story{id}}}'
+        'fragment frag on Friend{foo(bar:$b,obj:{key:"value"},size:$size)}'
+        '{unnamed(falsey:false,truthy:true) query}'
+    )
+    assert print_ast(parse(printed), compact=True) == printed
+
+
+def test_compact_printing_is_canonical():
+    printed = print_ast(parse('''
+        query Q($a: Int = 1) {
+            f(b: 2, a: {z: 1, y: [$a, "s"]}) @d(y: 1, x: 2) { g }
+        }
+    '''), compact=True)
+    reordered = print_ast(parse(
+        'query Q($a:Int=1){f(a:{y:[$a,"s"],z:1},b:2)@d(x:2,y:1){g}}'
+    ), compact=True)
+
+    assert printed == reordered == 'query Q($a:Int=1){f(a:{y:[$a,"s"],z:1},b:2)@d(x:2,y:1){g}}'
+
+
+def test_prints_deeply_nested_documents():
+    ast = parse('{' + 'a {' * 300 + 'b' + '}' * 301, iterative=True)
+    assert print_ast(ast) == visit(ast, PrintingVisitor())
+
+    ast = parse('{' + 'a {' * 2000 + 'b' + '}' * 2001, iterative=True)
+    printed = print_ast(ast, compact=True)
+    assert printed == '{' + 'a{' * 2000 + 'b' + '}' * 2001
+
+    ast = parse('{ a(b: ' + '[{c: ' * 1000 + '1' + '}]' * 1000 + ') }', iterative=True)
+    printed = print_ast(ast, compact=True)
+    assert printed == '{a(b:' + '[{c:' * 1000 + '1' + '}]' * 1000 + ')}'
@@ -1,6 +1,7 @@
-from graphql.core.language.ast import Field, Name, SelectionSet
+from graphql.core.language.ast import Argument, Directive, Document, Field, Name, OperationDefinition, SelectionSet
+from graphql.core.language.binary import dump, load
 from graphql.core.language.parser import parse
-from graphql.core.language.visitor import visit, Visitor, REMOVE, BREAK
+from graphql.core.language.visitor import visit, walk, Visitor, REMOVE, BREAK
 from fixtures import KITCHEN_SINK
 
 
@@ -383,3 +384,224 @@ def test_visits_kitchen_sink():
         [ 'leave', 'OperationDefinition', 3, None ],
         [ 'leave', 'Document', None, None ]
     ]
+
+
+def test_dispatches_to_kind_specific_handlers_per_class():
+    ast = parse('{ a { b } }')
+
+    class FieldNames(Visitor):
+        def __init__(self):
+            self.names = []
+
+        def enter_Field(self, node, *args):
+            self.names.append(node.name.value)
+
+    class UpperFieldNames(FieldNames):
+        def enter_Field(self, node, *args):
+            self.names.append(node.name.value.upper())
+
+    class LeavingFieldNames(FieldNames):
+        def leave_Field(self, node, *args):
+            self.names.append('/' + node.name.value)
+
+    for visitor_class, expected in [
+        (FieldNames, ['a', 'b']),
+        (UpperFieldNames, ['A', 'B']),
+        (LeavingFieldNames, ['a', 'b', '/b', '/a']),
+        (FieldNames, ['a', 'b']),
+    ]:
+        visitor = visitor_class()
+        visit(ast, visitor)
+        assert visitor.names == expected
+
+
+def test_handlers_set_to_none_disable_inherited_handlers():
+    ast = parse('{ a { b } }')
+
+    class FieldNames(Visitor):
+        def __init__(self):
+            self.names = []
+
+        def enter_Field(self, node, *args):
+            self.names.append(node.name.value)
+
+        def leave_Field(self, node, *args):
+            self.names.append('/' + node.name.value)
+
+    class LeavingFieldNames(FieldNames):
+        enter_Field = None
+
+    class NoFieldNames(LeavingFieldNames):
+        leave_Field = None
+
+    for visitor_class, expected in [
+        (LeavingFieldNames, ['/b', '/a']),
+        (NoFieldNames, []),
+        (FieldNames, ['a', 'b', '/b', '/a']),
+    ]:
+        for visit_ast in (visit, walk):
+            visitor = visitor_class()
+            visit_ast(ast, visitor)
+            assert visitor.names == expected
+
+
+def test_dispatches_to_static_method_handlers():
+    names = []
+
+    class TestVisitor(Visitor):
+        @staticmethod
+        def enter_Name(node, *args):
+            names.append(node.value)
+
+    visit(parse('{ a { b } }'), TestVisitor())
+    assert names == ['a', 'b']
+
+
+def test_dispatches_through_overridden_kind_specific_visitor_and_getattr():
+    names = []
+
+    class KindVisitor(Visitor):
+        def _call_kind_specific_visitor(self, prefix, node, *args):
+            if prefix == 'enter_' and isinstance(node, Field):
+                names.append(node.name.value)
+            return super(KindVisitor, self)._call_kind_specific_visitor(prefix, node, *args)
+
+        def leave_Field(self, node, *args):
+            names.append('/' + node.name.value)
+
+    class GetattrVisitor(Visitor):
+        def __getattr__(self, name):
+            if name == 'enter_Name':
+                return lambda node, *args: names.append(node.value)
+            raise AttributeError(name)
+
+    ast = parse('{ a { b } }')
+    for visit_ast in (visit, walk):
+        del names[:]
+        visit_ast(ast, KindVisitor())
+        assert names == ['a', 'b', '/b', '/a']
+
+        del names[:]
+        visit_ast(ast, GetattrVisitor())
+        assert names == ['a', 'b']
+
+
+def test_ignores_handlers_set_on_instances():
+    # Handlers are looked up once per class, so unlike a __getattr__ on
+    # the class, a handler set on an instance is not called.
+    names = []
+    visitor = Visitor()
+    visitor.enter_Name = lambda node, *args: names.append(node.value)
+    visit(parse('{ a }'), visitor)
+    assert names == []
+
+
+def test_visits_only_keys_in_custom_key_map():
+    visited = []
+    ast = parse('query Q { a(x: 1) { b } }')
+
+    class TestVisitor(Visitor):
+        def enter(self, node, *args):
+            visited.append(type(node).__name__)
+
+    key_map = {
+        Document: ('definitions',),
+        OperationDefinition: ('selection_set',),
+        SelectionSet: ('selections',),
+        Field: ('selection_set',),
+    }
+    visit(ast, TestVisitor(), key_map)
+
+    assert visited == ['Document', 'OperationDefinition', 'SelectionSet', 'Field', 'SelectionSet', 'Field']
+
+
+def test_walk_calls_handlers_like_visit():
+    ast = parse(KITCHEN_SINK)
+
+    class TestVisitor(Visitor):
+        def __init__(self):
+            self.events = []
+
+        def enter(self, node, key, parent, path, ancestors):
+            self.events.append(('enter', type(node).__name__, key, list(path), len(ancestors)))
+
+        def leave(self, node, key, parent, path, ancestors):
+            self.events.append(('leave', type(node).__name__, key, list(path), len(ancestors)))
+
+    visited = TestVisitor()
+    visit(ast, visited)
+    walked = TestVisitor()
+    walk(ast, walked)
+
+    assert walked.events == visited.events
+
+
+def test_walk_skips_subtrees_without_handled_kinds():
+    # Nodes of a loaded binary document are decoded only when read, so
+    # the nodes left undecoded are exactly those the walk did not enter.
+    ast = load(dump(parse('{ a(x: [1, {y: 2}]) @skip(if: true) { b } }')))
+    entered = []
+
+    class TestVisitor(Visitor):
+        def enter_Field(self, node, *args):
+            entered.append(node.name.value)
+
+    walk(ast, TestVisitor())
+
+    assert entered == ['a', 'b']
+    field = ast.definitions[0].selection_set.selections[0]
+    assert type(field) is Field
+    assert type(field.arguments[0]) is not Argument
+    assert type(field.directives[0]) is not Directive
+
+
+def test_walk_only_visits_given_kinds():
+    ast = parse('query Q($v: Int) { a(x: $v) { b } }')
+    entered = []
+
+    class TestVisitor(Visitor):
+        def enter(self, node, *args):
+            entered.append(type(node).__name__)
+
+    walk(ast, TestVisitor(), ['Variable', 'Field'])
+
+    assert entered == ['Variable', 'Field', 'Variable', 'Field']
+
+
+def test_walk_allows_skipping_a_subtree_and_breaking():
+    ast = parse('{ a { x } b { y } c }')
+    entered = []
+
+    class TestVisitor(Visitor):
+        def enter_Field(self, node, *args):
+            entered.append(node.name.value)
+            if node.name.value == 'a':
+                return False
+            if node.name.value == 'y':
+                return BREAK
+
+    walk(ast, TestVisitor())
+
+    assert entered == ['a', 'b', 'y']
+
+
+def test_edits_share_untouched_subtrees_with_the_original():
+    ast = parse('{ a { x } b { y { z } } }', no_location=True)
+
+    class TestVisitor(Visitor):
+        def enter_Name(self, node, *args):
+            if node.value == 'z':
+                return Name(value='renamed')
+
+    edited_ast = visit(ast, TestVisitor())
+
+    assert ast == parse('{ a { x } b { y { z } } }', no_location=True)
+    assert edited_ast == parse('{ a { x } b { y { renamed } } }', no_location=True)
+
+    selections = ast.definitions[0].selection_set.selections
+    edited_selections = edited_ast.definitions[0].selection_set.selections
+    assert edited_ast is not ast
+    assert edited_selections is not selections
+    assert edited_selections[0] is selections[0]
+    assert edited_selections[1] is not selections[1]
+    assert edited_selections[1].name is selections[1].name
@@ -1,4 +1,5 @@
 from graphql.core.language.location import SourceLocation as L
+from graphql.core.language.parser import parse
 from graphql.core.type.definition import GraphQLObjectType, GraphQLArgument, GraphQLNonNull, GraphQLUnionType, \
     GraphQLList, GraphQLField
 from graphql.core.type.scalars import GraphQLString, GraphQLInt, GraphQLID
@@ -387,3 +388,38 @@ def test_ignores_unknown_types():
         }
     }
     ''')
+
+
+def test_reports_conflicts_in_fragments_shared_by_many_fields_once():
+    expect_fails_rule(OverlappingFieldsCanBeMerged, '''
+    {
+        dog { ...A }
+        dog { ...A ...B }
+        dog { ...B }
+    }
+    fragment A on Dog {
+        x: name
+    }
+    fragment B on Dog {
+        x: barks
+    }
+    ''', [
+        fields_conflict('x', 'name and barks are different fields', L(8, 9), L(11, 9)),
+    ], sort_list=False)
+
+
+def test_compares_argument_values_structurally():
+    same_value = OverlappingFieldsCanBeMerged.same_value
+
+    def value(source):
+        return parse('{ f(a: ' + source + ') }').definitions[0].selection_set.selections[0].arguments[0].value
+
+    for source in ['1', '1.5', '"s"', 'true', 'ENUM', '$v', '[1, [2]]', '{a: 1, b: {c: $v}}', '[]', '{}']:
+        assert same_value(value(source), value(source))
+
+    for source1, source2 in [
+        ('1', '2'), ('1', '1.0'), ('"1"', '1'), ('true', 'false'), ('ENUM', '"ENUM"'), ('$v', '$w'),
+        ('[1, 2]', '[1]'), ('[1, 2]', '[2, 1]'), ('{a: 1, b: 2}', '{b: 2, a: 1}'), ('{a: 1}', '{a: 2}'),
+        ('{a: 1}', '[1]'),
+    ]:
+        assert not same_value(value(source1), value(source2))
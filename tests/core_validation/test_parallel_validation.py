@@ -0,0 +1,120 @@
+from graphql.core.error import GraphQLError, format_error
+from graphql.core.language.parser import parse
+from graphql.core.language.visitor import BREAK
+from graphql.core.validation import specified_rules, validate
+from graphql.core.validation.rules import ValidationRule
+from utils import default_schema
+
+
+def recording_rule(events, on_enter=None):
+    class RecordingRule(ValidationRule):
+        def enter(self, node, *args):
+            events.append(('enter', type(node).__name__))
+            if on_enter:
+                return on_enter(node)
+
+        def leave(self, node, *args):
+            events.append(('leave', type(node).__name__))
+
+    return RecordingRule
+
+
+def run_both_ways(rules, query):
+    ast = parse(query)
+    return validate(default_schema, ast, rules), validate(default_schema, ast, rules, parallel=False)
+
+
+def test_all_rules_report_the_same_errors_in_one_traversal():
+    query = '''
+        query Foo($a: Int, $unused: String) {
+            dog {
+                ...DogFields
+                name(surname: $a, surname: true)
+                unknownField
+            }
+            human(id: $undefined) { ...Cyclic }
+        }
+
+        fragment DogFields on Dog {
+            doesKnowCommand(dogCommand: $a)
+            barks { nested }
+        }
+
+        fragment Cyclic on Human { ...Cyclic }
+
+        fragment Unused on Cat { furColor }
+    '''
+    parallel_errors, sequential_errors = run_both_ways(specified_rules, query)
+    assert parallel_errors
+    assert list(map(format_error, parallel_errors)) == list(map(format_error, sequential_errors))
+
+
+def test_errors_are_grouped_by_rule():
+    class First(ValidationRule):
+        def enter_Field(self, node, *args):
+            return GraphQLError('first ' + node.name.value, [node])
+
+    class Second(ValidationRule):
+        def enter_Field(self, node, *args):
+            return GraphQLError('second ' + node.name.value, [node])
+
+    errors = validate(default_schema, parse('{ dog { name } human { name } }'), [First, Second])
+    assert [error.message for error in errors] == [
+        'first dog', 'first human', 'second dog', 'second human'
+    ]
+
+
+def test_false_skips_the_subtree_for_that_rule_only():
+    skipping_events = []
+    other_events = []
+    rules = [
+        recording_rule(skipping_events, lambda node: False if type(node).__name__ == 'SelectionSet' else None),
+        recording_rule(other_events),
+    ]
+    validate(default_schema, parse('{ dog { name } }'), rules)
+
+    assert skipping_events == [
+        ('enter', 'Document'),
+        ('enter', 'OperationDefinition'),
+        ('enter', 'SelectionSet'),
+        ('leave', 'OperationDefinition'),
+        ('leave', 'Document'),
+    ]
+    assert ('enter', 'Name') in other_events
+
+
+def test_break_stops_only_that_rule():
+    breaking_events = []
+    other_events = []
+    rules = [
+        recording_rule(breaking_events, lambda node: BREAK if type(node).__name__ == 'Field' else None),
+        recording_rule(other_events),
+    ]
+    validate(default_schema, parse('{ dog { name } human { name } }'), rules)
+
+    assert breaking_events == [
+        ('enter', 'Document'),
+        ('enter', 'OperationDefinition'),
+        ('enter', 'SelectionSet'),
+        ('enter', 'Field'),
+    ]
+    assert other_events.count(('enter', 'Field')) == 4
+    assert other_events[-1] == ('leave', 'Document')
+
+
+def test_spread_fragments_are_visited_in_place_for_rules_that_ask():
+    class SpreadingRule(ValidationRule):
+        visit_spread_fragments = True
+
+        def enter_Field(self, node, *args):
+            events.append(node.name.value)
+
+    events = []
+    other_events = []
+    validate(default_schema, parse('''
+        query Q { dog { ...F } human { name } }
+        fragment F on Dog { barks }
+    '''), [SpreadingRule, recording_rule(other_events)])
+
+    assert events == ['dog', 'barks', 'human', 'name']
+    assert other_events.count(('enter', 'FragmentDefinition')) == 1
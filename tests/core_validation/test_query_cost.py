@@ -0,0 +1,110 @@
+from graphql.core.language.location import SourceLocation
+from graphql.core.language.parser import parse
+from graphql.core.type import (GraphQLArgument, GraphQLField, GraphQLInt, GraphQLList, GraphQLNonNull,
+                               GraphQLObjectType, GraphQLSchema, GraphQLString)
+from graphql.core.utils import TypeInfo
+from graphql.core.validation import ValidationContext
+from graphql.core.validation.rules import QueryCost
+from pytest import raises
+from utils import expect_fails_rule_with_schema, expect_passes_rule_with_schema
+
+Item = GraphQLObjectType('Item', lambda: {
+    'name': GraphQLField(GraphQLString),
+    'expensive': GraphQLField(GraphQLString, cost=50),
+    'free': GraphQLField(GraphQLString, cost=0),
+    'children': GraphQLField(GraphQLList(Item), {
+        'first': GraphQLArgument(GraphQLInt),
+    }),
+    'matrix': GraphQLField(GraphQLList(GraphQLList(Item))),
+    'pair': GraphQLField(GraphQLNonNull(GraphQLList(Item)), multiplier=2),
+    'page': GraphQLField(GraphQLList(Item), {
+        'size': GraphQLArgument(GraphQLInt),
+    }, multiplier='size'),
+})
+
+schema = GraphQLSchema(query=GraphQLObjectType('Query', {
+    'item': GraphQLField(Item),
+    'items': GraphQLField(GraphQLList(Item), {
+        'limit': GraphQLArgument(GraphQLInt),
+    }),
+}))
+
+
+def cost(query, variable_values=None):
+    document = parse(query)
+    rule = QueryCost(ValidationContext(schema, document, TypeInfo(schema)))
+    return rule.get_operation_cost(document.definitions[0], variable_values)
+
+
+def test_counts_each_field():
+    assert cost('{ item { name free expensive } }') == 1 + 1 + 0 + 50
+
+
+def test_multiplies_list_fields_by_the_default():
+    assert cost('{ items { name } }') == 10 * (1 + 1)
+    assert cost('{ item { matrix { name } } }') == 1 + 100 * (1 + 1)
+
+
+def test_multiplies_list_fields_by_limiting_arguments():
+    assert cost('{ items(limit: 3) { name } }') == 3 * (1 + 1)
+    assert cost('{ item { children(first: 5) { name } } }') == 1 + 5 * (1 + 1)
+    assert cost('{ item { page(size: 4) { name } } }') == 1 + 4 * (1 + 1)
+    assert cost('{ item { pair { name } } }') == 1 + 2 * (1 + 1)
+
+
+def test_reads_multipliers_from_variables():
+    query = 'query Q($n: Int = 2, $m: Int) { items(limit: $n) { children(first: $m) { name } } }'
+    assert cost(query) == 2 * (1 + 10 * (1 + 1))
+    assert cost(query, {'n': 1, 'm': 3}) == 1 * (1 + 3 * (1 + 1))
+
+
+def test_counts_fragments_and_nested_lists():
+    assert cost('''
+        { items(limit: 2) { ...F ... on Item { free } } }
+        fragment F on Item { children(first: 3) { ...G } }
+        fragment G on Item { name }
+    ''') == 2 * (1 + 3 * (1 + 1) + 0)
+
+
+def test_counts_cyclic_fragments_once():
+    assert cost('''
+        { item { ...F } }
+        fragment F on Item { name ...F }
+    ''') == 1 + 1
+
+
+def test_allows_operations_within_the_budget():
+    expect_passes_rule_with_schema(schema, QueryCost, '''
+    { items(limit: 100) { name children(first: 3) { name } } }
+    ''')
+
+
+def test_rejects_operations_over_the_budget():
+    expect_fails_rule_with_schema(schema, QueryCost, '''
+    query Deep { items { children { children { name } } } }
+    ''', [{
+        'message': QueryCost.operation_too_expensive_message('Deep', 2110, 1000),
+        'locations': [SourceLocation(2, 5)]
+    }])
+
+
+def test_budget_is_configurable():
+    expect_fails_rule_with_schema(schema, QueryCost.with_options(max_cost=9), '''
+    { items(limit: 5) { name } }
+    ''', [{
+        'message': QueryCost.operation_too_expensive_message(None, 10, 9),
+        'locations': [SourceLocation(2, 5)]
+    }])
+
+
+def test_rejects_unknown_options():
+    with raises(AssertionError):
+        QueryCost.with_options(max_costs=10)
+
+
+def test_costs_deeply_nested_operations_without_recursion():
+    document = parse('{ item { ' + 'children(first: 1) { ' * 2000 + 'name' + ' }' * 2002, iterative=True)
+    rule = QueryCost(ValidationContext(schema, document, TypeInfo(schema)))
+    assert rule.get_operation_cost(document.definitions[0]) == 2002
+    assert rule.enter_OperationDefinition(document.definitions[0]).message == \
+        QueryCost.operation_too_expensive_message(None, 2002, 1000)
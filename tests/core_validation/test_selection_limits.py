@@ -0,0 +1,167 @@
+from graphql.core.cache import ValidationCache
+from graphql.core.language.location import SourceLocation
+from graphql.core.language.parser import parse
+from graphql.core.type import GraphQLField, GraphQLList, GraphQLObjectType, GraphQLSchema, GraphQLString
+from graphql.core.utils import TypeInfo
+from graphql.core.validation import ValidationContext, specified_rules, validate
+from graphql.core.validation.rules import MaxAliases, MaxDepth, MaxRootFields, SelectionLimitRule, _configured_rules
+from utils import expect_fails_rule_with_schema, expect_passes_rule_with_schema
+
+Item = GraphQLObjectType('Item', lambda: {
+    'name': GraphQLField(GraphQLString),
+    'child': GraphQLField(Item),
+    'children': GraphQLField(GraphQLList(Item)),
+})
+
+schema = GraphQLSchema(query=GraphQLObjectType('Query', {
+    'item': GraphQLField(Item),
+    'items': GraphQLField(GraphQLList(Item)),
+}))
+
+
+def measure(rule, query):
+    document = parse(query)
+    context = ValidationContext(schema, document, TypeInfo(schema))
+    instance = rule(context)
+    operation = document.definitions[0]
+    for spread in context.get_fragment_spreads(operation):
+        instance.measure_fragment(spread.name.value)
+    return instance.measure(operation.selection_set)
+
+
+def test_measures_depth_through_fragments():
+    assert measure(MaxDepth, '{ item { name } }') == 2
+    assert measure(MaxDepth, '''
+        { item { ... on Item { child { ...F } } } }
+        fragment F on Item { child { ...G } name }
+        fragment G on Item { child { name } }
+    ''') == 5
+
+
+def test_stops_measuring_depth_over_the_limit():
+    query = '{ ' + 'child { ' * 100 + 'name' + ' }' * 100 + ' }'
+    assert measure(MaxDepth.with_options(max_depth=3), query) == 4
+
+
+def test_counts_reused_fragments_at_every_spread():
+    query = '''
+        { a: item { ...F } b: item { ...F } ...R ...R }
+        fragment F on Item { x: name y: name ... on Item { z: name } }
+        fragment R on Query { item { name } }
+    '''
+    assert measure(MaxAliases, query) == 2 + 2 * 3
+    assert measure(MaxRootFields, query) == 2 + 2
+
+
+def test_counts_exponentially_reused_fragments():
+    query = '{ ...A }\n' + '\n'.join(
+        'fragment {} on Query {{ ...{} ...{} }}'.format(name, next_name, next_name)
+        for name, next_name in zip('ABCDEFGHIJ', 'BCDEFGHIJK')
+    ) + '\nfragment K on Query { a: item { name } }'
+    assert measure(MaxAliases, query) == 2 ** 10
+    assert measure(MaxRootFields, query) == 2 ** 10
+
+
+def test_measures_cyclic_fragments():
+    query = '''
+        { item { ...F } }
+        fragment F on Item { a: child { ...F } }
+    '''
+    assert measure(MaxDepth, query) == 2
+    assert measure(MaxAliases, query) == 1
+
+
+def test_measures_long_fragment_chains_without_recursing():
+    count = 5000
+    query = '{ ...F0 }\n' + '\n'.join(
+        'fragment F{} on Query {{ ...F{} }}'.format(i, i + 1) for i in range(count)
+    ) + '\nfragment F{} on Query {{ item {{ name }} }}'.format(count)
+    assert measure(MaxRootFields, query) == 1
+
+
+def test_allows_operations_within_the_limits():
+    expect_passes_rule_with_schema(schema, MaxDepth.with_options(max_depth=3), '''
+    { item { child { name } } }
+    ''')
+    expect_passes_rule_with_schema(schema, MaxAliases.with_options(max_aliases=2), '''
+    { a: item { b: name } }
+    ''')
+    expect_passes_rule_with_schema(schema, MaxRootFields.with_options(max_root_fields=2), '''
+    { item { name } items { name } }
+    ''')
+
+
+def test_rejects_operations_over_the_limits():
+    expect_fails_rule_with_schema(schema, MaxDepth.with_options(max_depth=2), '''
+    query Deep { item { ...F } }
+    fragment F on Item { child { name } }
+    ''', [{
+        'message': MaxDepth.limit_exceeded_message('Deep', 2),
+        'locations': [SourceLocation(2, 5)]
+    }])
+    expect_fails_rule_with_schema(schema, MaxAliases.with_options(max_aliases=1), '''
+    { a: item { ...F } b: item { ...F } }
+    fragment F on Item { name }
+    ''', [{
+        'message': MaxAliases.limit_exceeded_message(None, 1),
+        'locations': [SourceLocation(2, 5)]
+    }])
+    expect_fails_rule_with_schema(schema, MaxRootFields.with_options(max_root_fields=1), '''
+    query Wide { ... on Query { item { name } } items { name } }
+    ''', [{
+        'message': MaxRootFields.limit_exceeded_message('Wide', 1),
+        'locations': [SourceLocation(2, 5)]
+    }])
+
+    assert MaxDepth.limit_exceeded_message('Deep', 2) == 'Operation "Deep" exceeds the maximum depth of 2.'
+    assert MaxAliases.limit_exceeded_message(None, 1) == 'The operation uses more than 1 aliases.'
+
+
+def test_limits_are_configured_by_class_attributes():
+    class MaxFragmentSpreads(SelectionLimitRule):
+        max_spreads = 1
+        limit_name = 'max_spreads'
+        limit_message = '{} spreads more than {} fragments.'
+
+        def measure(self, selection_set):
+            return len(self.context.get_fragment_spreads(selection_set))
+
+    expect_fails_rule_with_schema(schema, MaxFragmentSpreads, '''
+    { item { ...F child { ...F } } }
+    fragment F on Item { name }
+    ''', [{
+        'message': 'The operation spreads more than 1 fragments.',
+        'locations': [SourceLocation(2, 5)]
+    }])
+    expect_passes_rule_with_schema(schema, MaxFragmentSpreads.with_options(max_spreads=2), '''
+    { item { ...F child { ...F } } }
+    fragment F on Item { name }
+    ''')
+
+
+def test_run_before_the_specified_rules():
+    document = parse('{ item { child { child { name } } } unknown }')
+    errors = validate(schema, document, [MaxDepth.with_options(max_depth=2)] + specified_rules)
+    assert errors[0].message == MaxDepth.limit_exceeded_message(None, 2)
+    assert len(errors) == 2
+
+
+def test_configures_each_rule_once_for_the_same_options():
+    assert MaxDepth.with_options(max_depth=2) is MaxDepth.with_options(max_depth=2)
+    assert MaxDepth.with_options(max_depth=2) is not MaxDepth.with_options(max_depth=3)
+    assert MaxDepth.with_options(max_depth=2) is not MaxDepth.with_options(max_depth=2, limit_name='depth')
+    assert MaxDepth.with_options(max_depth=2).max_depth == 2
+
+
+def test_keeps_a_bounded_number_of_configured_rules():
+    for max_depth in range(_configured_rules.max_size + 10):
+        MaxDepth.with_options(max_depth=max_depth)
+    assert len(_configured_rules) == _configured_rules.max_size
+
+
+def test_reuses_cached_errors_for_rules_configured_per_request():
+    cache = ValidationCache()
+    document = parse('{ item { child { child { name } } } }')
+    errors = validate(schema, document, [MaxDepth.with_options(max_depth=2)], cache=cache)
+    assert len(errors) == 1
+    assert validate(schema, document, [MaxDepth.with_options(max_depth=2)], cache=cache)[0] is errors[0]
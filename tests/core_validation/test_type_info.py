@@ -0,0 +1,91 @@
+from graphql.core.language.ast import Argument, ObjectField, Variable
+from graphql.core.language.parser import parse
+from graphql.core.language.visitor import Visitor, visit
+from graphql.core.type import GraphQLList, GraphQLNonNull
+from graphql.core.type.directives import GraphQLIncludeDirective
+from graphql.core.utils import TypeInfo, type_from_ast
+from utils import ComplicatedArgs, default_schema
+
+
+class TypeRecorder(Visitor):
+    def __init__(self, type_info, kinds, record):
+        self.type_info = type_info
+        self.kinds = kinds
+        self.record = record
+        self.records = []
+
+    def enter(self, node, *args):
+        self.type_info.enter(node)
+        if isinstance(node, self.kinds):
+            self.records.append(self.record(node, self.type_info))
+
+    def leave(self, node, *args):
+        self.type_info.leave(node)
+
+
+def record_types(query, kinds, record):
+    recorder = TypeRecorder(TypeInfo(default_schema), kinds, record)
+    visit(parse(query), recorder)
+    return recorder.records
+
+
+def test_shares_wrapped_types_from_the_schema():
+    document = parse('query Q($a: [String], $b: [String], $c: Int!, $d: Int!) { dog { name } }')
+    a, b, c, d = [type_from_ast(default_schema, definition.type)
+                  for definition in document.definitions[0].variable_definitions]
+    assert a is b is ComplicatedArgs.get_fields()['stringListArgField'].args[0].type
+    assert c is d
+    assert str(c) == 'Int!'
+
+
+def test_does_not_keep_wrapped_types_only_documents_use():
+    document = parse('query Q($a: [Int!]!, $b: [Int!]!) { dog { name } }')
+    a, b = [type_from_ast(default_schema, definition.type)
+            for definition in document.definitions[0].variable_definitions]
+    assert a is not b
+    assert a.is_same_type(b)
+    assert isinstance(a, GraphQLNonNull) and isinstance(a.of_type, GraphQLList)
+    assert str(a) == '[Int!]!'
+
+    wrapped_types = len(default_schema._wrapped_types)
+    for depth in range(1, 20):
+        type_ast = parse('query Q($a: ' + '[' * depth + 'Int!' + ']' * depth + ') { dog { name } }') \
+            .definitions[0].variable_definitions[0].type
+        assert str(type_from_ast(default_schema, type_ast)) == '[' * depth + 'Int!' + ']' * depth
+    assert len(default_schema._wrapped_types) == wrapped_types
+
+
+def test_returns_none_for_unknown_wrapped_types():
+    document = parse('query Q($a: [Unknown!]) { dog { name } }')
+    assert type_from_ast(default_schema, document.definitions[0].variable_definitions[0].type) is None
+
+
+def test_looks_up_arguments_by_name():
+    field = ComplicatedArgs.get_fields()['multipleReqs']
+    assert field.get_arg('req1') is field.args[0]
+    assert field.get_arg('unknown') is None
+    assert GraphQLIncludeDirective.get_arg('if') is GraphQLIncludeDirective.args[0]
+    assert GraphQLIncludeDirective.get_arg('unless') is None
+
+
+def test_tracks_argument_types():
+    records = record_types('''
+        { complicatedArgs { multipleReqs(req1: 1, unknown: 2) } dog @include(if: true) { name } }
+    ''', Argument, lambda node, type_info: (node.name.value, str(type_info.get_input_type())))
+    assert records == [('req1', 'Int!'), ('unknown', 'None'), ('if', 'Boolean!')]
+
+
+def test_tracks_input_types_after_list_values():
+    records = record_types('''
+        { complicatedArgs { complexArgField(complexArg: {
+            requiredField: true, stringListField: ["a"], intField: 1
+        }) } }
+    ''', ObjectField, lambda node, type_info: str(type_info.get_input_type()))
+    assert records == ['Boolean!', '[String]', 'Int']
+
+
+def test_tracks_variable_types_in_lists():
+    records = record_types('''
+        query Q($a: String) { complicatedArgs { stringListArgField(stringListArg: ["a", $a]) } }
+    ''', Variable, lambda node, type_info: str(type_info.get_input_type()))
+    assert records == ['String', 'String']
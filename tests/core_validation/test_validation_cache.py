@@ -0,0 +1,97 @@
+from graphql.core.cache import ValidationCache
+from graphql.core.error import format_error
+from graphql.core.language.parser import parse
+from graphql.core.type import GraphQLSchema
+from graphql.core.validation import specified_rules, validate
+from graphql.core.validation import rules as Rules
+from utils import QueryRoot, default_schema
+
+
+def test_repeated_documents_are_not_validated_again(monkeypatch):
+    cache = ValidationCache()
+    document = parse('{ dog { name } }')
+    assert validate(default_schema, document, cache=cache) == []
+
+    monkeypatch.setattr('graphql.core.validation.visit_using_rules', None)
+    assert validate(default_schema, document, cache=cache) == []
+    assert validate(default_schema, parse('{ dog { name } }'), cache=cache) == []
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_caches_errors():
+    cache = ValidationCache()
+    errors = validate(default_schema, parse('{ dog { unknown } }'), cache=cache)
+    assert errors
+
+    cached_errors = validate(default_schema, parse('{ dog { unknown } }'), cache=cache)
+    assert list(map(format_error, cached_errors)) == list(map(format_error, errors))
+    assert cache.hits == 1
+
+    cached_errors.append(None)
+    assert None not in validate(default_schema, parse('{ dog { unknown } }'), cache=cache)
+
+
+def test_errors_are_not_shared_between_differently_formatted_documents():
+    cache = ValidationCache()
+    validate(default_schema, parse('{ dog { unknown } }'), cache=cache)
+    errors = validate(default_schema, parse('{\n  dog { unknown } }'), cache=cache)
+
+    assert cache.hits == 0
+    assert format_error(errors[0])['locations'] == [{'line': 2, 'column': 9}]
+
+
+def test_keys_by_schema_and_rules():
+    cache = ValidationCache()
+    document = parse('{ dog { name } }')
+    validate(default_schema, document, cache=cache)
+    validate(GraphQLSchema(query=QueryRoot), document, cache=cache)
+    validate(default_schema, document, [Rules.ScalarLeafs], cache=cache)
+    validate(default_schema, document, specified_rules, cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_evicts_least_recently_used_documents():
+    cache = ValidationCache(max_size=1)
+    validate(default_schema, parse('{ dog { name } }'), cache=cache)
+    validate(default_schema, parse('{ dog { barks } }'), cache=cache)
+
+    assert len(cache) == 1
+    assert cache.evictions == 1
+
+
+def test_keys_deeply_nested_documents():
+    cache = ValidationCache()
+    source = '{ human { ' + 'pets { ' * 300 + 'name' + ' }' * 302
+    rules = [Rules.MaxDepth]
+    expected = [error.message for error in validate(default_schema, parse(source, iterative=True), rules)]
+    assert expected
+
+    for document in (parse(source, iterative=True), parse(source, iterative=True)):
+        errors = validate(default_schema, document, rules, cache=cache)
+        assert [error.message for error in errors] == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    validate(default_schema, parse(source, no_location=True, iterative=True), rules, cache=cache)
+    validate(default_schema, parse(source, no_location=True, iterative=True), rules, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_does_not_share_errors_with_edited_documents():
+    from graphql.core.language import ast
+    from graphql.core.language.visitor import Visitor, visit
+
+    class Rename(Visitor):
+        def enter_Name(self, node, *args):
+            if node.value == 'name':
+                return ast.Name(value='bogus', loc=node.loc)
+
+    cache = ValidationCache()
+    document = parse('{ dog { name } }')
+    assert validate(default_schema, document, cache=cache) == []
+
+    edited = visit(document, Rename())
+    assert edited.loc == document.loc
+    errors = validate(default_schema, edited, cache=cache)
+    assert [error.message for error in errors] == ['Cannot query field "bogus" on "Dog".']
+    assert cache.hits == 0
@@ -0,0 +1,70 @@
+from graphql.core.language.location import SourceLocation
+from graphql.core.language.parser import parse
+from graphql.core.utils import TypeInfo
+from graphql.core.validation import ValidationContext
+from graphql.core.validation.rules import NoUndefinedVariables
+from utils import default_schema, expect_fails_rule
+
+
+DOCUMENT = parse('''
+    query Q($a: Boolean, $b: Int) {
+        dog { ...A ...B @include(if: $a) ...A @skip(if: $b) }
+        complicatedArgs { intArgField(intArg: $b) }
+    }
+    fragment A on Dog { name(surname: $c) ...B }
+    fragment B on Dog { ... on Dog { name(surname: $d) } ...Unknown }
+    fragment Unused on Dog { ...A }
+''')
+OPERATION = DOCUMENT.definitions[0]
+
+
+def make_context():
+    return ValidationContext(default_schema, DOCUMENT, TypeInfo(default_schema))
+
+
+def test_fragment_dependencies():
+    dependencies = make_context().get_fragment_dependencies()
+    assert dict((name, [spread.name.value for spread in spreads]) for name, spreads in dependencies.items()) == {
+        'A': ['B'],
+        'B': ['Unknown'],
+        'Unused': ['A'],
+    }
+
+
+def test_recursively_referenced_fragments():
+    context = make_context()
+    fragments = context.get_recursively_referenced_fragments(OPERATION)
+    assert sorted(fragment.name.value for fragment in fragments) == ['A', 'B']
+    assert context.get_recursively_referenced_fragments(OPERATION) is fragments
+
+
+def test_variable_usages_do_not_follow_spreads():
+    usages = make_context().get_variable_usages(OPERATION)
+    assert [(usage.node.name.value, str(usage.type), usage.fragment) for usage in usages] == [
+        ('a', 'Boolean!', None),
+        ('b', 'Boolean!', None),
+        ('b', 'Int', None),
+    ]
+
+
+def test_recursive_variable_usages_visit_each_fragment_at_its_first_spread():
+    usages = make_context().get_recursive_variable_usages(OPERATION)
+    assert [
+        (usage.node.name.value, str(usage.type), usage.fragment and usage.fragment.name.value)
+        for usage in usages
+    ] == [
+        ('c', 'Boolean', 'A'),
+        ('d', 'Boolean', 'B'),
+        # Later spreads of a fragment already visited are skipped together
+        # with their directives.
+        ('b', 'Int', None),
+    ]
+
+
+def test_fragment_defined_before_its_operation_is_checked_once():
+    expect_fails_rule(NoUndefinedVariables, '''
+    fragment First on Dog { name(surname: $q) }
+    { dog { ...First } }
+    ''', [
+        {'message': NoUndefinedVariables.undefined_var_message('q'), 'locations': [SourceLocation(2, 43)]}
+    ])
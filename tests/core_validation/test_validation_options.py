@@ -0,0 +1,66 @@
+from graphql.core.language.parser import parse
+from graphql.core.validation import specified_rules, validate
+from graphql.core.validation.rules import MaxDepth, ValidationRule
+from utils import default_schema
+
+garbage = '{ dog { ' + ' '.join('unknown{}'.format(i) for i in range(100)) + ' } }'
+
+
+def test_returns_every_error_by_default():
+    errors = validate(default_schema, parse(garbage))
+    assert len(errors) == 100
+
+
+def test_stops_at_max_errors():
+    ast = parse(garbage)
+    for parallel in (True, False):
+        errors = validate(default_schema, ast, parallel=parallel, max_errors=3)
+        assert [error.message for error in errors] == [
+            error.message for error in validate(default_schema, ast, parallel=parallel)[:3]
+        ]
+
+
+def test_max_errors_breaks_off_the_traversal():
+    entered = []
+
+    class CountingRule(ValidationRule):
+        def enter_Field(self, node, *args):
+            entered.append(node.name.value)
+
+    validate(default_schema, parse(garbage), [CountingRule] + specified_rules, max_errors=2)
+    assert entered == ['dog', 'unknown0', 'unknown1']
+
+
+def test_max_errors_counts_errors_in_spread_fragments():
+    ast = parse('''
+        query Q { dog { ...F } }
+        fragment F on Dog { name(a: $a, b: $b, c: $c) }
+    ''')
+    for parallel in (True, False):
+        errors = validate(default_schema, ast, parallel=parallel, max_errors=2)
+        assert len(errors) == 2
+
+
+def test_structural_rules_run_first_and_alone_when_they_fail():
+    ast = parse('''
+        query Q($unused: Int) { dog { unknown } }
+    ''')
+    errors = validate(default_schema, ast)
+    assert len(errors) == 2
+
+    errors = validate(default_schema, ast, structural_first=True)
+    assert [error.message for error in errors] == ['Cannot query field "unknown" on "Dog".']
+
+
+def test_structural_first_includes_configured_limit_rules():
+    ast = parse('query Q($unused: Int) { dog { name } }')
+    rules = [MaxDepth.with_options(max_depth=1)] + specified_rules
+    errors = validate(default_schema, ast, rules, structural_first=True)
+    assert [error.message for error in errors] == [MaxDepth.limit_exceeded_message('Q', 1)]
+
+
+def test_structural_first_finds_the_same_errors_when_structure_is_valid():
+    ast = parse('query Q($unused: Int) { dog { name } human(id: $undefined) { name } }')
+    assert [error.message for error in validate(default_schema, ast, structural_first=True)] == [
+        error.message for error in validate(default_schema, ast)
+    ]
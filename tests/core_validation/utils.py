@@ -160,8 +160,15 @@ QueryRoot = GraphQLObjectType('QueryRoot', {
 default_schema = GraphQLSchema(query=QueryRoot)
 
 
+def validate_both_ways(schema, ast, rules):
+    errors = validate(schema, ast, rules)
+    sequential_errors = validate(schema, ast, rules, parallel=False)
+    assert list(map(format_error, errors)) == list(map(format_error, sequential_errors))
+    return errors
+
+
 def expect_valid(schema, rules, query):
-    errors = validate(schema, parse(query), rules)
+    errors = validate_both_ways(schema, parse(query), rules)
     assert errors == [], 'Should validate'
 
 
@@ -177,7 +184,7 @@ def sort_lists(value):
 
 
 def expect_invalid(schema, rules, query, expected_errors, sort_list=True):
-    errors = validate(schema, parse(query), rules)
+    errors = validate_both_ways(schema, parse(query), rules)
     assert errors, 'Should not validate'
     for error in expected_errors:
         error['locations'] = [